@@ -0,0 +1,75 @@
+"""Benchmark: CPU spent on progress events, every yt-dlp callback vs. coalesced.
+
+Replays a simulated download — ``callbacks_per_second`` yt-dlp progress
+callbacks for ``seconds`` of download time, on a simulated clock so the run takes
+no wall time — through a :class:`ProgressChannel` into a job, while a subscriber
+thread follows the job the way the SSE endpoint does (JSON-encoding every
+event). Reports CPU time,
+events emitted and bytes streamed, uncoalesced vs. at ``rate`` Hz. Run from the
+repo root:
+
+    python benchmarks/bench_progress.py [seconds] [callbacks_per_second] [rate]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from youtube_downloader.gui import jobs  # noqa: E402
+from youtube_downloader.gui.progress import ProgressChannel  # noqa: E402
+
+
+class SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run(seconds: int, callbacks_per_second: int, rate: float) -> "tuple[float, int, int]":
+    """CPU seconds, events emitted and SSE bytes for one simulated download."""
+    job = jobs.create_job()
+    clock = SimulatedClock()
+    channel = ProgressChannel(job, rate, clock=clock)
+    calls = seconds * callbacks_per_second
+    total = 500 * 1024 * 1024
+    streamed = [0]
+
+    def subscriber() -> None:
+        streamed[0] = sum(len(chunk) for chunk in jobs.sse_stream(job))
+
+    start = time.process_time()
+    reader = threading.Thread(target=subscriber)
+    reader.start()
+    for call in range(calls):
+        clock.now = call / callbacks_per_second
+        downloaded = total * call // calls
+        channel.progress(
+            type='progress', percent=round(downloaded / total * 100, 1),
+            speed=1.5e6, eta=(calls - call) // callbacks_per_second,
+            index=None, job_speed=1.5e6, global_speed=1.5e6,
+        )
+    channel.status(type='progress', percent=100, stage='processing', index=None)
+    job.close()
+    reader.join()
+    return time.process_time() - start, job.last_event_id, streamed[0]
+
+
+def main() -> None:
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    callbacks_per_second = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    rate = float(sys.argv[3]) if len(sys.argv) > 3 else 4.0
+    print(f"{seconds} s download, {callbacks_per_second} callbacks/s")
+    baseline = run(seconds, callbacks_per_second, 0)
+    coalesced = run(seconds, callbacks_per_second, rate)
+    for name, (cpu, emitted, streamed) in (('every callback', baseline), (f'coalesced {rate:g} Hz', coalesced)):
+        print(f"  {name:<16} {cpu * 1000:8.1f} ms CPU  {emitted:7d} events  {streamed / 1024:8.0f} KiB streamed")
+    print(f"  CPU reduction: {baseline[0] / coalesced[0]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
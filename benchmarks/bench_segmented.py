@@ -0,0 +1,128 @@
+"""Benchmark: one connection vs. segmented range requests against a local server.
+
+Starts a throttled HTTP server on localhost that serves a random fixture file
+with ``Range`` support, then downloads it with :class:`RangeFetcher` at 1 and at
+N connections, checks every copy against the fixture, and interrupts one run
+halfway to show it resumes at segment level. Run from the repo root:
+
+    python benchmarks/bench_segmented.py [size_mib] [per_connection_kib_s] [connections]
+"""
+
+import hashlib
+import http.server
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from youtube_downloader.segmented_downloader import RangeFetcher  # noqa: E402
+
+
+class RangeHandler(http.server.BaseHTTPRequestHandler):
+    """Serves ``server.payload`` with ``Range`` support, ``server.rate`` bytes/s per connection."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args) -> None:  # keep the benchmark output readable
+        pass
+
+    def do_GET(self) -> None:
+        payload = self.server.payload
+        match = re.fullmatch(r'bytes=(\d+)-(\d*)', self.headers.get('Range', ''))
+        if match and self.server.ranges:
+            start = int(match.group(1))
+            end = int(match.group(2) or len(payload) - 1)
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(payload)}')
+        else:
+            start, end = 0, len(payload) - 1
+            self.send_response(200)
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+        try:
+            self._send_throttled(payload[start:end + 1])
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client stopped reading (e.g. the one-byte probe got a 200)
+
+    def _send_throttled(self, body: bytes) -> None:
+        chunk = 16 * 1024
+        for offset in range(0, len(body), chunk):
+            if self.server.fail_after is not None:
+                self.server.fail_after -= 1
+                if self.server.fail_after < 0:
+                    return  # drop the connection mid-transfer
+            self.wfile.write(body[offset:offset + chunk])
+            if self.server.rate:
+                time.sleep(chunk / self.server.rate)
+
+
+def start_server(payload: bytes, rate: float) -> http.server.ThreadingHTTPServer:
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), RangeHandler)
+    server.daemon_threads = True
+    server.payload = payload
+    server.rate = rate
+    server.ranges = True
+    server.fail_after = None
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def timed_fetch(fetcher: RangeFetcher, url: str, dest: str) -> float:
+    start = time.perf_counter()
+    fetcher.fetch(url, dest)
+    return time.perf_counter() - start
+
+
+def digest(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def main() -> None:
+    size_mib = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    rate_kib = int(sys.argv[2]) if len(sys.argv) > 2 else 2048
+    connections = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    payload = os.urandom(size_mib * 1024 * 1024)
+    expected = hashlib.sha256(payload).hexdigest()
+    server = start_server(payload, rate_kib * 1024)
+    url = f'http://127.0.0.1:{server.server_address[1]}/fixture.bin'
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{size_mib} MiB fixture, {rate_kib} KiB/s per connection")
+        results = {}
+        for count in (1, connections):
+            dest = os.path.join(tmp, f'{count}.bin')
+            fetcher = RangeFetcher(max_connections=count, initial_connections=min(2, count))
+            results[count] = timed_fetch(fetcher, url, dest)
+            assert digest(dest) == expected, f'{count}-connection copy is corrupt'
+            print(f"  up to {count} connection(s): {results[count]:6.2f} s")
+        print(f"  speed-up: {results[1] / results[connections]:.1f}x")
+
+        # Drop connections after a while, then retry: finished segments are kept.
+        dest = os.path.join(tmp, 'resume.bin')
+        fetcher = RangeFetcher(max_connections=connections, segment_retries=0)
+        server.fail_after = (size_mib * 1024 * 1024 // (16 * 1024)) // 2
+        try:
+            fetcher.fetch(url, dest)
+        except Exception as e:  # noqa: BLE001 - the interruption is the point
+            print(f"  interrupted run: {type(e).__name__}")
+        server.fail_after = None
+        resumed = timed_fetch(fetcher, url, dest)
+        assert digest(dest) == expected, 'resumed copy is corrupt'
+        print(f"  resumed run:               {resumed:6.2f} s (verified)")
+
+        server.ranges = False
+        dest = os.path.join(tmp, 'no-ranges.bin')
+        timed_fetch(RangeFetcher(max_connections=connections), url, dest)
+        assert digest(dest) == expected, 'single-request copy is corrupt'
+        print("  server without Range support: single request (verified)")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark: cost of idle SSE connections, threaded Flask vs. the asgi mode.
+
+Starts the GUI app on localhost in each mode, opens ``connections`` idle
+``/api/progress/<job_id>`` streams on one job, then emits one event and times
+how long it takes to reach every connection. Reports the server's thread count
+with all connections open and the fan-out time. Needs uvicorn for the asgi
+run. Run from the repo root:
+
+    python benchmarks/bench_sse_connections.py [connections]
+"""
+
+import logging
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from youtube_downloader.gui import jobs  # noqa: E402
+from youtube_downloader.gui.server import create_app  # noqa: E402
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_threaded(app, port: int):
+    from werkzeug.serving import make_server
+
+    server = make_server('127.0.0.1', port, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.shutdown
+
+
+def start_asgi(app, port: int):
+    import uvicorn
+
+    from youtube_downloader.gui.asgi import GuiAsgiApp
+
+    server = uvicorn.Server(uvicorn.Config(GuiAsgiApp(app), host='127.0.0.1', port=port,
+                                           log_level='warning', lifespan='off', backlog=4096))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    def stop() -> None:
+        server.should_exit = True
+    return stop
+
+
+def open_streams(port: int, job_id: str, count: int) -> "list[socket.socket]":
+    request = f'GET /api/progress/{job_id} HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n'.encode()
+    streams = []
+    for _ in range(count):
+        s = socket.create_connection(('127.0.0.1', port))
+        s.sendall(request)
+        streams.append(s)
+    return streams
+
+
+def wait_for(streams: "list[socket.socket]", needle: bytes, timeout: float = 60.0) -> int:
+    """Read every stream until ``needle`` shows up; the number that saw it."""
+    selector = selectors.DefaultSelector()
+    buffers = {}
+    for s in streams:
+        s.setblocking(False)
+        selector.register(s, selectors.EVENT_READ)
+        buffers[s] = b''
+    seen = 0
+    deadline = time.monotonic() + timeout
+    while seen < len(streams) and time.monotonic() < deadline:
+        for key, _ in selector.select(timeout=1):
+            s = key.fileobj
+            buffers[s] += s.recv(65536)
+            if needle in buffers[s]:
+                selector.unregister(s)
+                seen += 1
+    selector.close()
+    return seen
+
+
+def run(mode: str, count: int) -> "tuple[int, float, int]":
+    """Threads with ``count`` streams open, fan-out seconds, streams reached."""
+    app = create_app(None, None, None)
+    port = free_port()
+    baseline = threading.active_count()
+    stop = (start_asgi if mode == 'asgi' else start_threaded)(app, port)
+    job = jobs.create_job()
+    streams = open_streams(port, job.id, count)
+    time.sleep(2)  # let the server accept and park every stream
+    threads = threading.active_count() - baseline
+    start = time.monotonic()
+    job.emit(type='status', message='ping')
+    reached = wait_for(streams, b'ping')
+    elapsed = time.monotonic() - start
+    for s in streams:
+        s.close()
+    job.close()
+    stop()
+    return threads, elapsed, reached
+
+
+def main() -> None:
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)  # no per-request lines
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"{count} idle SSE connections on one job")
+    for mode in ('threaded', 'asgi'):
+        try:
+            threads, elapsed, reached = run(mode, count)
+        except ImportError as e:
+            print(f"  {mode:<9} skipped ({e})")
+            continue
+        print(f"  {mode:<9} {threads:5d} server threads  one event reached {reached}/{count} "
+              f"streams in {elapsed * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
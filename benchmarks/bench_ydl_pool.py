@@ -0,0 +1,52 @@
+"""Benchmark: building a fresh ``YoutubeDL`` per call vs. the shared pool.
+
+Measures only the setup cost the pool removes (extractor registration, cookie
+jar, HTTP handlers) — no network access is made. Run from the repo root:
+
+    python benchmarks/bench_ydl_pool.py [calls]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yt_dlp  # noqa: E402
+
+from youtube_downloader.downloader import YtDlpDownloader  # noqa: E402
+from youtube_downloader.ytdlp_pool import YoutubeDLPool  # noqa: E402
+
+
+def per_call(options: dict, calls: int) -> float:
+    start = time.perf_counter()
+    for index in range(calls):
+        with yt_dlp.YoutubeDL({**options, 'outtmpl': f'/tmp/{index}.%(ext)s'}):
+            pass
+    return time.perf_counter() - start
+
+
+def pooled(options: dict, calls: int) -> float:
+    pool = YoutubeDLPool()
+    start = time.perf_counter()
+    for index in range(calls):
+        with pool.acquire(options, outtmpl=f'/tmp/{index}.%(ext)s', progress_hook=print):
+            pass
+    elapsed = time.perf_counter() - start
+    pool.close()
+    return elapsed
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    options = YtDlpDownloader._ydl_opts()
+    fresh = per_call(options, calls)
+    reused = pooled(options, calls)
+    print(f"{calls} calls")
+    print(f"  fresh YoutubeDL per call: {fresh * 1000:8.1f} ms total, {fresh / calls * 1000:6.2f} ms/call")
+    print(f"  pooled YoutubeDL:         {reused * 1000:8.1f} ms total, {reused / calls * 1000:6.2f} ms/call")
+    print(f"  speed-up: {fresh / reused:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,8 +2,20 @@
 
 By default the web GUI is launched (Flask server + browser). Pass
 ``--console-view`` (or the bare token ``console-view``) to run the interactive
-console instead. Concrete services are chosen only here; both front-ends depend
-solely on the abstract interfaces (dependency inversion).
+console instead, and ``--no-cache`` to bypass the on-disk metadata cache.
+
+``--headless [--host <address>] [--port <n>]`` serves the GUI without opening
+a browser, on a production server (waitress unless ``gui_server`` is ``asgi``),
+and lets running downloads finish on Ctrl+C / SIGTERM — for a shared machine
+reached over the network.
+
+``--sync <playlist_url> <folder> [--numerate] [--subtitles <lang>] [--parallel <n>]
+[--profile <360p|720p|1080p|best|audio>]`` runs a non-interactive incremental sync
+(only videos added since the last sync are downloaded) and exits with status 1
+if any video failed — suitable for cron / Task Scheduler.
+
+Concrete services are chosen only here; both front-ends depend solely on the
+abstract interfaces (dependency inversion).
 """
 
 import logging
@@ -11,57 +23,150 @@ import sys
 
 from youtube_downloader.chapters import FfmpegChapterSplitter
 from youtube_downloader.cli import ConsoleApp
+from youtube_downloader.download_archive import DownloadArchive
 from youtube_downloader.downloader import YtDlpDownloader
+from youtube_downloader.format_profiles import DEFAULT_PROFILE
+from youtube_downloader.info_cache import CachingInfoProvider, InfoCache
 from youtube_downloader.info_service import YtDlpInfoProvider
 from youtube_downloader.logging_config import setup_logging
 from youtube_downloader.metadata import get_metadata
+from youtube_downloader.segmented_downloader import SegmentedHttpDownloader
+from youtube_downloader.settings import get_settings
 from youtube_downloader.subtitles import TranscriptApiSubtitleService
 from youtube_downloader.workflows import DownloadWorkflows
 
 CONSOLE_FLAGS = {"--console-view", "console-view"}
+NO_CACHE_FLAG = "--no-cache"
+SYNC_FLAG = "--sync"
+HEADLESS_FLAG = "--headless"
+USAGE = """usage: python main.py [--console-view] [--no-cache]
+       python main.py --headless [--host <address>] [--port <n>]
+       python main.py --sync <playlist_url> <folder> [--numerate] [--subtitles <lang>]
+                      [--parallel <n>] [--profile <360p|720p|1080p|best|audio>]"""
+
+
+def _flag_values(args: "list[str]", flag: str, count: int = 1) -> "list[str] | None":
+    """The ``count`` values following ``flag`` in ``args`` (``None`` if absent)."""
+    if flag not in args:
+        return None
+    start = args.index(flag) + 1
+    values = args[start:start + count]
+    if len(values) < count or any(v.startswith('--') for v in values):
+        raise SystemExit(f"{flag} expects {count} value(s)\n\n{USAGE}")
+    return values
+
+
+def _int_flag(args: "list[str]", flag: str, minimum: int, maximum: "int | None" = None) -> "int | None":
+    """The whole number following ``flag`` (``None`` if absent); exits with the usage if invalid."""
+    values = _flag_values(args, flag)
+    if values is None:
+        return None
+    try:
+        value = int(values[0])
+    except ValueError:
+        value = None
+    if value is None or value < minimum or (maximum is not None and value > maximum):
+        allowed = f"from {minimum} to {maximum}" if maximum is not None else f"of at least {minimum}"
+        raise SystemExit(f"{flag} expects a whole number {allowed}, got {values[0]!r}\n\n{USAGE}")
+    return value
 
 
 def _log_level() -> int:
     """Resolve the log level from metadata.json settings (default INFO)."""
-    name = (get_metadata().get('settings', {}) or {}).get('log_level', 'INFO')
-    return getattr(logging, str(name).upper(), logging.INFO)
+    return getattr(logging, get_settings().log_level.upper(), logging.INFO)
+
+
+def build_info_provider(bypass_cache: bool = False):
+    """The yt-dlp info provider, wrapped in the on-disk cache unless disabled."""
+    provider = YtDlpInfoProvider()
+    provider.prewarm()
+    settings = get_settings()
+    if not settings.use_info_cache:
+        return provider
+    cache = InfoCache(
+        video_ttl=settings.info_cache_video_ttl_hours * 3600,
+        playlist_ttl=settings.info_cache_playlist_ttl_hours * 3600,
+        max_bytes=int(settings.info_cache_max_mb * 1024 * 1024),
+    )
+    return CachingInfoProvider(provider, cache, bypass=bypass_cache)
 
 
-def build_services():
+def build_downloader():
+    """The video downloader selected by ``settings.downloader_backend``."""
+    backend = get_settings().downloader_backend
+    if backend == 'segmented':
+        return SegmentedHttpDownloader()
+    if backend != 'yt-dlp':
+        logging.getLogger('youtube_downloader.main').warning("Unknown downloader_backend %r; using yt-dlp", backend)
+    return YtDlpDownloader()
+
+
+def build_services(bypass_cache: bool = False):
     """Construct the concrete services and the shared workflow layer."""
-    info_provider = YtDlpInfoProvider()
+    info_provider = build_info_provider(bypass_cache)
     subtitle_service = TranscriptApiSubtitleService()
+    downloader = build_downloader()
+    downloader.prewarm()
+    settings = get_settings()
+    archive = (
+        DownloadArchive(verify=settings.verify_download_archive)
+        if settings.use_download_archive else None
+    )
     workflows = DownloadWorkflows(
-        downloader=YtDlpDownloader(),
+        downloader=downloader,
         subtitle_service=subtitle_service,
         chapter_splitter=FfmpegChapterSplitter(),
+        info_provider=info_provider,
+        archive=archive,
     )
     return info_provider, subtitle_service, workflows
 
 
-def build_console_app() -> ConsoleApp:
+def build_console_app(bypass_cache: bool = False) -> ConsoleApp:
     """Wire the shared services into the interactive console app."""
-    info_provider, subtitle_service, workflows = build_services()
+    info_provider, subtitle_service, workflows = build_services(bypass_cache)
     return ConsoleApp(info_provider, subtitle_service, workflows)
 
 
 def main(argv: "list[str] | None" = None) -> None:
     args = sys.argv[1:] if argv is None else argv
-    console_mode = bool(CONSOLE_FLAGS & set(args))
+    sync_args = _flag_values(args, SYNC_FLAG, 2)
+    console_mode = bool(CONSOLE_FLAGS & set(args)) or sync_args is not None
+    bypass_cache = NO_CACHE_FLAG in args
     # Console app keeps logs out of the interactive menu (file only); GUI logs to
     # both its terminal and the file.
     setup_logging(to_console=not console_mode, level=_log_level())
     logger = logging.getLogger('youtube_downloader.main')
     logger.info("Starting %s in %s mode", get_metadata().get('name', 'app'),
-                'console' if console_mode else 'GUI')
-
-    if console_mode:
-        build_console_app().run()
+                'console' if console_mode else 'headless' if HEADLESS_FLAG in args else 'GUI')
+
+    if sync_args is not None:
+        playlist_url, folder_path = sync_args
+        subtitles = _flag_values(args, "--subtitles")
+        parallel = _int_flag(args, "--parallel", 1)
+        profile = _flag_values(args, "--profile")
+        ok = build_console_app(bypass_cache).sync_playlist(
+            playlist_url, folder_path,
+            numerate="--numerate" in args,
+            subtitle_language=subtitles[0] if subtitles else None,
+            parallel_downloads=parallel,
+            format_profile=profile[0] if profile else DEFAULT_PROFILE,
+        )
+        sys.exit(0 if ok else 1)
+    elif console_mode:
+        build_console_app(bypass_cache).run()
     else:
         # Imported lazily so the console mode doesn't require Flask installed.
         from youtube_downloader.gui.server import run_gui
 
-        run_gui(*build_services())
+        host = _flag_values(args, "--host")
+        port = _int_flag(args, "--port", 0, 65535)
+        run_gui(
+            *build_services(bypass_cache),
+            headless=HEADLESS_FLAG in args,
+            host=host[0] if host else None,
+            port=port,
+        )
 
 
 if __name__ == '__main__':
@@ -24,8 +24,9 @@ binaries = []
 hiddenimports = []
 
 # yt_dlp: lazily-imported extractors. imageio_ffmpeg: the bundled ffmpeg binary.
-# certifi: CA bundle for yt-dlp's HTTPS requests.
-for _pkg in ('yt_dlp', 'imageio_ffmpeg', 'certifi'):
+# certifi: CA bundle for yt-dlp's HTTPS requests. uvicorn: loop / protocol
+# implementations it imports by name (the "asgi" GUI server).
+for _pkg in ('yt_dlp', 'imageio_ffmpeg', 'certifi', 'uvicorn'):
     _d, _b, _h = collect_all(_pkg)
     datas += _d
     binaries += _b
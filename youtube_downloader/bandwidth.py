@@ -0,0 +1,192 @@
+"""Process-wide download bandwidth limiting.
+
+Every download in the process reports its bytes to one :class:`BandwidthLimiter`
+(:data:`default_limiter`). It owns a global token bucket — when several jobs run
+at once they share that cap instead of each one saturating the uplink — plus the
+default cap for a single job. The limiter throttles from the yt-dlp progress
+hook: the hook runs on the downloading thread after every chunk, so sleeping
+there until the bucket has enough tokens slows the transfer itself down.
+
+Caps are in KiB/s (``0`` = unlimited). They come from the ``max_download_rate_kbps``
+and ``max_job_download_rate_kbps`` settings and can be changed at runtime with
+:meth:`BandwidthLimiter.set_limits` (the GUI's ``/api/bandwidth``); whichever
+changed last wins.
+"""
+
+import collections
+import logging
+import threading
+import time
+
+from .settings import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+KIB = 1024
+
+# Window (seconds) over which throughput is averaged for progress reports.
+_METER_WINDOW = 3.0
+
+
+class TokenBucket:
+    """A thread-safe token bucket measured in bytes.
+
+    ``rate`` is bytes/second (``0`` disables limiting); up to ``burst_seconds``
+    worth of tokens accumulate while idle. :meth:`consume` may overdraw the
+    bucket — a large chunk is let through and the *next* caller waits off the
+    debt — so a chunk bigger than the burst never deadlocks.
+    """
+
+    def __init__(self, rate: float = 0.0, burst_seconds: float = 1.0) -> None:
+        self.burst_seconds = burst_seconds
+        self._lock = threading.Lock()
+        self._rate = 0.0
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self.set_rate(rate)
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._rate = max(0.0, float(rate))
+            self._tokens = min(self._tokens, self._rate * self.burst_seconds)
+            self._updated = time.monotonic()
+
+    def consume(self, amount: int) -> float:
+        """Take ``amount`` tokens, sleeping while in debt; return the seconds slept."""
+        with self._lock:
+            if not self._rate:
+                return 0.0
+            now = time.monotonic()
+            capacity = self._rate * self.burst_seconds
+            self._tokens = min(capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= amount
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class ThroughputMeter:
+    """Bytes/second over a short sliding window."""
+
+    def __init__(self, window: float = _METER_WINDOW) -> None:
+        self.window = window
+        self._samples: "collections.deque[tuple[float, int]]" = collections.deque()
+        self._lock = threading.Lock()
+
+    def add(self, amount: int) -> None:
+        with self._lock:
+            self._samples.append((time.monotonic(), amount))
+
+    def rate(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            while self._samples and now - self._samples[0][0] > self.window:
+                self._samples.popleft()
+            return sum(amount for _, amount in self._samples) / self.window
+
+
+class JobBandwidth:
+    """Per-job cap and throughput; follows the limiter's per-job rate."""
+
+    def __init__(self, limiter: "BandwidthLimiter") -> None:
+        self.limiter = limiter
+        self.bucket = TokenBucket(limiter.per_job_rate)
+        self.meter = ThroughputMeter()
+
+    def throttle(self, amount: int) -> None:
+        if self.bucket.rate != self.limiter.per_job_rate:
+            self.bucket.set_rate(self.limiter.per_job_rate)
+        self.bucket.consume(amount)
+        self.meter.add(amount)
+
+
+class BandwidthLimiter:
+    """The global bucket and meter, and the default per-job rate (bytes/s)."""
+
+    def __init__(self) -> None:
+        self.global_bucket = TokenBucket()
+        self.global_meter = ThroughputMeter()
+        self.per_job_rate = 0.0
+        self._settings: "Settings | None" = None
+
+    def refresh(self) -> None:
+        """Apply the settings' caps if ``metadata.json`` changed since last time."""
+        settings = get_settings()
+        if settings is self._settings:
+            return
+        previous, self._settings = self._settings, settings
+        if previous is not None and (
+            previous.max_download_rate_kbps == settings.max_download_rate_kbps
+            and previous.max_job_download_rate_kbps == settings.max_job_download_rate_kbps
+        ):
+            return  # unrelated setting changed; keep any runtime override
+        self._apply(settings.max_download_rate_kbps, settings.max_job_download_rate_kbps)
+
+    def set_limits(self, global_kbps: "float | None" = None, per_job_kbps: "float | None" = None) -> None:
+        """Change the caps at runtime (``None`` leaves that cap unchanged)."""
+        self.refresh()
+        self._apply(
+            self.global_bucket.rate / KIB if global_kbps is None else global_kbps,
+            self.per_job_rate / KIB if per_job_kbps is None else per_job_kbps,
+        )
+
+    def _apply(self, global_kbps: float, per_job_kbps: float) -> None:
+        self.global_bucket.set_rate(max(0.0, global_kbps) * KIB)
+        self.per_job_rate = max(0.0, per_job_kbps) * KIB
+        logger.info("Bandwidth limits: global %s, per job %s",
+                    _describe(global_kbps), _describe(per_job_kbps))
+
+    def limits(self) -> dict:
+        """Current caps (KiB/s, ``0`` = unlimited) and global throughput (bytes/s)."""
+        self.refresh()
+        return {
+            'global_kbps': self.global_bucket.rate / KIB,
+            'per_job_kbps': self.per_job_rate / KIB,
+            'global_speed': self.global_meter.rate(),
+        }
+
+    def throttle(self, amount: int) -> None:
+        self.refresh()
+        self.global_bucket.consume(amount)
+        self.global_meter.add(amount)
+
+    def wrap_hook(self, progress_hook=None):
+        """A progress hook that throttles each chunk, then calls ``progress_hook``.
+
+        The forwarded dict gains ``chunk_bytes`` (bytes since the previous call
+        for this file) and ``global_speed`` (process-wide bytes/s), so a per-job
+        hook can apply its own cap and report both rates.
+        """
+        last_bytes: "dict[str, int]" = {}
+
+        def hook(d: dict) -> None:
+            if d.get('status') == 'downloading':
+                name = d.get('tmpfilename') or d.get('filename') or ''
+                downloaded = d.get('downloaded_bytes') or 0
+                # The first report of a resumed file includes the bytes already on
+                # disk, so only count growth from there. Segment workers may report
+                # slightly out of order; never step back.
+                previous = last_bytes.get(name, downloaded)
+                chunk = max(0, downloaded - previous)
+                last_bytes[name] = max(previous, downloaded)
+                self.throttle(chunk)
+                d['chunk_bytes'] = chunk
+                d['global_speed'] = self.global_meter.rate()
+            if progress_hook is not None:
+                progress_hook(d)
+
+        return hook
+
+
+def _describe(kbps: float) -> str:
+    return f'{kbps:g} KiB/s' if kbps > 0 else 'unlimited'
+
+
+# Shared by every download in the process.
+default_limiter = BandwidthLimiter()
@@ -0,0 +1,98 @@
+"""Cooperative cancellation of running downloads.
+
+A :class:`CancelToken` is handed down from whoever may want to stop the work
+(the GUI's Cancel button) to the code doing it. The work checks the token at
+safe points — between playlist videos, between retry attempts, and in the
+download progress hook after every chunk — and raises :class:`Cancelled`.
+Blocking work that can't check (an ffmpeg subprocess) registers a callback
+instead, which :meth:`CancelToken.cancel` runs to kill it.
+
+:class:`Cancelled` subclasses yt-dlp's ``DownloadCancelled``, the exception
+yt-dlp itself lets propagate out of a progress hook to abort a download.
+"""
+
+import logging
+import threading
+
+from yt_dlp.utils import DownloadCancelled
+
+logger = logging.getLogger(__name__)
+
+
+class Cancelled(DownloadCancelled):
+    """The work was cancelled through its :class:`CancelToken`."""
+
+    msg = 'Cancelled'
+
+
+class CancelToken:
+    """A thread-safe, one-way cancel flag with kill callbacks."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._callbacks: "dict[int, object]" = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Set the flag and run every registered callback (once)."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = list(self._callbacks.values()), {}
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:  # noqa: BLE001 - one failing callback must not stop the rest
+                logger.warning("Cancel callback failed: %s", e)
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise Cancelled()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to ``timeout`` seconds, waking early on cancel; True if cancelled."""
+        return self._event.wait(timeout)
+
+    def on_cancel(self, callback) -> "callable":
+        """Run ``callback`` on cancel (at once if already cancelled); returns an unregister function."""
+        with self._lock:
+            if not self._event.is_set():
+                key = self._next_id
+                self._next_id += 1
+                self._callbacks[key] = callback
+                return lambda: self._unregister(key)
+        callback()
+        return lambda: None
+
+    def _unregister(self, key: int) -> None:
+        with self._lock:
+            self._callbacks.pop(key, None)
+
+
+def raise_if_cancelled(token: "CancelToken | None") -> None:
+    """:meth:`CancelToken.raise_if_cancelled` for an optional token."""
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def cancellable_hook(progress_hook, token: "CancelToken | None"):
+    """A progress hook that raises :class:`Cancelled` once ``token`` is cancelled.
+
+    yt-dlp calls its progress hooks after every chunk, so this stops a running
+    transfer within one chunk. Returns ``progress_hook`` unchanged without a token.
+    """
+    if token is None:
+        return progress_hook
+
+    def hook(d: dict) -> None:
+        token.raise_if_cancelled()
+        if progress_hook is not None:
+            progress_hook(d)
+
+    return hook
@@ -6,38 +6,64 @@ import subprocess
 
 from pysrt import SubRipFile, SubRipItem
 
-from .ffmpeg_support import ffmpeg_location
+from .cancellation import CancelToken, Cancelled
 from .interfaces import ChapterSplitter
 from .models import Chapter
+from .settings import get_settings
 from .utils import clean_filename, format_counter, seconds_to_srt_time
 
 logger = logging.getLogger(__name__)
 
 
 class FfmpegChapterSplitter(ChapterSplitter):
-    """Splits video with ffmpeg and subtitles with pysrt, one file per chapter."""
+    """Splits video with ffmpeg and subtitles with pysrt, one file per chapter.
+
+    Chapter files keep the input's container (``.mp4``, or ``.m4a`` / ``.webm``
+    for audio-only downloads), since the streams are copied, not re-encoded.
+    """
 
     def split_video(
-        self, video_path: str, chapters: list[Chapter], output_path: str
+        self, video_path: str, chapters: list[Chapter], output_path: str,
+        cancel_token: "CancelToken | None" = None,
     ) -> None:
         logger.info("Splitting video into %d chapters -> %s", len(chapters), output_path)
+        extension = os.path.splitext(video_path)[1] or '.mp4'
         index = 1
         for chapter in chapters:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
             start_time = chapter.start_time
             end_time = chapter.end_time
             chapter_title = clean_filename(chapter.title)
             video_index = format_counter(index, len(chapters))
-            chapter_file = os.path.join(output_path, f"{video_index}{chapter_title}.mp4")
+            chapter_file = os.path.join(output_path, f"{video_index}{chapter_title}{extension}")
             command = [
-                ffmpeg_location(), '-i', video_path,
+                get_settings().ffmpeg_path, '-i', video_path,
                 '-ss', str(start_time), '-to', str(end_time),
                 '-c', 'copy', chapter_file
             ]
             logger.debug("Chapter %d/%d -> %s", index, len(chapters), chapter_file)
-            subprocess.run(command)
+            self._run_ffmpeg(command, chapter_file, cancel_token)
             index += 1
         logger.info("Finished splitting video into %d chapters", len(chapters))
 
+    @staticmethod
+    def _run_ffmpeg(command: "list[str]", chapter_file: str, cancel_token: "CancelToken | None") -> None:
+        """Run one ffmpeg cut; on cancel kill it, drop the half-written chapter and raise."""
+        if cancel_token is None:
+            subprocess.run(command)
+            return
+        proc = subprocess.Popen(command)
+        unregister = cancel_token.on_cancel(proc.kill)
+        try:
+            proc.wait()
+        finally:
+            unregister()
+        if cancel_token.cancelled:
+            if os.path.exists(chapter_file):
+                os.remove(chapter_file)
+            raise Cancelled()
+
     def split_subtitles(
         self, subtitle_path: str, chapters: list[Chapter], output_path: str
     ) -> None:
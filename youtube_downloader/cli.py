@@ -7,10 +7,13 @@ on abstractions, never on the concrete yt-dlp / transcript-api / ffmpeg classes.
 
 import logging
 
+from .disk_space import InsufficientDiskSpace
 from .filesystem import clear_console, open_folder
+from .format_profiles import DEFAULT_PROFILE, PROFILES, estimate_video_size, observed_bytes_per_second
 from .interfaces import InfoProvider, SubtitleService
 from .metadata import get_metadata
 from .models import Chapter, PlaylistDownloadOptions, PlaylistInfo, VideoDownloadOptions
+from .settings import get_settings
 from .update_checker import check_for_update
 from .utils import clean_filename, format_video_length
 from .workflows import DownloadWorkflows
@@ -61,11 +64,31 @@ class ConsoleApp:
             return transcript_list[subtitle_choise - 1]
         return None
 
+    def _ask_format_profile(self, videos: "list | None") -> str:
+        """Ask for a format profile, showing each one's estimated size for ``videos``.
+
+        ``videos=None`` (nothing known yet, e.g. before a sync) shows no sizes.
+        """
+        names = list(PROFILES)
+        print("\nChoose quality: ")
+        for number, name in enumerate(names, start=1):
+            if videos is None:
+                print(f"{number} - {PROFILES[name].label}")
+                continue
+            rate = observed_bytes_per_second(videos, name)
+            size = sum(estimate_video_size(video, name, rate) for video in videos)
+            print(f"{number} - {PROFILES[name].label}  (~{size / 1e6:,.0f} MB)")
+        choice = input(f"Your Choice (Enter = {PROFILES[DEFAULT_PROFILE].label}) = ").strip()
+        try:
+            return names[int(choice) - 1] if choice else DEFAULT_PROFILE
+        except (ValueError, IndexError):
+            return DEFAULT_PROFILE
+
     # ------------------------------------------------------------------ #
     # Video flow
     # ------------------------------------------------------------------ #
     def video_processes(self, video_url: str) -> None:
-        info = self.info_provider.get_video_info(video_url)
+        info = self.info_provider.get_video_info(video_url, for_download=True)
         info.transcript_list = self.subtitle_service.list_available(info.id)
 
         print('           ', end='\r')
@@ -83,6 +106,7 @@ class ConsoleApp:
         download_choice = input("\nDownload Video: Y or N ?  ")
         if download_choice == 'Y' or download_choice == 'y':
             subtitle_choise = self.print_subtitles(info.transcript_list)
+            format_profile = self._ask_format_profile([info])
             folder_path = input("\nPlease enter the path to the folder where you want to save: ")
 
             create_video_folder = input("\nSplit video to chapters if exist: Y or N ?  ")
@@ -93,8 +117,13 @@ class ConsoleApp:
                 save_path=folder_path,
                 subtitle_language=self._language_for_choice(info.transcript_list, subtitle_choise),
                 split_chapters=split_chapters,
+                format_profile=format_profile,
             )
-            result = self.workflows.download_video(info, options)
+            try:
+                result = self.workflows.download_video(info, options)
+            except InsufficientDiskSpace as e:
+                print(f"\n{e}\n")
+                return
 
             print("\nDownload Finished\n\n")
             open_folder(result.output_path)
@@ -110,8 +139,19 @@ class ConsoleApp:
                 return list_lang
         return []
 
+    def _ask_parallel_downloads(self) -> int:
+        """Ask how many playlist videos to download at once (Enter keeps the setting)."""
+        default = get_settings().playlist_download_workers
+        choice = input(f"\nHow many videos to download at once? (Enter = {default}): ").strip()
+        try:
+            return max(1, int(choice)) if choice else default
+        except ValueError:
+            return default
+
     def playlist_processes(self, playlist_url: str) -> None:
-        info = self.info_provider.get_playlist_info(playlist_url)
+        info = self.info_provider.get_playlist_info(
+            playlist_url, lazy=get_settings().lazy_playlists
+        )
         info.transcript_list = self._resolve_playlist_subtitles(info)
 
         print('           ', end='\r')
@@ -121,28 +161,41 @@ class ConsoleApp:
         print(f"Number of Videos: {info.number_videos}")
         print(f"Total Duration: {info.length}")
         if len(info.transcript_list) > 0: print(f"Playlist has subtitles: {info.transcript_list}")
+        if info.failed_entries:
+            print(f"{len(info.failed_entries)} video(s) could not be loaded; downloading retries them:")
+            for failed in info.failed_entries:
+                print(f"    {failed}")
 
         download_choice = input("\nDownload Playlist: Y or N ?  ")
         if download_choice == 'Y' or download_choice == 'y':
             subtitle_choise = self.print_subtitles(info.transcript_list)
+            format_profile = self._ask_format_profile(info.videos_info)
 
             numerate_choice = input("\nNumerated Playlist: Y or N ?  ")
             numerate = numerate_choice in ('y', 'Y')
 
             folder_path = input("\nPlease enter the path to the folder where you want to save: ")
 
+            parallel = self._ask_parallel_downloads()
+
             print("\nStart Downloading ... \n")
 
             options = PlaylistDownloadOptions(
                 save_path=folder_path,
                 subtitle_language=self._language_for_choice(info.transcript_list, subtitle_choise),
                 numerate=numerate,
+                parallel_downloads=parallel,
+                format_profile=format_profile,
             )
 
             def on_video(index: int, total: int, title: str) -> None:
                 print(f"\n[{index}/{total}] Downloading: {title}\n")
 
-            result = self.workflows.download_playlist(info, options, on_video=on_video)
+            try:
+                result = self.workflows.download_playlist(info, options, on_video=on_video)
+            except InsufficientDiskSpace as e:
+                print(f"\n{e}\n")
+                return
 
             print("\nDownload Finished\n")
             if result.failed_videos:
@@ -154,6 +207,57 @@ class ConsoleApp:
                 print("\n")
             open_folder(result.output_path)
 
+    # ------------------------------------------------------------------ #
+    # Sync flow (also used non-interactively by ``main.py --sync``)
+    # ------------------------------------------------------------------ #
+    def sync_playlist(
+        self,
+        playlist_url: str,
+        folder_path: str,
+        numerate: bool = False,
+        subtitle_language: "str | None" = None,
+        parallel_downloads: "int | None" = None,
+        format_profile: str = DEFAULT_PROFILE,
+    ) -> bool:
+        """Download only the videos added since the last sync; True if none failed."""
+        # A cached listing could predate the videos this sync is meant to find.
+        self.info_provider.invalidate(playlist_url)
+        info = self.info_provider.get_playlist_info(playlist_url, lazy=True)
+        options = PlaylistDownloadOptions(
+            save_path=folder_path,
+            subtitle_language=subtitle_language,
+            numerate=numerate,
+            parallel_downloads=parallel_downloads,
+            format_profile=format_profile,
+        )
+
+        def on_video(index: int, total: int, title: str) -> None:
+            print(f"\n[{index}/{total}] New video: {title}\n")
+
+        try:
+            result = self.workflows.sync_playlist(info, options, on_video=on_video)
+        except InsufficientDiskSpace as e:
+            print(f"\nSync refused: {e}")
+            return False
+        print(f"\nSync finished: {len(result.new_videos)} new video(s) downloaded "
+              f"into {result.output_path}")
+        for failed in result.failed_videos:
+            print(f"    failed: {failed}")
+        return not result.failed_videos
+
+    def sync_processes(self, playlist_url: str) -> None:
+        # The new videos aren't known before the sync, so there is no subtitle
+        # list or size estimate to show: ask for a language code instead.
+        subtitle_language = input("\nSubtitle language code (e.g. en; Enter = none): ").strip() or None
+        format_profile = self._ask_format_profile(None)
+        numerate_choice = input("\nNumerated Playlist: Y or N ?  ")
+        folder_path = input("\nPlease enter the path to the folder where you want to save: ")
+        parallel = self._ask_parallel_downloads()
+        print("\nChecking for new videos ... \n")
+        self.sync_playlist(playlist_url, folder_path, numerate=numerate_choice in ('y', 'Y'),
+                           subtitle_language=subtitle_language, parallel_downloads=parallel,
+                           format_profile=format_profile)
+
     # ------------------------------------------------------------------ #
     # Menu loop
     # ------------------------------------------------------------------ #
@@ -174,7 +278,10 @@ class ConsoleApp:
             meta = get_metadata()
             developer = meta.get('author', {}).get('name', '')
             print(f"\nWelcome to {meta.get('name', 'Youtube Downloader')} v{meta.get('version', '0.0.0')} 😊 developed by {developer} \n")
-            download_type = int(input("Please choose number: \n1 - Video \n2 - Playlist \n3 - Quit 👋\nYou choice is: "))
+            download_type = int(input(
+                "Please choose number: \n1 - Video \n2 - Playlist \n"
+                "3 - Sync playlist (new videos only) \n4 - Quit 👋\nYou choice is: "
+            ))
             logger.info("Console menu choice: %s", download_type)
             if download_type == 1:
                 video_url = input("\nPlease enter the link of youtube video: ")
@@ -186,6 +293,9 @@ class ConsoleApp:
                 print('\n')
                 print('Waiting ...', end='\r')
                 self.playlist_processes(playlist_url)
+            elif download_type == 3:
+                playlist_url = input("\nPlease enter the link of youtube playlist: ")
+                self.sync_processes(playlist_url)
             else:
                 break
 
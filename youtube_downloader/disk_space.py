@@ -0,0 +1,139 @@
+"""Disk-space preflight: estimate what a run needs before downloading anything.
+
+A playlist that fills the disk used to fail hours in, leaving ``.part`` files
+behind. :func:`plan_downloads` adds up the expected size of every video still to
+download (see :func:`~youtube_downloader.format_profiles.estimate_video_size`),
+plus the room the pipeline needs on top of the final files:
+
+* **merge** — video and audio streams are downloaded separately and muxed into
+  a new file, so while the ``parallel`` largest videos are merging their streams
+  and the merged output exist side by side;
+* **chapter split** — split chapters are copies of the video (same total size);
+* a fixed ``reserve`` so the disk is never filled to the last byte.
+
+The total is compared with the free space on ``save_path``. Depending on the
+``disk_space_check`` setting the run is refused on a shortfall (``refuse``, the
+default), trimmed to the videos that fit, in playlist order (``fit``), only
+logged (``warn``), or nothing is checked (``off``). Sizes of unresolved lazy
+playlist videos are estimates from their duration (see
+:func:`~youtube_downloader.format_profiles.observed_bytes_per_second`).
+"""
+
+import logging
+import os
+import shutil
+from dataclasses import dataclass, field
+
+from .format_profiles import get_profile
+
+logger = logging.getLogger(__name__)
+
+WARN = 'warn'
+REFUSE = 'refuse'
+FIT = 'fit'
+OFF = 'off'
+
+
+class InsufficientDiskSpace(Exception):
+    """The download needs more space than ``save_path`` has free."""
+
+    def __init__(self, required: int, free: int, path: str) -> None:
+        super().__init__(
+            f"Not enough disk space in {path}: about {required / 1e6:,.0f} MB needed, "
+            f"{free / 1e6:,.0f} MB free"
+        )
+        self.required = required
+        self.free = free
+        self.path = path
+
+
+@dataclass
+class DownloadPlan:
+    """Outcome of a preflight check.
+
+    ``accepted`` / ``rejected`` are the keys of the videos that will / won't be
+    downloaded (``rejected`` is only ever non-empty in ``fit`` mode);
+    ``required_bytes`` is the estimated need of the accepted videos including
+    overhead, ``free_bytes`` the space available (``None`` when unchecked).
+    """
+
+    accepted: list = field(default_factory=list)
+    rejected: list = field(default_factory=list)
+    required_bytes: int = 0
+    free_bytes: "int | None" = None
+
+
+def free_bytes(path: str) -> int:
+    """Free space on the filesystem that holds ``path`` (which may not exist yet)."""
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return shutil.disk_usage(path).free
+
+
+def required_bytes(
+    sizes: "list[int]",
+    format_profile: str,
+    parallel: int = 1,
+    split_chapters: bool = False,
+    reserve: int = 0,
+) -> int:
+    """Bytes needed on disk to download files of ``sizes`` (see module docstring)."""
+    total = sum(sizes)
+    if not get_profile(format_profile).audio_only:
+        total += sum(sorted(sizes, reverse=True)[:max(1, parallel)])
+    if split_chapters:
+        total += sum(sizes)
+    return total + reserve
+
+
+def plan_downloads(
+    sizes: "dict",
+    save_path: str,
+    format_profile: str,
+    mode: str = REFUSE,
+    parallel: int = 1,
+    split_chapters: bool = False,
+    reserve: int = 0,
+) -> DownloadPlan:
+    """Check ``sizes`` (key -> expected bytes, in download order) against free space.
+
+    Raises :class:`InsufficientDiskSpace` in ``refuse`` mode — and in ``fit``
+    mode when not even one video fits. ``warn`` mode logs the shortfall and
+    accepts everything.
+    """
+    keys = list(sizes)
+    needed = required_bytes(list(sizes.values()), format_profile, parallel, split_chapters, reserve)
+    if mode == OFF or not keys:
+        return DownloadPlan(accepted=keys, required_bytes=needed)
+    free = free_bytes(save_path)
+    if needed <= free:
+        logger.info("Disk space preflight: ~%d MB needed, %d MB free in %s",
+                    needed // 1_000_000, free // 1_000_000, save_path)
+        return DownloadPlan(accepted=keys, required_bytes=needed, free_bytes=free)
+    if mode == WARN:
+        logger.warning("Disk space preflight: ~%d MB estimated, only %d MB free in %s; downloading anyway",
+                       needed // 1_000_000, free // 1_000_000, save_path)
+        return DownloadPlan(accepted=keys, required_bytes=needed, free_bytes=free)
+    if mode != FIT:
+        raise InsufficientDiskSpace(needed, free, save_path)
+
+    # Greedy in download order: skip a video that doesn't fit, keep trying
+    # the (possibly smaller) ones after it.
+    plan = DownloadPlan(free_bytes=free)
+    for key in keys:
+        candidate = [sizes[k] for k in plan.accepted] + [sizes[key]]
+        cost = required_bytes(candidate, format_profile, parallel, split_chapters, reserve)
+        if cost <= free:
+            plan.accepted.append(key)
+            plan.required_bytes = cost
+        else:
+            plan.rejected.append(key)
+    if not plan.accepted:
+        raise InsufficientDiskSpace(needed, free, save_path)
+    logger.warning("Disk space preflight: ~%d MB needed, %d MB free in %s; downloading %d of %d videos",
+                   needed // 1_000_000, free // 1_000_000, save_path, len(plan.accepted), len(keys))
+    return plan
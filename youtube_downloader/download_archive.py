@@ -0,0 +1,104 @@
+"""Persistent index of completed downloads.
+
+Re-running a playlist used to send every video through a yt-dlp extraction
+before yt-dlp noticed the file was already on disk. :class:`DownloadArchive`
+records each successful download — video id, output file and format — in a small
+SQLite database under :func:`~youtube_downloader.paths.writable_dir`, and
+:class:`~youtube_downloader.workflows.DownloadWorkflows` consults it before
+touching the network, so a re-run only extracts the videos that are missing.
+
+A hit is looked up by video id and output file only. Every video profile
+writes the same ``<title>.mp4``, so a file downloaded in one profile is what
+another profile would find on disk (and yt-dlp would skip it just the same);
+the recorded format is informational.
+
+With ``verify=True`` (the ``verify_download_archive`` setting) a hit also checks
+that the archived file still exists with the recorded size; a file that was
+deleted or truncated is dropped from the archive and downloaded again.
+"""
+
+import contextlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from .paths import writable_dir
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILE = os.path.join(writable_dir(), 'cache', 'download_archive.sqlite3')
+
+
+class DownloadArchive:
+    """SQLite table of ``(video_id, file_path, format)`` -> size / download time.
+
+    Like :class:`~youtube_downloader.info_cache.InfoCache`, each operation opens
+    a short-lived connection under a lock, so the archive is safe to share
+    between parallel playlist workers.
+    """
+
+    def __init__(self, path: str = ARCHIVE_FILE, verify: bool = True) -> None:
+        self.path = path
+        self.verify = verify
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS downloads ('
+                ' video_id TEXT NOT NULL, file_path TEXT NOT NULL, format TEXT NOT NULL,'
+                ' size INTEGER NOT NULL, downloaded_at REAL NOT NULL,'
+                ' PRIMARY KEY (video_id, file_path, format))'
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """A connection that commits (or rolls back) and is closed on exit."""
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(video_id: str, file_path: str) -> "tuple[str, str]":
+        return video_id, os.path.abspath(file_path)
+
+    def contains(self, video_id: str, file_path: str) -> bool:
+        """Whether this video was already downloaded to ``file_path`` (in any format)."""
+        key = self._key(video_id, file_path)
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                'SELECT size FROM downloads WHERE video_id = ? AND file_path = ?', key
+            ).fetchone()
+            if row is None:
+                return False
+            if self.verify and not _file_matches(key[1], row[0]):
+                conn.execute('DELETE FROM downloads WHERE video_id = ? AND file_path = ?', key)
+                logger.info("Archived file missing or changed, will download again: %s", key[1])
+                return False
+        return True
+
+    def add(self, video_id: str, file_path: str, fmt: str) -> None:
+        """Record a completed download in ``fmt`` (no-op if the file isn't there)."""
+        key = self._key(video_id, file_path)
+        try:
+            size = os.path.getsize(key[1])
+        except OSError:
+            logger.warning("Not archiving %s: file not found", key[1])
+            return
+        with self._lock, self._connect() as conn:
+            # One row per file: the format it was last downloaded in.
+            conn.execute('DELETE FROM downloads WHERE video_id = ? AND file_path = ?', key)
+            conn.execute(
+                'INSERT INTO downloads VALUES (?, ?, ?, ?, ?)', (*key, fmt, size, time.time())
+            )
+
+
+def _file_matches(file_path: str, size: int) -> bool:
+    try:
+        return os.path.getsize(file_path) == size
+    except OSError:
+        return False
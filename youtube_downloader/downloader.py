@@ -2,71 +2,117 @@
 
 import logging
 
-import yt_dlp
-
-from .ffmpeg_support import ffmpeg_location
+from .bandwidth import BandwidthLimiter, default_limiter
+from .cancellation import CancelToken, cancellable_hook
+from .extracted_info import ExtractedInfoStore, default_info_store
+from .format_profiles import DEFAULT_PROFILE, get_profile
 from .interfaces import VideoDownloader
 from .models import DownloadOutcome
-from .ytdlp_support import js_runtime_opts
+from .retry_policy import RetryPolicy
+from .settings import get_settings
+from .utils import youtube_video_id
+from .ytdlp_pool import YoutubeDLPool, default_pool
+from .ytdlp_support import PLAYER_CLIENTS, js_runtime_opts, player_client_opts
 
 logger = logging.getLogger(__name__)
 
 
 class YtDlpDownloader(VideoDownloader):
-    """Downloads the best-quality MP4 for a video using yt-dlp.
+    """Downloads a video as MP4 (or only its audio stream) using yt-dlp.
 
     YouTube 403s: the ``android_vr`` client that yt-dlp falls back to (when no
     proof-of-origin token / JS runtime is available) is heavily throttled and its
     AV1-only formats (e.g. 399) intermittently return ``HTTP Error 403``. To stay
     reliable we (1) prefer H.264 ``avc1`` MP4, which the ``tv``/``web_safari``
     clients serve without a PO token, (2) let yt-dlp source formats from several
-    clients, and (3) retry with a fresh extraction on failure.
+    clients, and (3) retry under a :class:`RetryPolicy` — fresh extraction with
+    other clients after a 403, backoff on transient errors, no retry at all for
+    unavailable videos or local (disk) errors.
+
+    ``YoutubeDL`` instances come from a shared :class:`YoutubeDLPool`; the output
+    template and progress hook are applied per checkout, so a playlist reuses the
+    same instance for every video instead of rebuilding one per attempt.
+
+    Every chunk is throttled by a process-wide :class:`BandwidthLimiter`, so
+    concurrent downloads share one bandwidth cap.
+
+    When the info provider already extracted the video (see
+    :mod:`~youtube_downloader.extracted_info`) and its stream URLs are still
+    valid, the first try downloads from that info dict without extracting again;
+    retries (expired URL, 403, ...) always extract afresh.
     """
 
-    def download(
+    def __init__(
         self,
-        url: str,
-        title: str,
-        output_path: str = '.',
-        progress_hook=None,
-    ) -> DownloadOutcome:
-        ydl_opts = {
-            'outtmpl': f'{output_path}/{title}.%(ext)s',
-            # Prefer H.264 (avc1) MP4 from the reliable clients, then any MP4.
-            'format': (
-                'bestvideo[ext=mp4][vcodec^=avc1]+bestaudio[ext=m4a]/'
-                'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]'
-            ),
-            'merge_output_format': 'mp4',  # always produce a .mp4 (chapter split relies on it)
-            'ffmpeg_location': ffmpeg_location(),  # use the bundled ffmpeg for the stream merge
+        pool: "YoutubeDLPool | None" = None,
+        limiter: "BandwidthLimiter | None" = None,
+        info_store: "ExtractedInfoStore | None" = None,
+        retry_policy: "RetryPolicy | None" = None,
+    ) -> None:
+        self.pool = pool or default_pool
+        self.limiter = limiter or default_limiter
+        self.info_store = info_store or default_info_store
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    @staticmethod
+    def _ydl_opts(
+        player_clients: "tuple[str, ...]" = PLAYER_CLIENTS,
+        format_profile: str = DEFAULT_PROFILE,
+    ) -> dict:
+        """Options shared by every download (everything but the outtmpl / hook).
+
+        ``player_clients`` changes only when the retry policy falls back to other
+        YouTube clients after a 403.
+        """
+        return {
+            # Prefer H.264 (avc1) MP4 from the reliable clients, then any MP4,
+            # within the profile's resolution cap (see format_profiles).
+            'format': get_profile(format_profile).format_selector,
+            'merge_output_format': 'mp4',  # merged video is always .mp4 (audio-only keeps its own ext)
+            'ffmpeg_location': get_settings().ffmpeg_path,  # bundled ffmpeg for the stream merge
             'noplaylist': True,       # Only download single video, not the whole playlist
             'retries': 10,            # Retry the whole download on network errors
             'fragment_retries': 10,   # Retry individual fragments (fixes "Connection reset by peer")
             'extractor_retries': 5,   # Re-extract (fresh URLs) on transient extractor errors
             'socket_timeout': 30,     # Give up on a stalled connection sooner, then retry
             'continuedl': True,       # Resume partially downloaded files instead of restarting
-            # Source formats from several player clients so a throttled / HTTP-403
-            # client (e.g. android_vr) can fall back to a working one.
-            'extractor_args': {'youtube': {'player_client': ['default', 'tv', 'web_safari']}},
+            # Source formats from several player clients (see ytdlp_support).
+            **player_client_opts(player_clients),
             # Optionally enable a JS runtime + EJS solver (opt-in via metadata.json)
             # to solve the nsig challenge and unlock all formats.
             **js_runtime_opts(),
         }
-        if progress_hook is not None:
-            ydl_opts['progress_hooks'] = [progress_hook]
-
-        logger.info("Downloading '%s' -> %s", title, output_path)
-        last_error = None
-        for attempt in range(1, 4):  # up to 3 fresh-extraction attempts for transient 403s
-            try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+
+    def prewarm(self) -> None:
+        """Build the pooled ``YoutubeDL`` instance in the background."""
+        self.pool.warm(self._ydl_opts())
+
+    def download(
+        self,
+        url: str,
+        title: str,
+        output_path: str = '.',
+        progress_hook=None,
+        format_profile: str = DEFAULT_PROFILE,
+        cancel_token: "CancelToken | None" = None,
+    ) -> DownloadOutcome:
+        outtmpl = f'{output_path}/{title}.%(ext)s'
+        progress_hook = cancellable_hook(self.limiter.wrap_hook(progress_hook), cancel_token)
+        video_id = youtube_video_id(url)
+        stored = self.info_store.take(video_id) if video_id else None
+
+        def attempt(clients: "tuple[str, ...]") -> None:
+            nonlocal stored
+            with self.pool.acquire(self._ydl_opts(clients, format_profile), outtmpl, progress_hook) as ydl:
+                if stored is None:
                     ydl.download([url])
-                logger.info("Downloaded '%s'", title)
-                return DownloadOutcome(success=True)
-            except Exception as e:
-                last_error = e
-                logger.warning("Attempt %d/3 failed for '%s': %s", attempt, title, e)
-                print(f"\nAttempt {attempt}/3 failed for '{title}': {e}")
-        logger.error("Failed to download '%s' after 3 attempts: %s", title, last_error)
-        print(f"\nFailed to download '{title}': {last_error}\n")
-        return DownloadOutcome(success=False, error=str(last_error))
+                    return
+                info, stored = stored, None  # reuse once; retries re-extract
+                ydl.process_ie_result(info, download=True)
+                logger.info("Reused extracted info for '%s'", title)
+
+        logger.info("Downloading '%s' (%s) -> %s", title, format_profile, output_path)
+        outcome = self.retry_policy.run(attempt, title, cancel_token=cancel_token)
+        if outcome:
+            logger.info("Downloaded '%s'", title)
+        return outcome
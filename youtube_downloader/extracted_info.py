@@ -0,0 +1,107 @@
+"""In-memory store of raw yt-dlp info dicts, shared by the info provider and downloaders.
+
+Fetching a video's info runs a full yt-dlp extraction (player pages, player
+clients, format lists) — and so did the download that followed it, for the same
+URL, moments later. :class:`YtDlpInfoProvider` now drops every info dict it
+extracts *for a download* (``get_video_info(url, for_download=True)``) into
+:data:`default_info_store`, and the downloaders take the video out of it first:
+yt-dlp then only selects formats and downloads (``YoutubeDL.process_ie_result``),
+skipping the extraction. The store therefore only holds videos between being
+resolved and being downloaded.
+
+YouTube stream URLs are signed and expire (the ``expire`` query parameter, a
+Unix time, typically ~6 hours out). An entry is served only while every one of
+its stream URLs stays valid for at least ``safety_margin`` more seconds; after
+that — or as soon as a download with it fails (e.g. a 403) — the entry is dropped
+and the caller extracts afresh.
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlparse
+
+import yt_dlp
+
+logger = logging.getLogger(__name__)
+
+
+def stream_expiry(info: dict) -> "float | None":
+    """Earliest ``expire`` time among the info's stream URLs (``None`` if none carry one)."""
+    expiries = []
+    for fmt in info.get('formats') or []:
+        url = fmt.get('url') or ''
+        expire = parse_qs(urlparse(url).query).get('expire')
+        if expire and expire[0].isdigit():
+            expiries.append(float(expire[0]))
+    return min(expiries) if expiries else None
+
+
+class ExtractedInfoStore:
+    """Thread-safe LRU of info dicts keyed by video id, honouring URL expiry.
+
+    ``default_ttl`` bounds entries whose URLs carry no ``expire`` parameter.
+    Entries are taken out by the download that uses them, so the store normally
+    holds only the few videos resolved but not yet downloaded; ``max_entries``
+    is just a memory bound for downloads that never happen.
+    """
+
+    def __init__(self, max_entries: int = 256, safety_margin: float = 600, default_ttl: float = 3600) -> None:
+        self.max_entries = max_entries
+        self.safety_margin = safety_margin
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, info: dict) -> None:
+        """Remember a freshly extracted single-video info dict."""
+        video_id = info.get('id')
+        if not video_id or info.get('_type', 'video') != 'video':
+            return
+        expires_at = stream_expiry(info) or time.time() + self.default_ttl
+        # Drop what yt-dlp filled in during format selection / download so the
+        # dict can be processed again like a ``--load-info-json`` file.
+        clean = yt_dlp.YoutubeDL.sanitize_info(info, remove_private_keys=True)
+        with self._lock:
+            self._entries[video_id] = (expires_at, clean)
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, video_id: str) -> "dict | None":
+        """A private copy of the stored info, or ``None`` if missing / about to expire."""
+        with self._lock:
+            info = self._valid(video_id)
+            if info is None:
+                return None
+            self._entries.move_to_end(video_id)
+        return copy.deepcopy(info)
+
+    def take(self, video_id: str) -> "dict | None":
+        """Like :meth:`get`, but removes the entry — for the download that uses it."""
+        with self._lock:
+            info = self._valid(video_id)
+            self._entries.pop(video_id, None)
+        return info
+
+    def _valid(self, video_id: str) -> "dict | None":
+        """The stored info if still usable, dropping it if it expires soon. Lock held."""
+        entry = self._entries.get(video_id)
+        if entry is None:
+            return None
+        expires_at, info = entry
+        if expires_at - time.time() < self.safety_margin:
+            del self._entries[video_id]
+            logger.info("Stream URLs for %s expire soon; dropping extracted info", video_id)
+            return None
+        return info
+
+    def discard(self, video_id: str) -> None:
+        with self._lock:
+            self._entries.pop(video_id, None)
+
+
+# Shared by the info provider and the downloaders unless one is injected.
+default_info_store = ExtractedInfoStore()
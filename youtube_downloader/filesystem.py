@@ -2,6 +2,7 @@
 
 import logging
 import os
+import re
 import subprocess
 import sys
 
@@ -14,16 +15,52 @@ def ensure_dir(path: str) -> None:
     logger.debug("Ensured directory exists: %s", path)
 
 
-def create_text_file(lines: list[str], path: str) -> None:
-    """Write ``lines`` to ``Link.txt`` inside ``path`` (creating the folder)."""
+def remove_partial_downloads(directory: str, title: str) -> "list[str]":
+    """Delete the leftovers of an interrupted download of ``title`` in ``directory``.
+
+    That is yt-dlp's ``.part`` / ``.part-Frag*`` / ``.ytdl`` files, the
+    separately downloaded streams (``<title>.f<id>.<ext>``) and their segment
+    state, and the merger's ``<title>.temp.<ext>``. Stream names must carry a
+    numeric format id, so the finished video, its subtitles and unrelated files
+    such as ``<title>.final.mp4`` are never touched. Returns the removed paths.
+    """
+    name = re.escape(title)
+    pattern = re.compile(
+        rf'{name}\.(f\d+[\w-]*\.\w+(\.(part.*|ytdl))?|temp\.\w+|\w+\.(part.*|ytdl))'
+    )
+    try:
+        entries = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    removed = []
+    for entry in entries:
+        if not pattern.fullmatch(entry):
+            continue
+        path = os.path.join(directory, entry)
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning("Could not remove partial download %s: %s", path, e)
+            continue
+        removed.append(path)
+    if removed:
+        logger.info("Removed %d partial file(s) of '%s'", len(removed), title)
+    return removed
+
+
+def create_text_file(lines: list[str], path: str, append: bool = False) -> None:
+    """Write ``lines`` to ``Link.txt`` inside ``path`` (creating the folder).
+
+    ``append=True`` adds to an existing ``Link.txt`` instead of replacing it.
+    """
     ensure_dir(path)  # Ensure the directory exists
     file_path = os.path.join(path, 'Link.txt')  # Define the file path
 
     # Write the description to the file
-    with open(file_path, 'w', encoding='utf-8') as file:
+    with open(file_path, 'a' if append else 'w', encoding='utf-8') as file:
         for line in lines:
             file.write(line)
-    logger.info("Wrote text file: %s", file_path)
+    logger.info("%s text file: %s", "Appended to" if append else "Wrote", file_path)
 
 
 def clear_console() -> None:
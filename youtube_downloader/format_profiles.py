@@ -0,0 +1,144 @@
+"""Named, resolution-capped format profiles.
+
+Every download used to ask yt-dlp for the best H.264 video plus M4A audio —
+1080p or more for a lecture nobody watches at that size. A :class:`FormatProfile`
+caps the video height while keeping the same 403-avoidance preference order
+(H.264 ``avc1`` MP4 first, then any MP4 video, then a pre-merged MP4), so a
+capped download is exactly as reliable as the uncapped one, just smaller.
+
+The ``audio`` profile skips the video stream altogether: it fetches the best
+M4A (else Opus) audio as-is, with no merge step, so the output is a ``.m4a`` or
+``.webm`` file rather than an ``.mp4`` (see :attr:`FormatProfile.extensions`).
+
+Sizes are estimated before downloading: from the real format list when the
+video has been extracted (:func:`estimate_sizes`, using yt-dlp's own format
+selector), otherwise from the duration and a bitrate — the one the resolved
+videos of the same run actually have (:func:`observed_bytes_per_second`), else a
+typical YouTube bitrate for the profile.
+"""
+
+import logging
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FormatProfile:
+    """A named format choice; ``max_height`` ``None`` means no cap."""
+
+    name: str
+    label: str
+    max_height: "int | None"
+    # Video + audio, for estimates without a format list: the usual bitrate of
+    # YouTube's H.264 stream at the cap, plus ~130 kbps of AAC audio.
+    typical_kbps: int
+    audio_only: bool = False
+
+    @property
+    def format_selector(self) -> str:
+        """The yt-dlp ``format`` string for this profile."""
+        if self.audio_only:
+            return 'bestaudio[ext=m4a]/bestaudio[acodec=opus]/bestaudio'
+        cap = f'[height<={self.max_height}]' if self.max_height else ''
+        return (
+            f'bestvideo[ext=mp4][vcodec^=avc1]{cap}+bestaudio[ext=m4a]/'
+            f'bestvideo[ext=mp4]{cap}+bestaudio[ext=m4a]/best[ext=mp4]{cap}'
+        )
+
+    @property
+    def extensions(self) -> "tuple[str, ...]":
+        """Possible output file extensions, most likely first."""
+        return ('m4a', 'webm', 'opus') if self.audio_only else ('mp4',)
+
+
+PROFILES: "dict[str, FormatProfile]" = {
+    profile.name: profile
+    for profile in (
+        FormatProfile('360p', '360p (small)', 360, 550),
+        FormatProfile('720p', '720p', 720, 1_400),
+        FormatProfile('1080p', '1080p', 1080, 2_800),
+        # The selector prefers H.264, which YouTube rarely serves above 1080p.
+        FormatProfile('best', 'Best available', None, 3_000),
+        FormatProfile('audio', 'Audio only', None, 130, audio_only=True),
+    )
+}
+DEFAULT_PROFILE = 'best'
+
+
+def get_profile(name: "str | None") -> FormatProfile:
+    """The profile called ``name``; unknown or empty names get the default."""
+    profile = PROFILES.get(name or DEFAULT_PROFILE)
+    if profile is None:
+        logger.warning("Unknown format profile %r; using %r", name, DEFAULT_PROFILE)
+        profile = PROFILES[DEFAULT_PROFILE]
+    return profile
+
+
+def _format_size(fmt: dict) -> "int | None":
+    size = fmt.get('filesize') or fmt.get('filesize_approx')
+    return int(size) if size else None
+
+
+def estimate_sizes(ydl, info: dict) -> "dict[str, int]":
+    """Expected bytes per profile for an extracted info dict.
+
+    Runs each profile's format string through ``ydl``'s own selector over the
+    video's formats, so the estimate is for exactly the formats a download would
+    fetch. Profiles whose selection has no known size are left out.
+    """
+    formats = info.get('formats') or []
+    if not formats:
+        return {}
+    ctx = {
+        'formats': formats,
+        'has_merged_format': any(
+            'none' not in (f.get('acodec'), f.get('vcodec')) for f in formats
+        ),
+        'incomplete_formats': (
+            all(f.get('vcodec') == 'none' for f in formats)
+            or all(f.get('acodec') == 'none' for f in formats)
+        ),
+    }
+    estimates = {}
+    for profile in PROFILES.values():
+        try:
+            selected = next(iter(ydl.build_format_selector(profile.format_selector)(dict(ctx))), None)
+        except Exception as e:  # noqa: BLE001 - an estimate must never break info fetching
+            logger.debug("Could not estimate %s size: %s", profile.name, e)
+            continue
+        if selected is None:
+            continue
+        sizes = [_format_size(f) for f in selected.get('requested_formats') or [selected]]
+        if all(sizes):
+            estimates[profile.name] = sum(sizes)
+    return estimates
+
+
+def observed_bytes_per_second(videos, profile_name: str) -> "float | None":
+    """Average download rate (bytes per second of video) of the resolved ``videos``.
+
+    Taken from the videos whose size in ``profile_name`` is known; ``None`` when
+    there are none. A far better guess for the rest of a playlist than a typical
+    bitrate, since a channel's uploads tend to be encoded alike.
+    """
+    sized = [video for video in videos
+             if video.size_estimates.get(profile_name) and video.length_seconds > 0]
+    seconds = sum(video.length_seconds for video in sized)
+    if not seconds:
+        return None
+    return sum(video.size_estimates[profile_name] for video in sized) / seconds
+
+
+def estimate_video_size(video, profile_name: str, bytes_per_second: "float | None" = None) -> int:
+    """Expected bytes for ``video`` (a :class:`VideoInfo`) in the given profile.
+
+    Videos without a known size are estimated from their duration at
+    ``bytes_per_second`` (e.g. :func:`observed_bytes_per_second`), else at the
+    profile's typical bitrate.
+    """
+    known = video.size_estimates.get(profile_name)
+    if known:
+        return known
+    rate = bytes_per_second or get_profile(profile_name).typical_kbps * 1000 / 8
+    return int(video.length_seconds * rate)
@@ -0,0 +1,352 @@
+"""Asyncio serving mode for the GUI (``"gui_server": "asgi"``).
+
+Under ``app.run(threaded=True)`` every open SSE stream holds an OS thread that
+sleeps until its job emits, so a shared instance with dozens of watchers runs
+hundreds of threads. :class:`GuiAsgiApp` serves the same endpoints from one
+event loop instead:
+
+* the two streaming endpoints, ``/api/progress/<job_id>`` and ``/api/events``,
+  are async generators waiting on an :class:`AsyncEventHub` — an idle
+  connection costs a coroutine and an ``asyncio.Event``;
+* every other request is handed to the Flask app on a small thread pool, so
+  there is exactly one implementation of each endpoint.
+
+Download threads keep calling :meth:`Job.emit` as before; the job's listeners
+:meth:`~AsyncEventHub.publish` into the hub, which only schedules a wake-up on
+the loop and never blocks. Needs ``uvicorn`` (``pip install uvicorn``), which is
+imported only when this mode is started.
+"""
+
+import asyncio
+import contextlib
+import functools
+import io
+import logging
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from . import events, jobs
+
+logger = logging.getLogger(__name__)
+
+# Threads that run the (short) non-streaming Flask requests.
+_WSGI_THREADS = 16
+# Seconds uvicorn waits for open streams when the server stops.
+_GRACEFUL_SHUTDOWN_SECONDS = 2
+
+_SSE_HEADERS = [
+    (b'content-type', b'text/event-stream; charset=utf-8'),
+    (b'cache-control', b'no-cache'),
+    (b'x-accel-buffering', b'no'),
+]
+
+
+class AsyncEventHub:
+    """Thread-to-asyncio pub/sub: topics are woken from any thread, waited on in the loop.
+
+    :meth:`subscribe` hands a coroutine an ``asyncio.Event`` for a topic and,
+    for the first subscriber, registers a listener on the topic's source (a
+    :class:`Job` or :class:`~youtube_downloader.gui.events.EventClient`), so
+    every change there calls :meth:`publish`. Publishes of a topic coalesce
+    until the loop has delivered the previous one.
+    """
+
+    def __init__(self) -> None:
+        self._loop: "asyncio.AbstractEventLoop | None" = None
+        self._subscribers: "dict[object, set[asyncio.Event]]" = {}
+        self._sources: "dict[object, tuple[object, object]]" = {}
+        self._scheduled: "set[object]" = set()
+        self._lock = threading.Lock()
+
+    def publish(self, topic) -> None:
+        """Wake ``topic``'s subscribers; safe to call from any thread, never blocks."""
+        loop = self._loop
+        if loop is None:
+            return
+        with self._lock:
+            if topic in self._scheduled:
+                return
+            self._scheduled.add(topic)
+        try:
+            loop.call_soon_threadsafe(self._deliver, topic)
+        except RuntimeError:  # loop closed (server stopping)
+            with self._lock:
+                self._scheduled.discard(topic)
+
+    def _deliver(self, topic) -> None:
+        with self._lock:
+            self._scheduled.discard(topic)
+        for signal in self._subscribers.get(topic, ()):
+            signal.set()
+
+    @contextlib.contextmanager
+    def subscribe(self, topic, source=None):
+        """An ``asyncio.Event`` set whenever ``topic`` is published (loop thread only)."""
+        self._loop = asyncio.get_running_loop()
+        signal = asyncio.Event()
+        waiters = self._subscribers.setdefault(topic, set())
+        if not waiters and source is not None:
+            listener = functools.partial(self.publish, topic)
+            source.add_listener(listener)
+            self._sources[topic] = (source, listener)
+        waiters.add(signal)
+        try:
+            yield signal
+        finally:
+            waiters.discard(signal)
+            if not waiters:
+                del self._subscribers[topic]
+                source_entry = self._sources.pop(topic, None)
+                if source_entry is not None:
+                    source_entry[0].remove_listener(source_entry[1])
+
+    def stats(self) -> dict:
+        return {'topics': len(self._subscribers),
+                'subscribers': sum(len(w) for w in self._subscribers.values())}
+
+
+async def _wait(signal: asyncio.Event, timeout: float) -> bool:
+    """Wait for ``signal``; False on timeout."""
+    try:
+        await asyncio.wait_for(signal.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+def _wsgi_environ(scope: dict, body: bytes) -> dict:
+    """A PEP 3333 environ for an ASGI HTTP ``scope`` with the full request ``body``."""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for raw_name, raw_value in scope.get('headers', []):
+        name, value = raw_name.decode('latin-1'), raw_value.decode('latin-1')
+        if name == 'content-length':
+            continue
+        key = 'CONTENT_TYPE' if name == 'content-type' else 'HTTP_' + name.upper().replace('-', '_')
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+class GuiAsgiApp:
+    """ASGI front for the Flask GUI app; streams SSE from the event loop.
+
+    ``on_shutdown`` callables run (on a worker thread) when the server stops.
+    """
+
+    def __init__(self, wsgi_app, on_shutdown: "list | None" = None) -> None:
+        self.wsgi_app = wsgi_app
+        self.hub = AsyncEventHub()
+        self.on_shutdown = list(on_shutdown or [])
+        self._wsgi_pool = ThreadPoolExecutor(max_workers=_WSGI_THREADS, thread_name_prefix='gui-wsgi')
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        stream = self._stream_for(scope) if scope['method'] == 'GET' else None
+        if stream is not None:
+            await self._send_stream(stream, receive, send)
+        else:
+            await self._call_wsgi(scope, receive, send)
+
+    # ------------------------------------------------------------------ #
+    # Server-Sent Events
+    # ------------------------------------------------------------------ #
+    def _stream_for(self, scope):
+        """The async frame generator for a streaming request, or ``None``.
+
+        Requests that would fail (unknown job, no client id) go to Flask, which
+        answers them exactly as in threaded mode.
+        """
+        path = scope['path']
+        query = urllib.parse.parse_qs(scope.get('query_string', b'').decode('latin-1'))
+        headers = dict(scope.get('headers', []))
+        try:
+            last_id = int(headers.get(b'last-event-id', b'').decode('latin-1')
+                          or query.get('last_event_id', ['0'])[0] or 0)
+        except ValueError:
+            last_id = 0
+        if path.startswith('/api/progress/'):
+            job = jobs.get_job(path[len('/api/progress/'):])
+            return None if job is None else self._job_frames(job, last_id)
+        if path == '/api/events':
+            client_id = query.get('client', [''])[0].strip()
+            return self._client_frames(client_id, last_id or None) if client_id else None
+        return None
+
+    async def _job_frames(self, job: "jobs.Job", last_event_id: int):
+        """:func:`jobs.sse_stream`, awaiting the hub instead of blocking a thread."""
+        with self.hub.subscribe(('job', job.id), job) as signal:
+            while True:
+                signal.clear()
+                pending = job.events_after(last_event_id, timeout=0)
+                for last_event_id, data in pending:
+                    yield f"id: {last_event_id}\ndata: {data}\n\n"
+                if pending:
+                    continue
+                if job.closed:
+                    return
+                if not await _wait(signal, jobs.KEEPALIVE_SECONDS):
+                    yield ": keep-alive\n\n"
+
+    async def _client_frames(self, client_id: str, last_frame_id: "int | None"):
+        """:meth:`EventHub.stream <youtube_downloader.gui.events.EventHub.stream>`, async."""
+        client = events.hub.client(client_id)
+        with self.hub.subscribe(('client', client_id), client) as signal:
+            connection = client.connect(last_frame_id)
+            batch = events.hub.batch_interval()
+            last_frame = float('-inf')
+            try:
+                while client.connection == connection:
+                    if not await _wait(signal, events.HEARTBEAT_SECONDS):
+                        yield events.HEARTBEAT_FRAME
+                        continue
+                    delay = batch - (time.monotonic() - last_frame)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    if client.connection != connection:
+                        return
+                    signal.clear()
+                    frame = client.collect()
+                    if frame is not None:
+                        last_frame = time.monotonic()
+                        yield frame
+            finally:
+                client.disconnect(connection)
+
+    async def _send_stream(self, frames, receive, send) -> None:
+        """Send ``frames`` as a streaming response until they end or the client leaves."""
+        await send({'type': 'http.response.start', 'status': 200, 'headers': _SSE_HEADERS})
+
+        async def pump() -> None:
+            async for frame in frames:
+                await send({'type': 'http.response.body', 'body': frame.encode('utf-8'), 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b''})
+
+        async def disconnected() -> None:
+            while (await receive())['type'] != 'http.disconnect':
+                pass
+
+        tasks = [asyncio.ensure_future(pump()), asyncio.ensure_future(disconnected())]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if tasks[0] in done and not tasks[0].cancelled() and tasks[0].exception() is not None:
+            raise tasks[0].exception()
+
+    # ------------------------------------------------------------------ #
+    # Everything else: the Flask app on a worker thread
+    # ------------------------------------------------------------------ #
+    async def _call_wsgi(self, scope, receive, send) -> None:
+        body = b''
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+        loop = asyncio.get_running_loop()
+        status, headers, content = await loop.run_in_executor(
+            self._wsgi_pool, self._run_wsgi, _wsgi_environ(scope, body)
+        )
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': content})
+
+    def _run_wsgi(self, environ: dict) -> "tuple[int, list, bytes]":
+        response = {}
+
+        def start_response(status: str, headers: list, exc_info=None):
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = [(k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in headers]
+            return lambda data: None  # legacy write(); Flask never calls it
+
+        result = self.wsgi_app(environ, start_response)
+        try:
+            content = b''.join(result)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+        return response['status'], response['headers'], content
+
+    # ------------------------------------------------------------------ #
+    # Lifespan
+    # ------------------------------------------------------------------ #
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                loop = asyncio.get_running_loop()
+                for callback in self.on_shutdown:
+                    await loop.run_in_executor(None, callback)
+                self._wsgi_pool.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+def run_asgi(app: GuiAsgiApp, host: str, port: int, limit_concurrency: "int | None" = None,
+             drain=None) -> None:
+    """Serve ``app`` with uvicorn until interrupted.
+
+    ``limit_concurrency`` caps open connections (SSE streams included); beyond
+    it uvicorn answers 503. With ``drain``, the first SIGINT / SIGTERM calls
+    ``drain(signum)`` on a thread while the server keeps serving, so clients
+    can still follow (and reconnect to) their jobs, and uvicorn stops once it
+    returns; a second signal stops it at once.
+    """
+    try:
+        import uvicorn
+    except ImportError as e:
+        raise RuntimeError(
+            'The "asgi" GUI server needs uvicorn: pip install uvicorn'
+        ) from e
+
+    class Server(uvicorn.Server):
+        draining = False
+
+        def handle_exit(self, sig, frame) -> None:
+            if drain is None or self.draining or self.should_exit:
+                super().handle_exit(sig, frame)
+                return
+            self.draining = True
+
+            def run() -> None:
+                drain(sig)
+                self.should_exit = True
+
+            threading.Thread(target=run, name='drain', daemon=True).start()
+
+    logger.info("Serving the GUI with uvicorn (asyncio) on %s:%d", host, port)
+    config = uvicorn.Config(app, host=host, port=port, log_config=None, lifespan='on',
+                            limit_concurrency=limit_concurrency,
+                            timeout_graceful_shutdown=_GRACEFUL_SHUTDOWN_SECONDS)
+    Server(config).run()
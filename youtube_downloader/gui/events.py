@@ -0,0 +1,250 @@
+"""One multiplexed Server-Sent-Events stream per browser tab.
+
+Following every job on its own ``EventSource`` cost one HTTP connection and one
+server thread per job, and browsers allow only about six HTTP/1.1 connections
+per host — retrying a handful of failed playlist videos at once quietly stalled
+the page. Instead, a page opens a single ``/api/events`` stream under a client
+id of its choosing and subscribes jobs to it (``/api/events/subscribe``).
+
+The :class:`EventHub` wakes a client's stream whenever one of its jobs emits
+(see :meth:`Job.add_listener`) and sends everything new across all of its jobs
+as one frame, at most once per ``event_stream_batch_seconds``::
+
+    id: 7
+    data: [{"job": "<job id>", "id": 12, "event": {...}}, ...]
+
+Entries keep their job's order; when a job has closed and everything it
+emitted has been sent, its subscription ends with a ``{"job": ..., "closed":
+true}`` entry. Idle streams get an ``event: heartbeat`` frame every
+``HEARTBEAT_SECONDS`` (its ``interval`` lets the page detect a dead
+connection). Frame ids number the frames per client; a reconnect with
+``Last-Event-ID`` rewinds every job to where that frame left it, so nothing in
+flight is lost.
+
+On a thread-per-request server (waitress) an open stream would hold a worker
+per tab, so there :meth:`EventHub.poll` answers each request with whatever is
+pending and ends it; the browser's ``EventSource`` reconnects after the
+``retry`` interval, and the final heartbeat's ``poll`` flag tells the page the
+close is expected.
+"""
+
+import collections
+import json
+import logging
+import threading
+import time
+
+from ..settings import get_settings
+from . import jobs
+
+logger = logging.getLogger(__name__)
+
+# Seconds an idle stream waits before sending a heartbeat frame.
+HEARTBEAT_SECONDS = 15.0
+HEARTBEAT_FRAME = f"event: heartbeat\ndata: {json.dumps({'interval': HEARTBEAT_SECONDS})}\n\n"
+# Seconds between two polls of a polling client (see EventHub.poll).
+POLL_SECONDS = 1.0
+POLL_FRAME = (f"retry: {int(POLL_SECONDS * 1000)}\n\n"
+              f"event: heartbeat\ndata: {json.dumps({'interval': POLL_SECONDS, 'poll': True})}\n\n")
+# Most entries in one frame; the rest follow in the next one.
+_MAX_BATCH = 500
+# Frames per client whose job positions are kept for Last-Event-ID rewinds.
+_FRAME_HISTORY = 256
+
+
+class EventClient:
+    """One page's subscriptions: job id -> (job, id of the last event sent)."""
+
+    def __init__(self, client_id: str) -> None:
+        self.id = client_id
+        self.subscriptions: "dict[str, tuple[jobs.Job, int]]" = {}
+        self.frame_id = 0
+        self.history: "collections.deque[tuple[int, dict]]" = collections.deque(maxlen=_FRAME_HISTORY)
+        self.connection = 0
+        self.streaming = False
+        self.last_seen = time.time()
+        self._wake = threading.Event()
+        self._listeners: "list" = []
+        self._lock = threading.Lock()
+
+    def wake(self) -> None:
+        """Signal the stream that something changed (called from any thread)."""
+        self._wake.set()
+        for callback in list(self._listeners):
+            callback()
+
+    def add_listener(self, callback) -> None:
+        """Call ``callback()`` on every :meth:`wake` (see :meth:`Job.add_listener`)."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def connect(self, last_frame_id: "int | None" = None) -> int:
+        """Start a stream (ending any older one); returns its connection number.
+
+        With ``last_frame_id`` the jobs are first rewound to that frame.
+        """
+        with self._lock:
+            self.connection += 1
+            connection = self.connection
+        if last_frame_id is not None:
+            self.rewind(last_frame_id)
+        self.streaming = True
+        self.wake()
+        return connection
+
+    def disconnect(self, connection: int) -> None:
+        if self.connection == connection:
+            self.streaming = False
+        self.last_seen = time.time()
+
+    def subscribe(self, job: "jobs.Job", last_event_id: int = 0) -> None:
+        with self._lock:
+            if job.id not in self.subscriptions:
+                job.add_listener(self.wake)
+            self.subscriptions[job.id] = (job, last_event_id)
+        self.wake()
+
+    def unsubscribe(self, job_id: str) -> None:
+        with self._lock:
+            entry = self.subscriptions.pop(job_id, None)
+        if entry is not None:
+            entry[0].remove_listener(self.wake)
+
+    def rewind(self, frame_id: int) -> None:
+        """Reset every job to its position after frame ``frame_id`` (if still known).
+
+        Jobs subscribed later keep their position; jobs whose subscription ended
+        since that frame are followed again.
+        """
+        with self._lock:
+            snapshot = next((s for fid, s in self.history if fid == frame_id), None)
+            if snapshot is None:
+                return
+            for job_id, (job, cursor) in snapshot.items():
+                if job_id not in self.subscriptions:
+                    job.add_listener(self.wake)
+                self.subscriptions[job_id] = (job, cursor)
+        logger.debug("Event client %s rewound to frame %d", self.id, frame_id)
+
+    def close(self) -> None:
+        with self._lock:
+            subscriptions, self.subscriptions = self.subscriptions, {}
+        for job, _ in subscriptions.values():
+            job.remove_listener(self.wake)
+
+    def collect(self) -> "str | None":
+        """The next frame with every unsent event of every job, or ``None``."""
+        entries = []
+        with self._lock:
+            for job_id, (job, cursor) in list(self.subscriptions.items()):
+                if len(entries) >= _MAX_BATCH:
+                    break
+                for event_id, data in job.events_after(cursor, timeout=0)[:_MAX_BATCH - len(entries)]:
+                    entries.append(f'{{"job": "{job_id}", "id": {event_id}, "event": {data}}}')
+                    cursor = event_id
+                if job.closed and cursor >= job.last_event_id:
+                    entries.append(f'{{"job": "{job_id}", "closed": true}}')
+                    del self.subscriptions[job_id]
+                    job.remove_listener(self.wake)
+                else:
+                    self.subscriptions[job_id] = (job, cursor)
+            if not entries:
+                return None
+            if len(entries) >= _MAX_BATCH:
+                self.wake()  # more to send
+            self.frame_id += 1
+            self.history.append((self.frame_id, dict(self.subscriptions)))
+            return f"id: {self.frame_id}\ndata: [{', '.join(entries)}]\n\n"
+
+
+class EventHub:
+    """Every page's :class:`EventClient`, with idle clients forgotten.
+
+    A client that has had no open stream for ``job_retention_seconds`` is
+    dropped, like a finished job.
+    """
+
+    def __init__(self, batch_seconds: "float | None" = None) -> None:
+        self.batch_seconds = batch_seconds
+        self._clients: "dict[str, EventClient]" = {}
+        self._lock = threading.Lock()
+
+    def batch_interval(self) -> float:
+        """Shortest gap between two frames of one stream."""
+        if self.batch_seconds is None:
+            return get_settings().event_stream_batch_seconds
+        return self.batch_seconds
+
+    def _evict(self) -> None:
+        cutoff = time.time() - get_settings().job_retention_seconds
+        idle = [c for c in self._clients.values() if not c.streaming and c.last_seen < cutoff]
+        for client in idle:
+            del self._clients[client.id]
+            client.close()
+        if idle:
+            logger.debug("Dropped %d idle event client(s)", len(idle))
+
+    def client(self, client_id: str) -> EventClient:
+        with self._lock:
+            self._evict()
+            client = self._clients.get(client_id)
+            if client is None:
+                client = self._clients[client_id] = EventClient(client_id)
+            client.last_seen = time.time()
+            return client
+
+    def subscribe(self, client_id: str, job: "jobs.Job", last_event_id: int = 0) -> None:
+        self.client(client_id).subscribe(job, last_event_id)
+        logger.debug("Event client %s subscribed to job %s from event %d", client_id, job.id, last_event_id)
+
+    def unsubscribe(self, client_id: str, job_id: str) -> None:
+        self.client(client_id).unsubscribe(job_id)
+
+    def stream(self, client_id: str, last_frame_id: "int | None" = None):
+        """Yield SSE frames for ``client_id`` until it connects again elsewhere.
+
+        A newer stream for the same client (the browser reconnecting) ends this
+        one at its next wake-up.
+        """
+        client = self.client(client_id)
+        connection = client.connect(last_frame_id)
+        batch = self.batch_interval()
+        last_frame = float('-inf')
+        try:
+            while client.connection == connection:
+                if not client._wake.wait(HEARTBEAT_SECONDS):
+                    yield HEARTBEAT_FRAME
+                    continue
+                # Let events from other jobs pile up into the same frame.
+                delay = batch - (time.monotonic() - last_frame)
+                if delay > 0:
+                    time.sleep(delay)
+                if client.connection != connection:
+                    return
+                client._wake.clear()
+                frame = client.collect()
+                if frame is not None:
+                    last_frame = time.monotonic()
+                    yield frame
+        finally:
+            client.disconnect(connection)
+
+    def poll(self, client_id: str, last_frame_id: "int | None" = None):
+        """Yield the frames pending for ``client_id``, then end (see the module docstring)."""
+        client = self.client(client_id)
+        connection = client.connect(last_frame_id)
+        try:
+            client._wake.clear()
+            frame = client.collect()
+            while frame is not None:
+                yield frame
+                frame = client.collect()
+            yield POLL_FRAME
+        finally:
+            client.disconnect(connection)
+
+
+hub = EventHub()
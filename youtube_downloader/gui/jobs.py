@@ -1,70 +1,358 @@
 """In-memory background-job registry for the GUI.
 
-Each download runs on a daemon thread and reports progress by pushing events
-into its job's queue. The SSE endpoint drains that queue and streams the events
-to the browser. Kept deliberately simple: single-process, local app.
+Jobs run on one shared, bounded thread pool (the ``max_job_workers`` setting)
+and report progress by emitting events into their job. Each job carries a
+:class:`~youtube_downloader.cancellation.CancelToken`; :meth:`Job.cancel` sets
+it, and the download code stops at its next check. Every event gets a sequence
+number and is kept, JSON-encoded, in a bounded ring buffer (the
+``job_event_buffer`` setting), so the SSE endpoint can serve any number of
+subscribers per job and resume a reconnecting ``EventSource`` from its
+``Last-Event-ID``. Listeners registered with :meth:`Job.add_listener` are
+called on every event, which lets :mod:`~youtube_downloader.gui.events` follow
+many jobs from one thread.
+
+The :class:`JobRegistry` bounds how long jobs live, whether or not anyone ever
+reads their stream: finished jobs are forgotten ``job_retention_seconds`` after
+they end, and beyond ``max_retained_jobs`` the oldest finished ones go first, so
+a long-running server stays flat in memory. Kept deliberately simple:
+single-process, local app.
 """
 
+import collections
 import json
 import logging
-import queue
 import threading
+import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from ..cancellation import CancelToken, Cancelled
+from ..settings import get_settings
 
 logger = logging.getLogger(__name__)
 
 
+# Seconds an idle SSE stream waits before sending a keep-alive comment.
+KEEPALIVE_SECONDS = 15.0
+
+# Job states; the last three are final.
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINAL_STATES = frozenset({DONE, FAILED, CANCELLED})
+
+
 class Job:
-    """A single running download and its progress event queue."""
+    """A single running download and its numbered progress events.
+
+    ``state`` is ``queued`` / ``running`` / ``done`` / ``failed`` /
+    ``cancelled`` (the scheduler and :func:`run_job` move it along); setting it
+    stamps ``started_at`` / ``finished_at``. Pausing is orthogonal to the state:
+    a paused queued job is skipped by the scheduler, and a paused running job
+    blocks in :meth:`wait_if_paused`, which the download progress hook calls.
+    :meth:`cancel` sets ``cancel_token`` (and lifts a pause so the job can stop).
+
+    Events are ``(id, json)`` pairs with ids counting up from 1; only the last
+    ``buffer_size`` are kept, and ``buffered_bytes`` is the size of their JSON.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, priority: int = 0, buffer_size: int = 1000) -> None:
         self.id = uuid.uuid4().hex
-        self.events: "queue.Queue" = queue.Queue()
+        self.events: "collections.deque[tuple[int, str]]" = collections.deque(maxlen=buffer_size)
+        self.priority = priority
+        self.created_at = time.time()
+        self.started_at: "float | None" = None
+        self.finished_at: "float | None" = None
+        self._state = QUEUED
+        self.closed = False
+        self.closed_at: "float | None" = None
+        self.buffered_bytes = 0
+        self._last_id = 0
+        self._changed = threading.Condition()
+        self._listeners: "list" = []
+        self._resumed = threading.Event()
+        self._resumed.set()
+        self.cancel_token = CancelToken()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    @state.setter
+    def state(self, value: str) -> None:
+        self._state = value
+        if value == RUNNING and self.started_at is None:
+            self.started_at = time.time()
+        elif value in FINAL_STATES and self.finished_at is None:
+            self.finished_at = time.time()
 
     def emit(self, **event) -> None:
-        """Push a progress event (a dict) to the stream."""
-        self.events.put(event)
+        """Append a progress event (a dict) and wake every subscriber.
+
+        The event is encoded once here; every subscriber streams the same string.
+        """
+        data = json.dumps(event)
+        with self._changed:
+            self._last_id += 1
+            if len(self.events) == self.events.maxlen:
+                self.buffered_bytes -= len(self.events[0][1])
+            self.events.append((self._last_id, data))
+            self.buffered_bytes += len(data)
+            self._changed.notify_all()
+        self._notify_listeners()
 
     def close(self) -> None:
-        """Signal the end of the stream."""
-        self.events.put(None)
+        """Mark the end of the stream (subscribers finish once they've caught up)."""
+        with self._changed:
+            self.closed = True
+            self.closed_at = time.time()
+            self._changed.notify_all()
+        self._notify_listeners()
 
+    def add_listener(self, callback) -> None:
+        """Call ``callback()`` after every new event and when the job closes.
 
-_jobs: "dict[str, Job]" = {}
+        Callbacks run on the emitting thread, so they must be quick (e.g. set an
+        ``Event``).
+        """
+        with self._changed:
+            self._listeners.append(callback)
 
+    def remove_listener(self, callback) -> None:
+        with self._changed:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
 
-def create_job() -> Job:
-    job = Job()
-    _jobs[job.id] = job
-    return job
+    def _notify_listeners(self) -> None:
+        with self._changed:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            callback()
 
+    def events_after(self, last_id: int, timeout: "float | None" = None) -> "list[tuple[int, str]]":
+        """Events newer than ``last_id``, waiting up to ``timeout`` for one to arrive.
 
-def get_job(job_id: str):
-    return _jobs.get(job_id)
+        Returns an empty list on timeout, or at once if the job is closed and
+        there is nothing newer. Events that already left the ring buffer are
+        skipped.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._last_id > last_id or self.closed, timeout)
+            return [(event_id, event) for event_id, event in self.events if event_id > last_id]
 
+    @property
+    def last_event_id(self) -> int:
+        return self._last_id
 
-def run_in_thread(job: Job, target) -> None:
-    """Run ``target(job)`` on a daemon thread; emit any error and always close."""
-    def _run() -> None:
-        try:
-            target(job)
-        except Exception as e:  # noqa: BLE001 - surface any failure to the UI
-            logger.exception("Job %s failed", job.id)
-            job.emit(type='error', message=str(e))
-        finally:
-            job.close()
+    def pause(self) -> None:
+        self._resumed.clear()
 
-    logger.info("Starting job %s", job.id)
-    threading.Thread(target=_run, daemon=True).start()
+    def resume(self) -> None:
+        self._resumed.set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._resumed.is_set()
+
+    def wait_if_paused(self) -> None:
+        """Block the calling (download) thread while the job is paused.
+
+        Raises :class:`Cancelled` if the job is (or gets) cancelled.
+        """
+        self._resumed.wait()
+        self.cancel_token.raise_if_cancelled()
+
+    def cancel(self) -> None:
+        """Ask the running work to stop; :func:`run_job` marks the job cancelled."""
+        self.cancel_token.cancel()
+        self._resumed.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_token.cancelled
+
+    def summary(self) -> dict:
+        """The JSON fields ``/api/jobs`` lists for this job."""
+        return {
+            'id': self.id,
+            'state': self.state,
+            'paused': self.paused,
+            'cancelled': self.cancelled,
+            'priority': self.priority,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'events': len(self.events),
+            'last_event_id': self.last_event_id,
+            'buffered_bytes': self.buffered_bytes,
+        }
+
+
+class JobRegistry:
+    """Every known job by id, with time- and count-based eviction of finished jobs.
+
+    A job is finished once it is closed (its stream has ended). Finished jobs
+    are dropped ``retention_seconds`` after they close, and whenever more than
+    ``max_jobs`` are known the oldest finished ones are dropped first. Jobs that
+    are still queued or running are never evicted. Eviction runs on every
+    :meth:`create` / :meth:`get` / :meth:`list`, so it needs no timer thread.
+    """
+
+    def __init__(self, retention_seconds: "float | None" = None, max_jobs: "int | None" = None) -> None:
+        self.retention_seconds = retention_seconds
+        self.max_jobs = max_jobs
+        self._jobs: "dict[str, Job]" = {}  # creation order
+        self._lock = threading.Lock()
+
+    def _limits(self) -> "tuple[float, int]":
+        settings = get_settings()
+        retention = settings.job_retention_seconds if self.retention_seconds is None else self.retention_seconds
+        max_jobs = settings.max_retained_jobs if self.max_jobs is None else self.max_jobs
+        return retention, max_jobs
+
+    def _evict(self) -> None:
+        retention, max_jobs = self._limits()
+        cutoff = time.time() - retention
+        finished = [job for job in self._jobs.values() if job.closed]
+        expired = [job for job in finished if job.closed_at < cutoff]
+        overflow = len(self._jobs) - len(expired) - max_jobs
+        if overflow > 0:
+            survivors = [job for job in finished if job.closed_at >= cutoff]
+            expired += sorted(survivors, key=lambda job: job.closed_at)[:overflow]
+        for job in expired:
+            del self._jobs[job.id]
+        if expired:
+            logger.debug("Evicted %d finished job(s); %d left", len(expired), len(self._jobs))
+
+    def create(self, priority: int = 0) -> Job:
+        job = Job(priority, buffer_size=get_settings().job_event_buffer)
+        with self._lock:
+            self._evict()
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> "Job | None":
+        with self._lock:
+            self._evict()
+            return self._jobs.get(job_id)
 
+    def list(self) -> "list[Job]":
+        with self._lock:
+            self._evict()
+            return list(self._jobs.values())
 
-def sse_stream(job: Job):
-    """Yield Server-Sent-Events strings until the job closes, then forget it."""
+    def stats(self) -> dict:
+        """Job counts per state and the bytes held in buffered events."""
+        jobs = self.list()
+        states = collections.Counter(job.state for job in jobs)
+        retention, max_jobs = self._limits()
+        return {
+            'count': len(jobs),
+            'states': dict(states),
+            'buffered_bytes': sum(job.buffered_bytes for job in jobs),
+            'buffered_events': sum(len(job.events) for job in jobs),
+            'max_jobs': max_jobs,
+            'retention_seconds': retention,
+        }
+
+
+registry = JobRegistry()
+
+
+def create_job(priority: int = 0) -> Job:
+    return registry.create(priority)
+
+
+def get_job(job_id: str) -> "Job | None":
+    return registry.get(job_id)
+
+
+def run_job(job: Job, target) -> None:
+    """Run ``target(job)`` on the calling thread; emit any error and always close."""
     try:
-        while True:
-            event = job.events.get()
-            if event is None:
-                break
-            yield f"data: {json.dumps(event)}\n\n"
+        target(job)
+    except Cancelled:
+        logger.info("Job %s cancelled", job.id)
+        job.state = CANCELLED
+        job.emit(type='cancelled', message='Cancelled')
+    except Exception as e:  # noqa: BLE001 - surface any failure to the UI
+        logger.exception("Job %s failed", job.id)
+        job.state = FAILED
+        job.emit(type='error', message=str(e))
     finally:
-        _jobs.pop(job.id, None)
+        job.close()
+
+
+_executor: "ThreadPoolExecutor | None" = None
+_executor_lock = threading.Lock()
+
+
+def executor() -> ThreadPoolExecutor:
+    """The thread pool every job runs on, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            workers = max(1, get_settings().max_job_workers)
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job')
+            logger.debug("Job executor started with %d workers", workers)
+        return _executor
+
+
+def run_in_background(job: Job, target) -> Future:
+    """Run ``target(job)`` on the job executor, outside the download scheduler.
+
+    Used for short, non-download work (e.g. streaming playlist info) that must
+    not wait behind queued downloads.
+    """
+    logger.info("Starting job %s", job.id)
+    job.state = RUNNING
+
+    def run() -> None:
+        run_job(job, target)
+        if job.state == RUNNING:
+            job.state = DONE
+
+    return executor().submit(run)
+
+
+def shutdown(wait: bool = True) -> None:
+    """Cancel every unfinished job and stop the executor (on server exit).
+
+    Cancelled downloads stop within a chunk, so waiting only takes as long as
+    the slowest non-cancellable step (e.g. an extraction) still in progress.
+    """
+    global _executor
+    active = [job for job in registry.list() if job.state not in FINAL_STATES]
+    for job in active:
+        job.cancel()
+    with _executor_lock:
+        pool, _executor = _executor, None
+    if pool is not None:
+        logger.info("Shutting down job executor (%d active job(s) cancelled)", len(active))
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def sse_stream(job: Job, last_event_id: int = 0, poll_seconds: "float | None" = None):
+    """Yield Server-Sent-Events strings for events after ``last_event_id`` until the job closes.
+
+    Each event carries its ``id:`` so a reconnecting browser resumes where it
+    left off; idle periods are bridged by keep-alive comments. Any number of
+    streams may follow the same job. With ``poll_seconds`` only the events
+    already there are sent and the browser is told to reconnect after that many
+    seconds, so the request doesn't hold a server thread (see :mod:`.events`).
+    """
+    if poll_seconds is not None:
+        yield f"retry: {int(poll_seconds * 1000)}\n\n"
+        for last_event_id, data in job.events_after(last_event_id, timeout=0):
+            yield f"id: {last_event_id}\ndata: {data}\n\n"
+        return
+    while True:
+        events = job.events_after(last_event_id, timeout=KEEPALIVE_SECONDS)
+        for last_event_id, data in events:
+            yield f"id: {last_event_id}\ndata: {data}\n\n"
+        if not events:
+            if job.closed:
+                return
+            yield ": keep-alive\n\n"
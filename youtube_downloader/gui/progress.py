@@ -0,0 +1,62 @@
+"""Rate-limited progress reporting for GUI jobs.
+
+yt-dlp calls the progress hook after every chunk or fragment — dozens of times
+a second per download. Pushing each call into the job's event queue meant JSON
+encoding every one of them into the SSE stream, and with several jobs running
+the queues grew faster than browsers drained them, although a progress bar
+only needs a few updates a second.
+
+:class:`ProgressChannel` sits between the hook and :meth:`Job.emit`: progress
+updates are coalesced per stream (a playlist's parallel videos are separate
+streams), latest value wins, and the latest update of each stream reaches the
+job at most ``rate`` times per second. Anything that isn't a plain progress
+update — ``finished``, a status message — is forwarded at once, after any
+progress still pending for other streams, so the order of state changes is
+preserved.
+"""
+
+import threading
+import time
+
+
+class ProgressChannel:
+    """Coalesces ``progress`` events for one job; ``rate`` <= 0 disables coalescing."""
+
+    def __init__(self, job, rate: float = 4.0, clock=time.monotonic) -> None:
+        self.job = job
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.clock = clock
+        self._pending: "dict[object, dict]" = {}
+        self._last_flush = float('-inf')
+        self._lock = threading.Lock()
+
+    def progress(self, key=None, **event) -> None:
+        """Queue a progress update for stream ``key``; emitted at most ``rate`` times a second."""
+        if not self.interval:
+            self.job.emit(**event)
+            return
+        with self._lock:
+            self._pending[key] = event
+            now = self.clock()
+            if now - self._last_flush < self.interval:
+                return
+            self._last_flush = now
+            pending, self._pending = self._pending, {}
+        for update in pending.values():
+            self.job.emit(**update)
+
+    def status(self, key=None, **event) -> None:
+        """Forward a state change immediately; it supersedes ``key``'s pending progress."""
+        with self._lock:
+            self._pending.pop(key, None)
+            pending, self._pending = self._pending, {}
+        for update in pending.values():
+            self.job.emit(**update)
+        self.job.emit(**event)
+
+    def flush(self) -> None:
+        """Emit whatever progress is still pending."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for update in pending.values():
+            self.job.emit(**update)
@@ -0,0 +1,295 @@
+"""Global download scheduler shared by every GUI download job.
+
+Instead of every ``/api/download-*`` request starting its own unbounded thread,
+jobs are submitted here and at most ``max_concurrent`` of them run at once. The
+rest wait in a queue ordered by priority (higher first) and, within a priority,
+by submission time — so playlists queued one after another start in FIFO order.
+
+Started jobs run on the shared job executor (see :func:`jobs.executor`), whose
+``max_job_workers`` threads also cap ``max_concurrent``. On the way down,
+:meth:`drain` stops taking jobs and lets the running ones finish, and
+:meth:`shutdown` cancels whatever is left.
+
+Queued jobs can be paused (skipped until resumed), resumed, or cancelled. A
+running job can be paused too: its progress hook blocks in
+:meth:`Job.wait_if_paused` until it is resumed. Cancelling a running job sets
+its cancel token; the download stops at its next check and the job ends as
+``cancelled``. Whenever the queue changes, each waiting job whose position or
+estimated start time (based on how long finished jobs have taken so far) has
+changed is told the new values.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+from ..settings import get_settings
+from . import jobs
+
+logger = logging.getLogger(__name__)
+
+# Assumed job duration (seconds) until a real one has been measured.
+_DEFAULT_JOB_SECONDS = 120.0
+# Shift of a job's estimated start time (seconds) worth a new ``queued`` event.
+_ETA_TOLERANCE_SECONDS = 10.0
+
+
+class DownloadScheduler:
+    """Runs submitted jobs with one global concurrency limit."""
+
+    def __init__(self, max_concurrent: int = 2) -> None:
+        self.max_concurrent = self._clamp(max_concurrent)
+        self._lock = threading.Lock()
+        self._queue: "list[tuple[int, int, jobs.Job]]" = []  # (-priority, seq, job) heap
+        self._targets: "dict[str, object]" = {}
+        self._running: "dict[str, float]" = {}  # job id -> start time
+        self._seq = itertools.count()
+        self._avg_seconds: "float | None" = None
+        self._finished = 0
+        self._closed = False
+        self._idle = threading.Condition(self._lock)
+        # job id -> (position, paused, starts_at) last sent in a ``queued`` event
+        self._announced: "dict[str, tuple[int, bool, float | None]]" = {}
+        self._announce_lock = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    # Submission and dispatch
+    # ------------------------------------------------------------------ #
+    def submit(self, job: "jobs.Job", target) -> None:
+        """Queue ``target(job)``; it starts as soon as a slot is free.
+
+        Once the scheduler is draining or shut down the job is cancelled at once.
+        """
+        with self._lock:
+            closed = self._closed
+            if closed:
+                job.state = jobs.CANCELLED
+            else:
+                job.state = jobs.QUEUED
+                heapq.heappush(self._queue, (-job.priority, next(self._seq), job))
+                self._targets[job.id] = target
+        if closed:
+            logger.info("Refused job %s: server is shutting down", job.id)
+            job.emit(type='cancelled', message='Server is shutting down')
+            job.close()
+            return
+        logger.info("Queued job %s (priority %d)", job.id, job.priority)
+        self._dispatch()
+
+    @staticmethod
+    def _clamp(value: int) -> int:
+        """Keep the limit between 1 and the executor's worker count."""
+        return max(1, min(int(value), get_settings().max_job_workers))
+
+    def set_max_concurrent(self, value: int) -> None:
+        with self._lock:
+            self.max_concurrent = self._clamp(value)
+        logger.info("Scheduler concurrency set to %d", self.max_concurrent)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while slots are free, then refresh queue positions."""
+        started = []
+        with self._lock:
+            skipped = []
+            while self._queue and len(self._running) < self.max_concurrent:
+                entry = heapq.heappop(self._queue)
+                job = entry[2]
+                if job.paused:
+                    skipped.append(entry)
+                    continue
+                job.state = jobs.RUNNING
+                self._running[job.id] = time.monotonic()
+                started.append((job, self._targets.pop(job.id)))
+            for entry in skipped:
+                heapq.heappush(self._queue, entry)
+
+        for job, target in started:
+            logger.info("Starting job %s", job.id)
+            job.emit(type='status', message='Starting…')
+            jobs.executor().submit(self._run, job, target)
+        self._announce_positions()
+
+    def _run(self, job: "jobs.Job", target) -> None:
+        try:
+            jobs.run_job(job, target)
+        finally:
+            with self._lock:
+                started = self._running.pop(job.id, None)
+                if started is not None:
+                    self._record_duration(time.monotonic() - started)
+                if job.state == jobs.RUNNING:
+                    job.state = jobs.DONE
+                self._idle.notify_all()
+            self._dispatch()
+
+    def _record_duration(self, seconds: float) -> None:
+        self._finished += 1
+        if self._avg_seconds is None:
+            self._avg_seconds = seconds
+        else:  # running mean
+            self._avg_seconds += (seconds - self._avg_seconds) / self._finished
+
+    # ------------------------------------------------------------------ #
+    # Pause / resume / cancel
+    # ------------------------------------------------------------------ #
+    def pause(self, job: "jobs.Job") -> bool:
+        """Pause a queued or running job; False if it has already finished."""
+        with self._lock:
+            if job.state not in (jobs.QUEUED, jobs.RUNNING):
+                return False
+            job.pause()
+        job.emit(type='status', message='Paused', state='paused')
+        logger.info("Paused job %s", job.id)
+        self._announce_positions()
+        return True
+
+    def resume(self, job: "jobs.Job") -> bool:
+        with self._lock:
+            if not job.paused:
+                return False
+            job.resume()
+        job.emit(type='status', message='Resumed', state=job.state)
+        logger.info("Resumed job %s", job.id)
+        self._dispatch()
+        return True
+
+    def cancel(self, job: "jobs.Job") -> bool:
+        """Cancel a queued or running job; False if it has already finished.
+
+        A queued job is dropped at once. A running one is only asked to stop:
+        it ends as ``cancelled`` when its download notices the token.
+        """
+        with self._lock:
+            entries = [entry for entry in self._queue if entry[2] is job]
+            if entries:
+                self._queue.remove(entries[0])
+                heapq.heapify(self._queue)
+                self._targets.pop(job.id, None)
+                job.state = jobs.CANCELLED
+            elif job.state != jobs.RUNNING or job.cancelled:
+                return False
+        if not entries:
+            job.cancel()
+            logger.info("Cancelling running job %s", job.id)
+            job.emit(type='status', message='Cancelling…')
+            return True
+        logger.info("Cancelled queued job %s", job.id)
+        job.emit(type='cancelled', message='Cancelled before it started')
+        job.close()
+        self._announce_positions()
+        return True
+
+    def drain(self, timeout: float) -> bool:
+        """Stop taking jobs, drop the queued ones, and wait for the running ones.
+
+        Returns True once nothing is running, False if ``timeout`` seconds
+        passed first (a paused job, for instance, never finishes by itself).
+        """
+        with self._lock:
+            self._closed = True
+            queued = [entry[2] for entry in self._queue]
+        for job in queued:
+            self.cancel(job)
+        logger.info("Draining scheduler: %d queued job(s) dropped, %d running",
+                    len(queued), len(self._running))
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._running, timeout)
+
+    @property
+    def running_count(self) -> int:
+        with self._lock:
+            return len(self._running)
+
+    def shutdown(self) -> None:
+        """Drop every queued job and cancel the running ones (on server exit)."""
+        with self._lock:
+            self._closed = True
+            queued = [entry[2] for entry in self._queue]
+        for job in queued:
+            self.cancel(job)
+        for job in jobs.registry.list():
+            if job.id in self._running:
+                job.cancel()
+        logger.info("Scheduler shut down (%d queued job(s) dropped)", len(queued))
+
+    # ------------------------------------------------------------------ #
+    # Queue reporting
+    # ------------------------------------------------------------------ #
+    def _estimates(self) -> "list[tuple[jobs.Job, int, float | None]]":
+        """``(job, position, estimated start in seconds)`` for each queued job.
+
+        Simulates the queue: each running job frees its slot after the average
+        job duration (minus the time it has already run), and each queued job
+        takes the earliest free slot. Paused jobs keep their position but get no
+        estimate.
+        """
+        with self._lock:
+            queued = [entry[2] for entry in sorted(self._queue)]
+            now = time.monotonic()
+            average = self._avg_seconds or _DEFAULT_JOB_SECONDS
+            slots = sorted(max(0.0, average - (now - start)) for start in self._running.values())
+            slots += [0.0] * max(0, self.max_concurrent - len(slots))
+            known_average = self._avg_seconds is not None
+
+        estimates = []
+        for position, job in enumerate(queued, start=1):
+            if job.paused:
+                estimates.append((job, position, None))
+                continue
+            slots.sort()
+            start_in = slots[0]
+            slots[0] = start_in + average
+            estimates.append((job, position, start_in if known_average else None))
+        return estimates
+
+    @staticmethod
+    def _changed(last: "tuple[int, bool, float | None] | None",
+                 current: "tuple[int, bool, float | None]") -> bool:
+        """Whether ``current`` differs enough from the ``last`` announcement to send."""
+        if last is None or last[:2] != current[:2] or (last[2] is None) != (current[2] is None):
+            return True
+        return current[2] is not None and abs(current[2] - last[2]) > _ETA_TOLERANCE_SECONDS
+
+    def _announce_positions(self) -> None:
+        """Send a ``queued`` event to each waiting job whose position or ETA changed.
+
+        Sending every waiting job an event on every queue change would cost
+        O(n²) events for n queued jobs, each stored in the job's ring buffer.
+        """
+        with self._announce_lock:
+            now = time.time()
+            announced = {}
+            for job, position, start_in in self._estimates():
+                starts_at = None if start_in is None else now + start_in
+                current = (position, job.paused, starts_at)
+                last = self._announced.get(job.id)
+                if not self._changed(last, current):
+                    announced[job.id] = last
+                    continue
+                announced[job.id] = current
+                job.emit(
+                    type='queued',
+                    position=position,
+                    eta_seconds=None if start_in is None else round(start_in),
+                    starts_at=None if starts_at is None else round(starts_at),
+                    paused=job.paused,
+                )
+            self._announced = announced
+
+    def snapshot(self) -> dict:
+        """Current limits, running jobs, and the queue (for ``/api/scheduler``)."""
+        estimates = self._estimates()
+        with self._lock:
+            running = list(self._running)
+        return {
+            'max_concurrent': self.max_concurrent,
+            'running': running,
+            'queued': [
+                {'job_id': job.id, 'position': position, 'priority': job.priority,
+                 'paused': job.paused, 'eta_seconds': None if eta is None else round(eta)}
+                for job, position, eta in estimates
+            ],
+        }
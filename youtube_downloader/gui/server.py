@@ -1,23 +1,33 @@
 """Flask server exposing the download workflows to the browser UI."""
 
+import contextlib
 import dataclasses
+import importlib.util
 import logging
 import os
+import signal
 import socket
 import threading
 import webbrowser
 
 from flask import Flask, Response, jsonify, request, send_from_directory
 
+from ..bandwidth import JobBandwidth, default_limiter
+from ..disk_space import free_bytes
 from ..filesystem import open_folder, pick_folder
+from ..format_profiles import DEFAULT_PROFILE, PROFILES, estimate_video_size
 from ..interfaces import InfoProvider, SubtitleService
 from ..logging_config import LOG_FILE, clear_logs
 from ..metadata import get_metadata
-from ..models import PlaylistDownloadOptions, VideoDownloadOptions
+from ..models import BatchDownloadOptions, PlaylistDownloadOptions, VideoDownloadOptions
 from ..paths import resource_path
+from ..settings import get_settings
 from ..update_checker import check_for_update
 from ..workflows import DownloadWorkflows
 from . import jobs
+from .events import POLL_SECONDS, hub
+from .progress import ProgressChannel
+from .scheduler import DownloadScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -28,31 +38,228 @@ _EMPTY = '(empty)'
 
 
 def _progress_hook(job: "jobs.Job"):
-    """Translate yt-dlp progress dicts into UI progress events."""
+    """Translate yt-dlp progress dicts into UI progress events.
+
+    The hook also blocks while ``job`` is paused, so pausing a running download
+    stalls yt-dlp between chunks until the job is resumed, and applies the
+    per-job bandwidth cap. Progress events carry the job's and the whole
+    process's throughput (``job_speed`` / ``global_speed``, bytes/s), and are
+    coalesced to ``progress_events_per_second`` per download (``finished`` is
+    always sent). In a batch job they also carry the batch ``item``.
+
+    ``hook.flush()`` emits the progress still held back by the coalescing; it
+    runs before the hook blocks on a pause, and :func:`_job_progress` calls it
+    when the work ends.
+    """
+    bandwidth = JobBandwidth(default_limiter)
+    channel = ProgressChannel(job, get_settings().progress_events_per_second)
+
     def hook(d: dict) -> None:
+        if job.paused:
+            channel.flush()
+        job.wait_if_paused()
         status = d.get('status')
         if status == 'downloading':
+            bandwidth.throttle(d.get('chunk_bytes', 0))
             total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
             downloaded = d.get('downloaded_bytes', 0)
             percent = (downloaded / total * 100) if total else 0
-            job.emit(
+            channel.progress(
+                key=(d.get('batch_item'), d.get('playlist_index')),
                 type='progress',
                 percent=round(percent, 1),
                 speed=d.get('speed'),
                 eta=d.get('eta'),
+                index=d.get('playlist_index'),
+                job_speed=bandwidth.meter.rate(),
+                global_speed=d.get('global_speed'),
+                **_batch_tag(d),
             )
         elif status == 'finished':
-            job.emit(type='progress', percent=100, stage='processing')
+            channel.status(key=(d.get('batch_item'), d.get('playlist_index')), type='progress',
+                           percent=100, stage='processing', index=d.get('playlist_index'),
+                           **_batch_tag(d))
+        elif status == 'error':
+            channel.flush()
+
+    hook.flush = channel.flush
     return hook
 
 
+@contextlib.contextmanager
+def _job_progress(job: "jobs.Job"):
+    """A :func:`_progress_hook` for ``job`` whose pending progress is flushed on exit.
+
+    The flush runs however the work ends, so the last progress sample is sent
+    before the job's ``done`` / ``error`` / ``cancelled`` event.
+    """
+    hook = _progress_hook(job)
+    try:
+        yield hook
+    finally:
+        hook.flush()
+
+
+def _batch_tag(d: dict) -> dict:
+    """``{'item': n}`` for progress from batch item ``n``, else nothing."""
+    return {} if d.get('batch_item') is None else {'item': d['batch_item']}
+
+
+def _playlist_callbacks(job: "jobs.Job", progress_hook=None, item: "int | None" = None):
+    """``(on_video, on_video_result)`` callbacks that report playlist progress to ``job``.
+
+    Each video's result first flushes ``progress_hook``'s pending progress, so a
+    video that failed mid-download doesn't leave a stale percentage behind.
+    With ``item`` (a batch item index) every event also carries it.
+    """
+    tag = {} if item is None else {'item': item}
+
+    def on_video(index: int, total: int, title: str) -> None:
+        job.emit(type='video', index=index, total=total, title=title, **tag)
+
+    def on_video_result(index, total, video, title, save_path, outcome) -> None:
+        if progress_hook is not None:
+            progress_hook.flush()
+        job.emit(
+            type='video_result',
+            index=index, total=total, title=title,
+            url=video.url, id=video.id, save_path=save_path,
+            success=bool(outcome), error=getattr(outcome, 'error', ''),
+            attempts=len(getattr(outcome, 'attempts', [])),
+            permanent=getattr(outcome, 'permanent', False),
+            skipped=getattr(outcome, 'skipped', False),
+            **tag,
+        )
+
+    return on_video, on_video_result
+
+
+def _batch_callbacks(job: "jobs.Job", progress_hook=None):
+    """``(on_item, on_item_result, on_video, on_video_result)`` reporting a batch to ``job``.
+
+    Every event carries the batch ``item`` it belongs to; results flush
+    ``progress_hook`` first, as in :func:`_playlist_callbacks`.
+    """
+    def on_item(index: int, total: int, item, stage: str) -> None:
+        job.emit(type='batch_item', item=index, total=total, stage=stage,
+                 kind=item.kind, url=item.url, title=item.title)
+
+    def on_item_result(index: int, total: int, item) -> None:
+        if progress_hook is not None:
+            progress_hook.flush()
+        job.emit(type='batch_item_result', item=index, total=total, **_batch_item_summary(item))
+
+    def on_batch_video(item_index: int, *args) -> None:
+        _playlist_callbacks(job, progress_hook, item_index)[0](*args)
+
+    def on_batch_video_result(item_index: int, *args) -> None:
+        _playlist_callbacks(job, progress_hook, item_index)[1](*args)
+
+    return on_item, on_item_result, on_batch_video, on_batch_video_result
+
+
+def _batch_item_summary(item) -> dict:
+    """The JSON fields describing one batch item's outcome."""
+    return {
+        'index': item.index,
+        'url': item.url,
+        'kind': item.kind,
+        'title': item.title,
+        'success': item.success,
+        'error': item.error,
+        'output_path': item.output_path,
+        'failed_videos': item.failed_videos,
+        'duplicate_of': item.duplicate_of,
+    }
+
+
+def _parallel_downloads(data: dict) -> "int | None":
+    """The request's ``parallel_downloads`` (``None`` -> settings default)."""
+    try:
+        return max(1, int(data['parallel_downloads']))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _priority(data: dict) -> int:
+    """The request's scheduling ``priority`` (higher starts first; default 0)."""
+    try:
+        return int(data.get('priority', 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _format_profile(data: dict) -> str:
+    """The request's ``format_profile`` (unknown or missing -> the default profile)."""
+    name = data.get('format_profile')
+    return name if name in PROFILES else DEFAULT_PROFILE
+
+
+def _profile_sizes(video) -> "dict[str, int]":
+    """Estimated bytes per format profile, for the size shown next to the profile picker."""
+    return {name: estimate_video_size(video, name) for name in PROFILES}
+
+
+def _lazy_playlists() -> bool:
+    """Whether playlists are listed flat and resolved per video on demand."""
+    return get_settings().lazy_playlists
+
+
+def _video_summary(index: int, video) -> dict:
+    """The per-video fields the playlist list renders."""
+    return {
+        'index': index,
+        'url': video.url,
+        'title': video.title,
+        'length': video.length,
+        'thumbnail': video.thumbnail,
+        'chapters': len(video.chapters),
+        'resolved': video.resolved,
+        'profile_sizes': _profile_sizes(video),
+    }
+
+
+def _playlist_summary(info) -> dict:
+    """JSON body describing a resolved playlist (``index`` is the download index)."""
+    return {
+        'title': info.title,
+        'number_videos': info.number_videos,
+        'length': info.length,
+        'transcript_list': info.transcript_list,
+        'failed_entries': info.failed_entries,
+        'videos': [_video_summary(i + 1, v) for i, v in enumerate(info.videos_info)],
+    }
+
+
+def _playlist_subtitles(subtitle_service: SubtitleService, info) -> "list[str]":
+    """Subtitle languages of the first playlist video that has any."""
+    for video in info.videos_info:
+        langs = subtitle_service.list_available(video.id)
+        if langs:
+            return langs
+    return []
+
+
 def create_app(
     info_provider: InfoProvider,
     subtitle_service: SubtitleService,
     workflows: DownloadWorkflows,
+    scheduler: "DownloadScheduler | None" = None,
 ) -> Flask:
-    """Build the Flask app wired to the injected services."""
+    """Build the Flask app wired to the injected services.
+
+    Download jobs go through ``scheduler`` (a new one sized by the
+    ``max_concurrent_jobs`` setting by default), so only a bounded number run
+    at once and the rest wait in a priority queue. The scheduler is kept in
+    ``app.extensions['download_scheduler']``. With ``app.config['EVENT_STREAM_POLL']``
+    set (waitress, see :func:`_serve_waitress`) progress streams are answered as
+    polls instead of held open.
+    """
     app = Flask(__name__, static_folder=None)
+    app.config['EVENT_STREAM_POLL'] = False
+    if scheduler is None:
+        scheduler = DownloadScheduler(get_settings().max_concurrent_jobs)
+    app.extensions['download_scheduler'] = scheduler
 
     # ------------------------------------------------------------------ #
     # Static UI
@@ -80,6 +287,8 @@ def create_app(
     def api_metadata():
         meta = dict(get_metadata())
         meta['default_save_path'] = DEFAULT_SAVE_PATH
+        meta['format_profiles'] = [{'name': p.name, 'label': p.label} for p in PROFILES.values()]
+        meta['default_format_profile'] = DEFAULT_PROFILE
         return jsonify(meta)
 
     @app.get('/api/check-update')
@@ -126,51 +335,68 @@ def create_app(
     # ------------------------------------------------------------------ #
     @app.post('/api/video-info')
     def api_video_info():
-        url = (request.get_json(silent=True) or {}).get('url', '').strip()
+        data = request.get_json(silent=True) or {}
+        url = data.get('url', '').strip()
         logger.info("GUI request: video-info %s", url or _EMPTY)
         if not url:
             return jsonify({'error': 'No URL provided'}), 400
         try:
+            if data.get('refresh'):
+                info_provider.invalidate(url)
             info = info_provider.get_video_info(url)
             info.transcript_list = subtitle_service.list_available(info.id)
-            return jsonify({**dataclasses.asdict(info), 'length': info.length})
+            return jsonify({
+                **dataclasses.asdict(info), 'length': info.length, 'profile_sizes': _profile_sizes(info),
+            })
         except Exception as e:  # noqa: BLE001
             return jsonify({'error': str(e)}), 500
 
     @app.post('/api/playlist-info')
     def api_playlist_info():
-        url = (request.get_json(silent=True) or {}).get('url', '').strip()
+        data = request.get_json(silent=True) or {}
+        url = data.get('url', '').strip()
         logger.info("GUI request: playlist-info %s", url or _EMPTY)
         if not url:
             return jsonify({'error': 'No URL provided'}), 400
         try:
-            info = info_provider.get_playlist_info(url)
-            transcript_list = []
-            for video in info.videos_info:
-                langs = subtitle_service.list_available(video.id)
-                if langs:
-                    transcript_list = langs
-                    break
-            info.transcript_list = transcript_list
-            return jsonify({
-                'title': info.title,
-                'number_videos': info.number_videos,
-                'length': info.length,
-                'transcript_list': info.transcript_list,
-                'videos': [
-                    {
-                        'index': i + 1,
-                        'title': v.title,
-                        'length': v.length,
-                        'thumbnail': v.thumbnail,
-                        'chapters': len(v.chapters),
-                    }
-                    for i, v in enumerate(info.videos_info)
-                ],
-            })
+            if data.get('refresh'):
+                info_provider.invalidate(url)
+            info = info_provider.get_playlist_info(url, lazy=_lazy_playlists())
+            info.transcript_list = _playlist_subtitles(subtitle_service, info)
+            return jsonify(_playlist_summary(info))
         except Exception as e:  # noqa: BLE001
             return jsonify({'error': str(e)}), 500
 
+    @app.post('/api/playlist-info/stream')
+    def api_playlist_info_stream():
+        """Resolve a playlist in the background, streaming each video over SSE.
+
+        Returns a job id right away; ``/api/progress/<job_id>`` then yields a
+        ``video_info`` event per resolved video (playlist position, title, length,
+        thumbnail, chapter count) and a final ``done`` event with the totals.
+        """
+        data = request.get_json(silent=True) or {}
+        url = data.get('url', '').strip()
+        if not url:
+            return jsonify({'error': 'No URL provided'}), 400
+        job = jobs.create_job()
+        logger.info("GUI request: playlist-info stream %s (job %s)", url, job.id)
+
+        def runner(job: "jobs.Job") -> None:
+            if data.get('refresh'):
+                info_provider.invalidate(url)
+
+            def on_video(position: int, total: int, video) -> None:
+                job.cancel_token.raise_if_cancelled()
+                job.emit(type='video_info', total=total, **_video_summary(position, video))
+
+            info = info_provider.get_playlist_info(url, on_video=on_video, lazy=_lazy_playlists())
+            info.transcript_list = _playlist_subtitles(subtitle_service, info)
+            job.emit(type='done', **_playlist_summary(info))
+
+        jobs.run_in_background(job, runner)
+        return jsonify({'job_id': job.id})
+
     # ------------------------------------------------------------------ #
     # Downloads (background jobs + SSE progress)
     # ------------------------------------------------------------------ #
@@ -182,14 +408,18 @@ def create_app(
             save_path=data.get('save_path') or DEFAULT_SAVE_PATH,
             subtitle_language=data.get('subtitle_language') or None,
             split_chapters=bool(data.get('split_chapters')),
+            format_profile=_format_profile(data),
         )
-        job = jobs.create_job()
+        job = jobs.create_job(priority=_priority(data))
         logger.info("GUI request: download-video %s (job %s)", url or _EMPTY, job.id)
 
         def runner(job: "jobs.Job") -> None:
-            info = info_provider.get_video_info(url)
+            info = info_provider.get_video_info(url, for_download=True)
             job.emit(type='status', message=f'Downloading: {info.title}')
-            result = workflows.download_video(info, options, progress_hook=_progress_hook(job))
+            job.cancel_token.raise_if_cancelled()
+            with _job_progress(job) as hook:
+                result = workflows.download_video(info, options, progress_hook=hook,
+                                                  cancel_token=job.cancel_token)
             job.emit(
                 type='done',
                 output_path=result.output_path,
@@ -198,7 +428,7 @@ def create_app(
                 failed_videos=[],
             )
 
-        jobs.run_in_thread(job, runner)
+        scheduler.submit(job, runner)
         return jsonify({'job_id': job.id})
 
     @app.post('/api/download-playlist')
@@ -214,33 +444,111 @@ def create_app(
             subtitle_language=data.get('subtitle_language') or None,
             numerate=bool(data.get('numerate')),
             selected_indices=selected_indices,
+            parallel_downloads=_parallel_downloads(data),
+            format_profile=_format_profile(data),
         )
-        job = jobs.create_job()
+        job = jobs.create_job(priority=_priority(data))
         logger.info("GUI request: download-playlist %s (job %s)", url or _EMPTY, job.id)
 
         def runner(job: "jobs.Job") -> None:
-            info = info_provider.get_playlist_info(url)
+            info = info_provider.get_playlist_info(url, lazy=_lazy_playlists())
+            with _job_progress(job) as hook:
+                on_video, on_video_result = _playlist_callbacks(job, hook)
+                result = workflows.download_playlist(
+                    info, options, on_video=on_video, on_video_result=on_video_result,
+                    progress_hook=hook, cancel_token=job.cancel_token,
+                )
+            job.emit(type='done', output_path=result.output_path, failed_videos=result.failed_videos)
 
-            def on_video(index: int, total: int, title: str) -> None:
-                job.emit(type='video', index=index, total=total, title=title)
+        scheduler.submit(job, runner)
+        return jsonify({'job_id': job.id})
 
-            def on_video_result(index, total, video, title, save_path, outcome) -> None:
-                job.emit(
-                    type='video_result',
-                    index=index, total=total, title=title,
-                    url=video.url, id=video.id, save_path=save_path,
-                    success=bool(outcome), error=getattr(outcome, 'error', ''),
-                )
+    @app.post('/api/sync-playlist')
+    def api_sync_playlist():
+        """Download only the playlist videos added since the last sync."""
+        data = request.get_json(silent=True) or {}
+        url = data.get('url', '').strip()
+        if not url:
+            return jsonify({'error': 'No URL provided'}), 400
+        options = PlaylistDownloadOptions(
+            save_path=data.get('save_path') or DEFAULT_SAVE_PATH,
+            subtitle_language=data.get('subtitle_language') or None,
+            numerate=bool(data.get('numerate')),
+            parallel_downloads=_parallel_downloads(data),
+            format_profile=_format_profile(data),
+        )
+        job = jobs.create_job(priority=_priority(data))
+        logger.info("GUI request: sync-playlist %s (job %s)", url, job.id)
 
-            result = workflows.download_playlist(
-                info, options, on_video=on_video, on_video_result=on_video_result,
-                progress_hook=_progress_hook(job),
+        def runner(job: "jobs.Job") -> None:
+            # A cached listing could predate the videos this sync is meant to find.
+            info_provider.invalidate(url)
+            info = info_provider.get_playlist_info(url, lazy=True)
+            with _job_progress(job) as hook:
+                on_video, on_video_result = _playlist_callbacks(job, hook)
+                result = workflows.sync_playlist(
+                    info, options, on_video=on_video, on_video_result=on_video_result,
+                    progress_hook=hook, cancel_token=job.cancel_token,
+                )
+            job.emit(
+                type='done', output_path=result.output_path,
+                failed_videos=result.failed_videos, new_videos=result.new_videos,
             )
-            job.emit(type='done', output_path=result.output_path, failed_videos=result.failed_videos)
 
-        jobs.run_in_thread(job, runner)
+        scheduler.submit(job, runner)
         return jsonify({'job_id': job.id})
 
+    @app.post('/api/batch-download')
+    def api_batch_download():
+        """Download many video and playlist URLs as one job with shared options.
+
+        ``urls`` is a list (or a whitespace-separated string) of links. The job
+        streams a ``batch_item`` event as each item is resolved and started, a
+        ``batch_item_result`` per item, the usual ``progress`` / ``video`` /
+        ``video_result`` events tagged with their ``item``, and a final ``done``
+        event with every item's outcome and the success/failure counts.
+        """
+        data = request.get_json(silent=True) or {}
+        urls = data.get('urls') or []
+        if isinstance(urls, str):
+            urls = urls.split()
+        urls = [url.strip() for url in urls if isinstance(url, str) and url.strip()]
+        if not urls:
+            return jsonify({'error': 'No URLs provided'}), 400
+        options = BatchDownloadOptions(
+            save_path=data.get('save_path') or DEFAULT_SAVE_PATH,
+            subtitle_language=data.get('subtitle_language') or None,
+            split_chapters=bool(data.get('split_chapters')),
+            numerate=bool(data.get('numerate')),
+            parallel_downloads=_parallel_downloads(data),
+            format_profile=_format_profile(data),
+        )
+        job = jobs.create_job(priority=_priority(data))
+        logger.info("GUI request: batch-download of %d URLs (job %s)", len(urls), job.id)
+
+        def runner(job: "jobs.Job") -> None:
+            job.emit(type='status', message=f'Resolving {len(urls)} URLs…')
+            with _job_progress(job) as hook:
+                on_item, on_item_result, on_video, on_video_result = _batch_callbacks(job, hook)
+                result = workflows.download_batch(
+                    urls, options, on_item=on_item, on_item_result=on_item_result,
+                    on_video=on_video, on_video_result=on_video_result,
+                    progress_hook=hook, cancel_token=job.cancel_token,
+                )
+            failed_videos = []
+            for item in result.failed:
+                if item.duplicate_of is None:
+                    failed_videos.append(f"{item.title or item.url}: {item.error}")
+                    failed_videos.extend(item.failed_videos)
+            job.emit(
+                type='done', output_path=options.save_path, failed_videos=failed_videos,
+                items=[_batch_item_summary(item) for item in result.items],
+                succeeded=len(result.succeeded), failed=len(result.failed),
+            )
+
+        scheduler.submit(job, runner)
+        return jsonify({'job_id': job.id, 'urls': len(urls)})
+
     @app.post('/api/retry-video')
     def api_retry_video():
         data = request.get_json(silent=True) or {}
@@ -249,33 +557,164 @@ def create_app(
         title = data.get('title') or ''
         save_path = data.get('save_path') or DEFAULT_SAVE_PATH
         subtitle_language = data.get('subtitle_language') or None
-        job = jobs.create_job()
+        job = jobs.create_job(priority=_priority(data))
         logger.info("GUI request: retry-video '%s' (job %s)", title or _EMPTY, job.id)
 
         def runner(job: "jobs.Job") -> None:
-            outcome = workflows.retry_video(
-                url, video_id, title, save_path, subtitle_language,
-                progress_hook=_progress_hook(job),
-            )
+            with _job_progress(job) as hook:
+                outcome = workflows.retry_video(
+                    url, video_id, title, save_path, subtitle_language,
+                    progress_hook=hook, format_profile=_format_profile(data),
+                    cancel_token=job.cancel_token,
+                )
             job.emit(
                 type='done', title=title, output_path=save_path,
                 success=bool(outcome), error=getattr(outcome, 'error', ''),
             )
 
-        jobs.run_in_thread(job, runner)
+        scheduler.submit(job, runner)
         return jsonify({'job_id': job.id})
 
+    @app.post('/api/disk-space')
+    def api_disk_space():
+        """Free bytes on the disk holding ``path`` (shown next to the size estimate)."""
+        data = request.get_json(silent=True) or {}
+        path = (data.get('path') or '').strip() or DEFAULT_SAVE_PATH
+        try:
+            return jsonify({'path': path, 'free_bytes': free_bytes(path)})
+        except OSError as e:  # noqa: BLE001
+            return jsonify({'error': str(e)}), 500
+
+    @app.get('/api/bandwidth')
+    def api_bandwidth():
+        return jsonify(default_limiter.limits())
+
+    @app.post('/api/bandwidth')
+    def api_bandwidth_update():
+        """Change the global and/or per-job download caps (KiB/s, 0 = unlimited)."""
+        data = request.get_json(silent=True) or {}
+        try:
+            global_kbps = data.get('global_kbps')
+            per_job_kbps = data.get('per_job_kbps')
+            default_limiter.set_limits(
+                None if global_kbps is None else float(global_kbps),
+                None if per_job_kbps is None else float(per_job_kbps),
+            )
+        except (TypeError, ValueError):
+            return jsonify({'error': 'global_kbps / per_job_kbps must be numbers'}), 400
+        logger.info("GUI request: bandwidth %s", data)
+        return jsonify(default_limiter.limits())
+
+    # ------------------------------------------------------------------ #
+    # Scheduler (queue inspection, pause / resume / cancel)
+    # ------------------------------------------------------------------ #
+    @app.get('/api/scheduler')
+    def api_scheduler():
+        return jsonify(scheduler.snapshot())
+
+    @app.post('/api/scheduler')
+    def api_scheduler_update():
+        """Change how many download jobs may run at once."""
+        data = request.get_json(silent=True) or {}
+        try:
+            scheduler.set_max_concurrent(int(data['max_concurrent']))
+        except (KeyError, TypeError, ValueError):
+            return jsonify({'error': 'max_concurrent must be an integer'}), 400
+        return jsonify(scheduler.snapshot())
+
+    @app.get('/api/jobs')
+    def api_jobs():
+        """Every job the server still remembers, plus registry totals (memory held in events).
+
+        ``?state=running`` (or any other state) filters the list.
+        """
+        state = request.args.get('state')
+        listed = [job.summary() for job in jobs.registry.list() if state is None or job.state == state]
+        return jsonify({'jobs': listed, **jobs.registry.stats()})
+
+    @app.get('/api/jobs/<job_id>')
+    def api_job(job_id: str):
+        job = jobs.get_job(job_id)
+        if job is None:
+            return jsonify({'error': 'Unknown job'}), 404
+        return jsonify(job.summary())
+
+    @app.post('/api/jobs/<job_id>/<action>')
+    def api_job_action(job_id: str, action: str):
+        job = jobs.get_job(job_id)
+        if job is None:
+            return jsonify({'error': 'Unknown job'}), 404
+        logger.info("GUI request: %s job %s", action, job_id)
+        if action == 'pause':
+            ok = scheduler.pause(job)
+        elif action == 'resume':
+            ok = scheduler.resume(job)
+        elif action == 'cancel':
+            ok = scheduler.cancel(job)
+        else:
+            return jsonify({'error': f'Unknown action: {action}'}), 404
+        if not ok:
+            return jsonify({'error': f'Cannot {action} a job that is {job.state}'}), 409
+        return jsonify({'ok': True, 'state': job.state, 'paused': job.paused})
+
     @app.get('/api/progress/<job_id>')
     def api_progress(job_id: str):
         job = jobs.get_job(job_id)
         if job is None:
             return jsonify({'error': 'Unknown job'}), 404
+        # EventSource sends Last-Event-ID when it reconnects; ?last_event_id= lets
+        # a fresh page pick up a job it already followed.
+        try:
+            last_event_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or 0)
+        except ValueError:
+            last_event_id = 0
+        poll_seconds = POLL_SECONDS if app.config['EVENT_STREAM_POLL'] else None
         return Response(
-            jobs.sse_stream(job),
+            jobs.sse_stream(job, last_event_id, poll_seconds),
             mimetype='text/event-stream',
             headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
         )
 
+    @app.get('/api/events')
+    def api_events():
+        """Every subscribed job's events for one page, multiplexed (see :mod:`.events`)."""
+        client_id = request.args.get('client', '').strip()
+        if not client_id:
+            return jsonify({'error': 'No client id provided'}), 400
+        try:
+            last_frame_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or 0)
+        except ValueError:
+            last_frame_id = 0
+        stream = hub.poll if app.config['EVENT_STREAM_POLL'] else hub.stream
+        return Response(
+            stream(client_id, last_frame_id or None),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+        )
+
+    @app.post('/api/events/<action>')
+    def api_events_subscription(action: str):
+        """Add a job to (``subscribe``) or drop it from (``unsubscribe``) a page's stream."""
+        data = request.get_json(silent=True) or {}
+        client_id = (data.get('client') or '').strip()
+        job_id = data.get('job_id') or ''
+        if not client_id:
+            return jsonify({'error': 'No client id provided'}), 400
+        if action == 'unsubscribe':
+            hub.unsubscribe(client_id, job_id)
+            return jsonify({'ok': True})
+        if action != 'subscribe':
+            return jsonify({'error': f'Unknown action: {action}'}), 404
+        job = jobs.get_job(job_id)
+        if job is None:
+            return jsonify({'error': 'Unknown job'}), 404
+        try:
+            last_event_id = int(data.get('last_event_id') or 0)
+        except (TypeError, ValueError):
+            last_event_id = 0
+        hub.subscribe(client_id, job, last_event_id)
+        return jsonify({'ok': True})
+
     # ------------------------------------------------------------------ #
     # Folder helpers
     # ------------------------------------------------------------------ #
@@ -293,23 +732,153 @@ def create_app(
     return app
 
 
-def _free_port() -> int:
-    """Find a free localhost TCP port."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(('127.0.0.1', 0))
+def _free_port(host: str = '127.0.0.1') -> int:
+    """Find a free TCP port on ``host`` (an IPv4 or IPv6 address or name)."""
+    family, _, _, _, address = socket.getaddrinfo(host, 0, type=socket.SOCK_STREAM)[0]
+    with socket.socket(family, socket.SOCK_STREAM) as s:
+        s.bind(address)
         return s.getsockname()[1]
 
 
+_SERVERS = ('threaded', 'waitress', 'asgi')
+
+
+def _server_mode(headless: bool) -> str:
+    """The ``gui_server`` setting, with Flask's development server swapped for waitress when headless.
+
+    ``asgi`` without uvicorn installed falls back to the default server, with a
+    message saying how to get it.
+    """
+    mode = get_settings().gui_server
+    if mode not in _SERVERS:
+        logger.warning("Unknown gui_server %r; using threaded", mode)
+        mode = 'threaded'
+    if mode == 'asgi' and importlib.util.find_spec('uvicorn') is None:
+        logger.warning('gui_server "asgi" needs uvicorn, which is not installed; using threaded')
+        print('The "asgi" GUI server needs uvicorn (pip install uvicorn); '
+              'falling back to the default server.')
+        mode = 'threaded'
+    if headless and mode == 'threaded':
+        mode = 'waitress'
+    return mode
+
+
+def _serve_waitress(app: Flask, host: str, port: int) -> None:
+    """Serve ``app`` with waitress (a production WSGI server) until interrupted.
+
+    An open progress stream would hold one of the ``gui_server_threads`` workers
+    for as long as the page stays open, so here the streams are answered as
+    short polls (``EVENT_STREAM_POLL``, see :mod:`.events`) and no worker waits
+    on an idle tab.
+    """
+    try:
+        from waitress import serve
+    except ImportError as e:
+        raise RuntimeError('The "waitress" GUI server needs waitress: pip install waitress') from e
+    settings = get_settings()
+    threads = max(1, settings.gui_server_threads)
+    app.config['EVENT_STREAM_POLL'] = True
+    logger.info("Serving the GUI with waitress on %s:%d (%d threads, %d connections max)",
+                host, port, threads, settings.gui_connection_limit)
+    serve(app, host=host, port=port, threads=threads,
+          connection_limit=settings.gui_connection_limit, ident='youtube-downloader')
+
+
+def _drain(scheduler: DownloadScheduler, signum: int) -> None:
+    """Stop new downloads and wait for the running ones (up to ``gui_drain_seconds``).
+
+    Called on the first shutdown signal while the server is still serving, so
+    clients keep following their jobs until they finish.
+    """
+    timeout = get_settings().gui_drain_seconds
+    running = scheduler.running_count
+    logger.info("Received signal %d; draining %d running job(s)", signum, running)
+    print(f"Shutting down: waiting for {running} running download(s) "
+          f"(up to {timeout:g} s); press Ctrl+C again to stop now")
+    if scheduler.drain(timeout):
+        logger.info("All running jobs finished; stopping the server")
+    else:
+        logger.warning("Jobs still running after %ss; cancelling them", timeout)
+
+
+def _drain_on_signal(scheduler: DownloadScheduler) -> None:
+    """Make SIGINT / SIGTERM drain running jobs before the server stops.
+
+    The first signal stops new downloads and drops queued ones while the
+    server keeps streaming progress; once the running jobs finish (or
+    ``gui_drain_seconds`` pass) the server is stopped. A second signal stops
+    it at once. Must be called from the main thread.
+    """
+    draining = threading.Event()
+
+    def drain(signum: int) -> None:
+        _drain(scheduler, signum)
+        signal.raise_signal(signal.SIGINT)
+
+    def on_signal(signum, frame) -> None:
+        if draining.is_set():
+            raise KeyboardInterrupt
+        draining.set()
+        threading.Thread(target=drain, args=(signum,), name='drain', daemon=True).start()
+
+    signal.signal(signal.SIGINT, on_signal)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, on_signal)
+
+
 def run_gui(
     info_provider: InfoProvider,
     subtitle_service: SubtitleService,
     workflows: DownloadWorkflows,
+    headless: bool = False,
+    host: "str | None" = None,
+    port: "int | None" = None,
 ) -> None:
-    """Start the web server and open the app in the default browser."""
+    """Start the web server and, unless ``headless``, open the app in the browser.
+
+    ``host`` / ``port`` default to the ``gui_host`` / ``gui_port`` settings
+    (port ``0`` picks a free one). The ``gui_server`` setting picks the server:
+    ``threaded`` (Flask's development server, one thread per connection),
+    ``waitress`` (production WSGI server with ``gui_server_threads`` threads
+    and ``gui_connection_limit`` connections; progress streams are polled) or ``asgi`` (uvicorn; SSE streams
+    share one event loop, see :mod:`.asgi`). Headless mode never uses the
+    development server and drains running jobs on shutdown.
+    """
+    settings = get_settings()
     app = create_app(info_provider, subtitle_service, workflows)
-    port = _free_port()
-    url = f'http://127.0.0.1:{port}/'
-    logger.info("Starting GUI server at %s", url)
-    threading.Timer(1.0, lambda: webbrowser.open(url)).start()
-    print(f"Youtube Downloader GUI running at {url}  (press Ctrl+C to stop)")
-    app.run(host='127.0.0.1', port=port, threaded=True)
+    scheduler = app.extensions['download_scheduler']
+    mode = _server_mode(headless)
+    host = host or settings.gui_host
+    port = port or settings.gui_port or _free_port(host)
+    browse_host = '127.0.0.1' if host in ('0.0.0.0', '::') else host
+    url = f"http://{f'[{browse_host}]' if ':' in browse_host else browse_host}:{port}/"
+    logger.info("Starting GUI server (%s%s) at %s (bound to %s)",
+                mode, ', headless' if headless else '', url, host)
+    if headless:
+        print(f"Youtube Downloader server listening on {host}:{port}  (press Ctrl+C to stop)")
+    else:
+        threading.Timer(1.0, lambda: webbrowser.open(url)).start()
+        print(f"Youtube Downloader GUI running at {url}  (press Ctrl+C to stop)")
+    try:
+        if mode == 'asgi':
+            # Imported lazily: only this mode needs uvicorn.
+            from .asgi import GuiAsgiApp, run_asgi
+
+            # uvicorn owns the signal handlers; it drains before it stops serving.
+            run_asgi(GuiAsgiApp(app), host, port,
+                     limit_concurrency=settings.gui_connection_limit if headless else None,
+                     drain=(lambda signum: _drain(scheduler, signum)) if headless else None)
+        else:
+            if headless:
+                _drain_on_signal(scheduler)
+            if mode == 'waitress':
+                _serve_waitress(app, host, port)
+            else:
+                app.run(host=host, port=port, threaded=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Stop whatever is still queued or running rather than wait for it.
+        scheduler.shutdown()
+        jobs.shutdown()
+        logger.info("GUI server stopped")
@@ -16,6 +16,13 @@ function fmtSpeed(bytesPerSec) {
     return mb >= 1 ? `${mb.toFixed(1)} MB/s` : `${(bytesPerSec / 1024).toFixed(0)} KB/s`;
 }
 
+// Format a byte count, e.g. "1.4 GB" / "350 MB".
+function fmtBytes(bytes) {
+    if (!bytes) return "";
+    const gb = bytes / 1e9;
+    return gb >= 1 ? `${gb.toFixed(1)} GB` : `${Math.max(1, Math.round(bytes / 1e6))} MB`;
+}
+
 // Format a number of seconds as a timestamp (h:mm:ss or m:ss).
 function fmtTimestamp(seconds) {
     const total = Math.max(0, Math.floor(seconds || 0));
@@ -89,6 +96,17 @@ function fillSubtitleSelect(select, langs) {
     });
 }
 
+function fillProfileSelect(select, profiles, selected) {
+    select.innerHTML = "";
+    (profiles || []).forEach((p) => {
+        const opt = document.createElement("option");
+        opt.value = p.name;
+        opt.textContent = p.label;
+        opt.selected = p.name === selected;
+        select.appendChild(opt);
+    });
+}
+
 // ------------------------------------------------------------------ //
 // Tabs
 // ------------------------------------------------------------------ //
@@ -115,6 +133,10 @@ fetch("/api/metadata")
         defaultSavePath = meta.default_save_path || "";
         $("video-folder").value = defaultSavePath;
         $("pl-folder").value = defaultSavePath;
+        const workers = (meta.settings && meta.settings.playlist_download_workers) || 1;
+        $("pl-parallel").value = workers;
+        fillProfileSelect($("video-profile"), meta.format_profiles, meta.default_format_profile);
+        fillProfileSelect($("pl-profile"), meta.format_profiles, meta.default_format_profile);
     });
 
 // ------------------------------------------------------------------ //
@@ -135,9 +157,90 @@ $("update-later").addEventListener("click", () => $("update-modal").classList.ad
 $("update-download").addEventListener("click", () => $("update-modal").classList.add("hidden"));
 
 // ------------------------------------------------------------------ //
-// Shared job runner (SSE)
+// Job events: one multiplexed EventSource for every job this page follows
 // ------------------------------------------------------------------ //
-function runJob(endpoint, payload, ui) {
+const jobEvents = {
+    client: Math.random().toString(36).slice(2) + Date.now().toString(36),
+    source: null,
+    handlers: {},
+    lastFrameId: 0,
+    watchdog: null,
+    polling: false,
+};
+
+// Open /api/events (once). Frames batch events of several jobs:
+// [{job, id, event}, ..., {job, closed: true}]; each goes to its job's handler.
+function connectEvents() {
+    if (jobEvents.source) return;
+    const params = new URLSearchParams({ client: jobEvents.client });
+    if (jobEvents.lastFrameId) params.set("last_event_id", jobEvents.lastFrameId);
+    const es = new EventSource("/api/events?" + params);
+    jobEvents.source = es;
+    es.onmessage = (e) => {
+        armEventsWatchdog(30);
+        jobEvents.lastFrameId = Number(e.lastEventId) || jobEvents.lastFrameId;
+        for (const entry of JSON.parse(e.data)) {
+            const handler = jobEvents.handlers[entry.job];
+            if (!handler) continue;
+            if (entry.closed) {
+                delete jobEvents.handlers[entry.job];
+                handler({ type: "closed" });
+            } else {
+                handler(entry.event);
+            }
+        }
+    };
+    es.addEventListener("heartbeat", (e) => {
+        const { interval, poll } = JSON.parse(e.data);
+        // A polling server (waitress) ends every response; the browser reconnects.
+        jobEvents.polling = Boolean(poll);
+        armEventsWatchdog(Math.max(interval * 2, 5));
+    });
+    es.onerror = () => {
+        if (jobEvents.polling && es.readyState === EventSource.CONNECTING) return;
+        for (const handler of Object.values(jobEvents.handlers)) handler({ type: "reconnecting" });
+        // CONNECTING: the browser retries with Last-Event-ID; CLOSED: start over.
+        if (es.readyState === EventSource.CLOSED) reconnectEvents(2);
+    };
+}
+
+// Reconnect when neither a frame nor a heartbeat arrived in time.
+function armEventsWatchdog(seconds) {
+    clearTimeout(jobEvents.watchdog);
+    jobEvents.watchdog = setTimeout(() => reconnectEvents(0), seconds * 1000);
+}
+
+function reconnectEvents(delaySeconds) {
+    clearTimeout(jobEvents.watchdog);
+    jobEvents.polling = false;
+    if (jobEvents.source) jobEvents.source.close();
+    jobEvents.source = null;
+    setTimeout(() => {
+        if (Object.keys(jobEvents.handlers).length) connectEvents();
+    }, delaySeconds * 1000);
+}
+
+// Follow a job: handler(ev) gets its events, then {type: "closed"} when it ends.
+function subscribeJob(job_id, handler) {
+    jobEvents.handlers[job_id] = handler;
+    connectEvents();
+    api("/api/events/subscribe", { client: jobEvents.client, job_id }).then(({ error }) => {
+        if (error && jobEvents.handlers[job_id] === handler) {
+            delete jobEvents.handlers[job_id];
+            handler({ type: "error", message: error });
+        }
+    });
+}
+
+function unsubscribeJob(job_id) {
+    if (!(job_id in jobEvents.handlers)) return;
+    delete jobEvents.handlers[job_id];
+    api("/api/events/unsubscribe", { client: jobEvents.client, job_id });
+}
+
+// Shared job runner
+// ------------------------------------------------------------------ //
+function resetJobUi(ui) {
     ui.progress.classList.remove("hidden");
     ui.open.classList.add("hidden");
     ui.status.classList.remove("done");
@@ -148,7 +251,10 @@ function runJob(endpoint, payload, ui) {
         ui.rows = {};
     }
     ui.download.disabled = true;
+}
 
+function runJob(endpoint, payload, ui) {
+    resetJobUi(ui);
     api(endpoint, payload).then(({ job_id, error }) => {
         if (error || !job_id) {
             ui.status.textContent = error || "Could not start download";
@@ -159,16 +265,92 @@ function runJob(endpoint, payload, ui) {
     });
 }
 
+// " (job speed, all downloads: global speed)" for a progress event.
+function fmtThroughput(ev) {
+    const speed = ev.job_speed || ev.speed;
+    if (!speed) return "";
+    const total = ev.global_speed && ev.global_speed > speed ? `, all downloads: ${fmtSpeed(ev.global_speed)}` : "";
+    return ` (${fmtSpeed(speed)}${total})`;
+}
+
+function fmtQueued(ev) {
+    let text = `Queued — position ${ev.position}`;
+    if (ev.paused) return text + " (paused)";
+    if (ev.eta_seconds != null) text += `, starts in ~${fmtDuration(ev.eta_seconds)}`;
+    return text;
+}
+
+// Show the Pause/Cancel buttons for a scheduled job (queued or running).
+function showJobControls(ui, job_id) {
+    if (!ui.controls) return;
+    ui.jobId = job_id;
+    ui.pause.textContent = "Pause";
+    ui.cancel.disabled = false;
+    ui.cancel.classList.remove("hidden");
+    ui.controls.classList.remove("hidden");
+}
+
+function hideJobControls(ui) {
+    if (ui.controls) ui.controls.classList.add("hidden");
+}
+
+function wireJobControls(ui) {
+    ui.pause.addEventListener("click", () => {
+        const action = ui.pause.textContent === "Pause" ? "pause" : "resume";
+        api(`/api/jobs/${ui.jobId}/${action}`).then(({ error }) => {
+            if (!error) ui.pause.textContent = action === "pause" ? "Resume" : "Pause";
+        });
+    });
+    ui.cancel.addEventListener("click", () => {
+        ui.cancel.disabled = true;
+        api(`/api/jobs/${ui.jobId}/cancel`).then(({ error }) => {
+            if (error) {
+                ui.status.textContent = error;
+                ui.cancel.disabled = false;
+            }
+        });
+    });
+}
+
+// Remember the job a panel follows, so a reloaded tab can pick it up again.
+function trackJob(ui, job_id) {
+    if (job_id) sessionStorage.setItem("job:" + ui.name, job_id);
+    else sessionStorage.removeItem("job:" + ui.name);
+}
+
+// Re-follow a panel's job after a page reload: the server replays its events.
+function resumeTrackedJob(ui) {
+    const job_id = sessionStorage.getItem("job:" + ui.name);
+    if (!job_id) return;
+    resetJobUi(ui);
+    streamJob(job_id, ui);
+}
+
 function streamJob(job_id, ui) {
-    const es = new EventSource("/api/progress/" + job_id);
-    es.onmessage = (e) => {
-        const ev = JSON.parse(e.data);
-        if (ev.type === "progress") {
+    showJobControls(ui, job_id);
+    trackJob(ui, job_id);
+    const finish = () => {
+        ui.download.disabled = false;
+        hideJobControls(ui);
+        trackJob(ui, null);
+        unsubscribeJob(job_id);
+    };
+    subscribeJob(job_id, (ev) => {
+        if (ev.type === "queued") {
+            ui.status.textContent = fmtQueued(ev);
+        } else if (ev.type === "cancelled") {
+            ui.status.textContent = ev.message;
+            finish();
+        } else if (ev.type === "progress" && ev.index && ui.rows && ui.rows[ev.index]) {
+            // Parallel playlist downloads: show each video's progress on its own row.
+            ui.rows[ev.index].querySelector(".r-error").textContent =
+                ev.stage === "processing" ? "processing…" : `${ev.percent || 0}%`;
+        } else if (ev.type === "progress") {
             ui.bar.style.width = (ev.percent || 0) + "%";
             ui.status.textContent =
                 ev.stage === "processing"
                     ? "Processing…"
-                    : `Downloading… ${ev.percent || 0}%` + (ev.speed ? ` (${fmtSpeed(ev.speed)})` : "");
+                    : `Downloading… ${ev.percent || 0}%` + fmtThroughput(ev);
         } else if (ev.type === "status") {
             ui.status.textContent = ev.message;
         } else if (ev.type === "video") {
@@ -179,25 +361,24 @@ function streamJob(job_id, ui) {
             if (ui.results) setVideoRow(ui, ev.index, ev.title, ev.success ? "success" : "failed", ev);
         } else if (ev.type === "error") {
             ui.status.textContent = "Error: " + ev.message;
-            ui.download.disabled = false;
-            es.close();
+            finish();
         } else if (ev.type === "done") {
             ui.bar.style.width = "100%";
             const failed = (ev.failed_videos && ev.failed_videos.length) || 0;
             ui.status.textContent = failed ? `Done — ${failed} failed (retry below)` : "Done!";
+            if (ev.new_videos) ui.status.textContent += ` ${ev.new_videos.length} new video(s) synced.`;
             ui.status.classList.add("done");
             if (ev.output_path) {
                 ui.open.dataset.path = ev.output_path;
                 ui.open.classList.remove("hidden");
             }
-            ui.download.disabled = false;
-            es.close();
+            finish();
+        } else if (ev.type === "reconnecting") {
+            ui.status.textContent = "Connection lost — reconnecting…";
+        } else if (ev.type === "closed") {
+            finish();
         }
-    };
-    es.onerror = () => {
-        ui.download.disabled = false;
-        es.close();
-    };
+    });
 }
 
 // Create/update a per-video result row (playlist). `ev` carries url/id/save_path/error.
@@ -222,12 +403,13 @@ function setVideoRow(ui, index, title, status, ev) {
 
     if (status === "success") {
         statusEl.textContent = "✓";
-        errorEl.textContent = "";
+        errorEl.textContent = ev && ev.skipped ? "already downloaded" : "";
         retryBtn.classList.add("hidden");
     } else if (status === "failed") {
         statusEl.textContent = "✗";
         errorEl.textContent = (ev && ev.error) || "download failed";
-        retryBtn.classList.remove("hidden");
+        // Unavailable videos / local errors won't succeed on a retry.
+        retryBtn.classList.toggle("hidden", Boolean(ev && ev.permanent));
         retryBtn.dataset.url = (ev && ev.url) || "";
         retryBtn.dataset.id = (ev && ev.id) || "";
         retryBtn.dataset.title = title;
@@ -254,25 +436,29 @@ function retryVideo(btn) {
     const fail = (message) =>
         setVideoRow(plUi, index, retryData.title, "failed", { ...retryData, error: message });
 
-    api("/api/retry-video", { ...retryData, subtitle_language: $("pl-subs").value }).then(
+    api("/api/retry-video", {
+        ...retryData,
+        subtitle_language: $("pl-subs").value,
+        format_profile: $("pl-profile").value,
+    }).then(
         ({ job_id, error }) => {
             if (error || !job_id) return fail(error || "retry failed");
-            const es = new EventSource("/api/progress/" + job_id);
-            es.onmessage = (e) => {
-                const ev = JSON.parse(e.data);
+            let settled = false;
+            subscribeJob(job_id, (ev) => {
                 if (ev.type === "progress") {
                     const row = plUi.rows[index];
                     if (row) row.querySelector(".r-error").textContent = `retrying… ${ev.percent || 0}%`;
                 } else if (ev.type === "done") {
+                    settled = true;
                     setVideoRow(plUi, index, retryData.title, ev.success ? "success" : "failed",
                         { ...retryData, error: ev.error });
-                    es.close();
-                } else if (ev.type === "error") {
+                } else if (ev.type === "error" || ev.type === "cancelled") {
+                    settled = true;
                     fail(ev.message);
-                    es.close();
+                } else if (ev.type === "closed" && !settled) {
+                    fail("retry ended without a result");
                 }
-            };
-            es.onerror = () => es.close();
+            });
         }
     );
 }
@@ -280,47 +466,109 @@ function retryVideo(btn) {
 function wireBrowse(buttonId, inputId) {
     $(buttonId).addEventListener("click", () => {
         api("/api/pick-folder").then(({ path }) => {
-            if (path) $(inputId).value = path;
+            if (!path) return;
+            $(inputId).value = path;
+            $(inputId).dispatchEvent(new Event("change"));
+        });
+    });
+}
+
+// Build one playlist row (checkbox, thumbnail, title, length/chapters).
+function playlistVideoItem(v) {
+    const li = document.createElement("li");
+    li.dataset.index = v.index;
+    plProfileSizes[v.index] = v.profile_sizes || {};
+    const check = document.createElement("input");
+    check.type = "checkbox";
+    check.className = "v-check";
+    check.checked = true;
+    check.dataset.index = v.index;
+    check.addEventListener("change", updateSelection);
+    li.appendChild(check);
+    if (v.thumbnail) {
+        const img = document.createElement("img");
+        img.src = v.thumbnail;
+        img.className = "v-thumb";
+        img.alt = "";
+        li.appendChild(img);
+    }
+    const body = document.createElement("span");
+    body.className = "v-body";
+    const title = document.createElement("span");
+    title.className = "v-title";
+    // title.textContent = `${v.index}. ${v.title}`;
+    title.textContent = v.title;
+    const meta = document.createElement("span");
+    meta.className = "v-meta";
+    meta.textContent = v.length + (v.chapters ? ` · ${v.chapters} chapters` : "");
+    body.appendChild(title);
+    body.appendChild(meta);
+    li.appendChild(body);
+    // Lazy playlists list videos from the flat listing; expanding a row, or
+    // ticking its checkbox, resolves it.
+    if (v.url) {
+        body.classList.add("expandable");
+        body.title = "Show details";
+        body.addEventListener("click", () => expandPlaylistVideo(body, v));
+        check.addEventListener("change", () => {
+            if (check.checked && !v.resolved) resolvePlaylistVideo(body, v);
         });
+    }
+    return li;
+}
+
+// Resolve one playlist video (once) and refresh its length, chapters and size.
+function resolvePlaylistVideo(body, v) {
+    if (!v.resolving) {
+        v.resolving = api("/api/video-info", { url: v.url })
+            .catch((err) => ({ error: err.message }))
+            .then((info) => {
+                if (info.error) {
+                    v.resolving = null; // let a later click try again
+                    return info;
+                }
+                v.resolved = true;
+                const chapters = (info.chapters || []).length;
+                body.querySelector(".v-meta").textContent = info.length + (chapters ? ` · ${chapters} chapters` : "");
+                plProfileSizes[v.index] = info.profile_sizes || plProfileSizes[v.index];
+                updatePlaylistSize();
+                return info;
+            });
+    }
+    return v.resolving;
+}
+
+// Resolve one playlist video on demand and show its chapters + description.
+function expandPlaylistVideo(body, v) {
+    const existing = body.querySelector(".v-desc");
+    if (existing) {
+        existing.classList.toggle("hidden");
+        return;
+    }
+    const desc = document.createElement("span");
+    desc.className = "v-desc";
+    desc.textContent = "Loading details…";
+    body.appendChild(desc);
+    resolvePlaylistVideo(body, v).then((info) => {
+        desc.textContent = info.error || info.description || "(no description)";
     });
 }
 
 function renderPlaylistVideos(videos) {
     const list = $("pl-videos");
     list.innerHTML = "";
-    videos.forEach((v) => {
-        const li = document.createElement("li");
-        const check = document.createElement("input");
-        check.type = "checkbox";
-        check.className = "v-check";
-        check.checked = true;
-        check.dataset.index = v.index;
-        check.addEventListener("change", updateSelection);
-        li.appendChild(check);
-        if (v.thumbnail) {
-            const img = document.createElement("img");
-            img.src = v.thumbnail;
-            img.className = "v-thumb";
-            img.alt = "";
-            li.appendChild(img);
-        }
-        const body = document.createElement("span");
-        body.className = "v-body";
-        const title = document.createElement("span");
-        title.className = "v-title";
-        // title.textContent = `${v.index}. ${v.title}`;
-        title.textContent = v.title;
-        const meta = document.createElement("span");
-        meta.className = "v-meta";
-        meta.textContent = v.length + (v.chapters ? ` · ${v.chapters} chapters` : "");
-        body.appendChild(title);
-        body.appendChild(meta);
-        li.appendChild(body);
-        list.appendChild(li);
-    });
+    videos.forEach((v) => list.appendChild(playlistVideoItem(v)));
     updateSelection();
 }
 
+// Insert a streamed row at its playlist position (rows arrive as they resolve).
+function insertPlaylistVideo(v) {
+    const list = $("pl-videos");
+    const item = playlistVideoItem(v);
+    const next = Array.from(list.children).find((li) => Number(li.dataset.index) > v.index);
+    list.insertBefore(item, next || null);
+}
+
 // All per-video selection checkboxes in the playlist list.
 function plChecks() {
     return Array.from(document.querySelectorAll("#pl-videos .v-check"));
@@ -343,6 +591,32 @@ function updateSelection() {
     master.indeterminate = selected > 0 && selected < total;
     $("pl-selected-count").textContent = `${selected} of ${total} selected`;
     $("pl-download").disabled = selected === 0;
+    updatePlaylistSize();
+}
+
+// Estimated download size per playlist video and profile, keyed by 1-based index.
+let plProfileSizes = {};
+
+// Free bytes on the playlist save folder's disk (null until known).
+let plFreeBytes = null;
+
+function refreshPlaylistFreeSpace() {
+    api("/api/disk-space", { path: $("pl-folder").value.trim() }).then(({ free_bytes }) => {
+        plFreeBytes = free_bytes === undefined ? null : free_bytes;
+        updatePlaylistSize();
+    });
+}
+
+// Show the estimated total size of the selected videos in the chosen profile,
+// with the free space of the save folder (highlighted when it won't fit).
+function updatePlaylistSize() {
+    const profile = $("pl-profile").value;
+    const total = selectedIndices().reduce(
+        (sum, index) => sum + ((plProfileSizes[index] || {})[profile] || 0), 0);
+    const size = $("pl-size");
+    const free = plFreeBytes !== null ? ` (${fmtBytes(plFreeBytes)} free)` : "";
+    size.textContent = total ? `· ~${fmtBytes(total)}${free}` : "";
+    size.classList.toggle("low-space", Boolean(total && plFreeBytes !== null && total > plFreeBytes));
 }
 
 function wireOpen(buttonId) {
@@ -376,14 +650,42 @@ $("video-fetch").addEventListener("click", () => {
             renderVideoChapters(info.chapters);
             $("video-thumb").src = info.thumbnail || "";
             fillSubtitleSelect($("video-subs"), info.transcript_list);
+            videoProfileSizes = info.profile_sizes || {};
+            updateVideoSize();
             $("video-info").classList.remove("hidden");
         })
+        .catch((err) => {
+            $("video-error").textContent = `Could not load video: ${err.message}`;
+            $("video-error").classList.remove("hidden");
+        })
         .finally(() => {
             $("video-fetch").disabled = false;
             $("video-fetch").textContent = "Fetch";
         });
 });
 
+// Estimated download size per profile for the fetched video.
+let videoProfileSizes = {};
+
+function updateVideoSize() {
+    const size = videoProfileSizes[$("video-profile").value];
+    $("video-size").textContent = size ? `· ~${fmtBytes(size)}` : "";
+}
+
+$("video-profile").addEventListener("change", updateVideoSize);
+
+const videoUi = {
+    name: "video",
+    progress: $("video-progress"),
+    bar: $("video-bar"),
+    status: $("video-status"),
+    open: $("video-open"),
+    download: $("video-download"),
+    controls: $("video-controls"),
+    pause: $("video-pause"),
+    cancel: $("video-cancel"),
+};
+
 $("video-download").addEventListener("click", () => {
     runJob(
         "/api/download-video",
@@ -391,20 +693,16 @@ $("video-download").addEventListener("click", () => {
             url: $("video-url").value.trim(),
             subtitle_language: $("video-subs").value,
             split_chapters: $("video-split").checked,
+            format_profile: $("video-profile").value,
             save_path: $("video-folder").value.trim(),
         },
-        {
-            progress: $("video-progress"),
-            bar: $("video-bar"),
-            status: $("video-status"),
-            open: $("video-open"),
-            download: $("video-download"),
-        }
+        videoUi
     );
 });
 
 wireBrowse("video-browse", "video-folder");
 wireOpen("video-open");
+wireJobControls(videoUi);
 
 // ------------------------------------------------------------------ //
 // Playlist tab
@@ -416,37 +714,78 @@ $("pl-fetch").addEventListener("click", () => {
     $("pl-info").classList.add("hidden");
     $("pl-fetch").disabled = true;
     $("pl-fetch").textContent = "Fetching…";
-    api("/api/playlist-info", { url })
-        .then((info) => {
-            if (info.error) {
-                $("pl-error").textContent = info.error;
-                $("pl-error").classList.remove("hidden");
-                return;
+    $("pl-videos").innerHTML = "";
+    plProfileSizes = {};
+    const done = () => {
+        $("pl-fetch").disabled = false;
+        $("pl-fetch").textContent = "Fetch";
+    };
+    const fail = (message) => {
+        $("pl-error").textContent = message;
+        $("pl-error").classList.remove("hidden");
+        $("pl-info").classList.add("hidden");
+        done();
+    };
+    // Stream rows as the server resolves them instead of waiting for the whole list.
+    // The button stays disabled until the stream ends; fail() re-enables it.
+    api("/api/playlist-info/stream", { url }).then(({ job_id, error }) => {
+        if (error || !job_id) return fail(error || "Could not load playlist");
+        $("pl-title").textContent = "Loading playlist…";
+        $("pl-count").textContent = "";
+        $("pl-duration").textContent = "";
+        $("pl-download").disabled = true;
+        $("pl-info").classList.remove("hidden");
+        let loaded = 0;
+        subscribeJob(job_id, (ev) => {
+            if (ev.type === "video_info") {
+                insertPlaylistVideo(ev);
+                loaded += 1;
+                $("pl-count").textContent = `${loaded} of ${ev.total} videos loaded`;
+            } else if (ev.type === "error") {
+                unsubscribeJob(job_id);
+                fail(ev.message);
+            } else if (ev.type === "done") {
+                unsubscribeJob(job_id);
+                $("pl-title").textContent = ev.title;
+                const unavailable = (ev.failed_entries || []).length;
+                $("pl-count").textContent =
+                    `${ev.number_videos} videos` + (unavailable ? ` (${unavailable} unavailable)` : "");
+                $("pl-duration").textContent = ev.length;
+                // Re-render from the final list (unavailable entries keep their place).
+                renderPlaylistVideos(ev.videos || []);
+                fillSubtitleSelect($("pl-subs"), ev.transcript_list);
+                refreshPlaylistFreeSpace();
+                done();
+            } else if (ev.type === "closed") {
+                done();
             }
-            $("pl-title").textContent = info.title;
-            $("pl-count").textContent = `${info.number_videos} videos`;
-            $("pl-duration").textContent = info.length;
-            renderPlaylistVideos(info.videos || []);
-            fillSubtitleSelect($("pl-subs"), info.transcript_list);
-            $("pl-info").classList.remove("hidden");
-        })
-        .finally(() => {
-            $("pl-fetch").disabled = false;
-            $("pl-fetch").textContent = "Fetch";
         });
+    }).catch((err) => fail(`Could not load playlist: ${err.message}`));
 });
 
 // Persistent playlist UI state (shared by download + per-video retry).
 const plUi = {
+    name: "playlist",
     progress: $("pl-progress"),
     bar: $("pl-bar"),
     status: $("pl-status"),
     open: $("pl-open"),
     results: $("pl-results"),
     download: $("pl-download"),
+    controls: $("pl-controls"),
+    pause: $("pl-pause"),
+    cancel: $("pl-cancel"),
     rows: {},
 };
 
+// How many playlist videos to download at once (>= 1).
+function parallelDownloads() {
+    return Math.max(1, Number.parseInt($("pl-parallel").value, 10) || 1);
+}
+
+$("pl-profile").addEventListener("change", updatePlaylistSize);
+$("pl-folder").addEventListener("change", refreshPlaylistFreeSpace);
+
 // "Select all" toggles every per-video checkbox.
 $("pl-select-all").addEventListener("change", (e) => {
     plChecks().forEach((c) => {
@@ -465,6 +804,8 @@ $("pl-download").addEventListener("click", () => {
             subtitle_language: $("pl-subs").value,
             numerate: $("pl-numerate").checked,
             save_path: $("pl-folder").value.trim(),
+            parallel_downloads: parallelDownloads(),
+            format_profile: $("pl-profile").value,
             // Omit when every video is selected — the backend treats that as "all".
             selected_indices: selected.length === plChecks().length ? null : selected,
         },
@@ -472,6 +813,22 @@ $("pl-download").addEventListener("click", () => {
     );
 });
 
+// Incremental sync: only videos added since the last sync of this folder.
+$("pl-sync").addEventListener("click", () => {
+    runJob(
+        "/api/sync-playlist",
+        {
+            url: $("pl-url").value.trim(),
+            subtitle_language: $("pl-subs").value,
+            numerate: $("pl-numerate").checked,
+            save_path: $("pl-folder").value.trim(),
+            parallel_downloads: parallelDownloads(),
+            format_profile: $("pl-profile").value,
+        },
+        plUi
+    );
+});
+
 // Retry buttons are created dynamically -> delegate the click.
 $("pl-results").addEventListener("click", (e) => {
     const btn = e.target.closest(".r-retry");
@@ -480,6 +837,10 @@ $("pl-results").addEventListener("click", (e) => {
 
 wireBrowse("pl-browse", "pl-folder");
 wireOpen("pl-open");
+wireJobControls(plUi);
+
+resumeTrackedJob(videoUi);
+resumeTrackedJob(plUi);
 
 // ------------------------------------------------------------------ //
 // System logs panel
@@ -0,0 +1,233 @@
+"""Persistent on-disk cache for video and playlist metadata.
+
+:class:`CachingInfoProvider` decorates any :class:`InfoProvider` (normally the
+yt-dlp one) and keeps the resolved :class:`VideoInfo` / :class:`PlaylistInfo` in a
+small SQLite database under :func:`~youtube_downloader.paths.writable_dir`, so a
+video resolved a few minutes ago is not extracted again. Entries are keyed by the
+YouTube video / playlist id, expire after a TTL, and the least recently used ones
+are evicted once the database grows past a size budget.
+
+Because it sits behind the ``InfoProvider`` interface, the console app and the
+GUI get the cache without knowing about it.
+"""
+
+import contextlib
+import dataclasses
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from .interfaces import InfoProvider
+from .models import Chapter, PlaylistInfo, VideoInfo
+from .paths import writable_dir
+from .utils import youtube_playlist_id, youtube_video_id
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE = os.path.join(writable_dir(), 'cache', 'info_cache.sqlite3')
+
+# Bump when the stored payload shape changes; rows written by another schema
+# version are treated as misses.
+_SCHEMA_VERSION = 2
+
+_VIDEO = 'video'
+_PLAYLIST = 'playlist'
+
+
+def _flat_key(playlist_id: str) -> str:
+    """Cache key of a lazily listed (flat) playlist."""
+    return f'{playlist_id}:flat'
+
+
+def _video_to_dict(video: VideoInfo) -> dict:
+    data = dataclasses.asdict(video)
+    data.pop('transcript_list', None)  # filled in per request by the front-end
+    return data
+
+
+def _video_from_dict(data: dict) -> VideoInfo:
+    known = {f.name for f in dataclasses.fields(VideoInfo)}
+    values = {key: value for key, value in data.items() if key in known}
+    values['chapters'] = [Chapter(**chapter) for chapter in data.get('chapters', [])]
+    return VideoInfo(**values)
+
+
+def _playlist_to_dict(playlist: PlaylistInfo) -> dict:
+    return {
+        'url': playlist.url,
+        'id': playlist.id,
+        'title': playlist.title,
+        'videos_info': [_video_to_dict(video) for video in playlist.videos_info],
+    }
+
+
+def _playlist_from_dict(data: dict) -> PlaylistInfo:
+    return PlaylistInfo(
+        url=data['url'],
+        id=data['id'],
+        title=data['title'],
+        videos_info=[_video_from_dict(video) for video in data.get('videos_info', [])],
+    )
+
+
+class InfoCache:
+    """SQLite-backed key/value store with per-kind TTLs and LRU size eviction.
+
+    Each operation opens a short-lived connection under a lock (committed and
+    closed when it ends), so the cache is safe to share between the GUI's
+    request threads and the playlist workers.
+    """
+
+    def __init__(
+        self,
+        path: str = CACHE_FILE,
+        video_ttl: float = 24 * 3600,
+        playlist_ttl: float = 3600,
+        max_bytes: int = 50 * 1024 * 1024,
+    ) -> None:
+        self.path = path
+        self.ttls = {_VIDEO: video_ttl, _PLAYLIST: playlist_ttl}
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                ' kind TEXT NOT NULL, key TEXT NOT NULL, schema INTEGER NOT NULL,'
+                ' payload TEXT NOT NULL, size INTEGER NOT NULL,'
+                ' created_at REAL NOT NULL, accessed_at REAL NOT NULL,'
+                ' PRIMARY KEY (kind, key))'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS entries_lru ON entries (accessed_at)')
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """A connection that commits (or rolls back) and is closed on exit.
+
+        ``with sqlite3.connect(...)`` alone only ends the transaction; the
+        connection itself would stay open until garbage-collected.
+        """
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, kind: str, key: str) -> "dict | None":
+        """Return the stored payload, or ``None`` when missing or expired."""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                'SELECT payload, schema, created_at FROM entries WHERE kind = ? AND key = ?',
+                (kind, key),
+            ).fetchone()
+            if row is None:
+                return None
+            payload, schema, created_at = row
+            if schema != _SCHEMA_VERSION or now - created_at > self.ttls[kind]:
+                conn.execute('DELETE FROM entries WHERE kind = ? AND key = ?', (kind, key))
+                return None
+            conn.execute(
+                'UPDATE entries SET accessed_at = ? WHERE kind = ? AND key = ?', (now, kind, key)
+            )
+        return json.loads(payload)
+
+    def put(self, kind: str, key: str, payload: dict) -> None:
+        """Store ``payload`` and evict least-recently-used rows beyond the size budget."""
+        text = json.dumps(payload)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (kind, key, _SCHEMA_VERSION, text, len(text), now, now),
+            )
+            self._evict(conn)
+
+    def delete(self, kind: str, key: str) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute('DELETE FROM entries WHERE kind = ? AND key = ?', (kind, key))
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for kind, key, size in conn.execute(
+            'SELECT kind, key, size FROM entries ORDER BY accessed_at'
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute('DELETE FROM entries WHERE kind = ? AND key = ?', (kind, key))
+            total -= size
+            evicted += 1
+        logger.info("Info cache over budget; evicted %d entries", evicted)
+
+
+class CachingInfoProvider(InfoProvider):
+    """Caching decorator around another :class:`InfoProvider`.
+
+    ``bypass=True`` turns every call into a pass-through (results are still
+    written, so the cache is fresh when bypass is switched off again). URLs
+    without a recognizable video / playlist id are never cached.
+    """
+
+    def __init__(self, inner: InfoProvider, cache: InfoCache, bypass: bool = False) -> None:
+        self.inner = inner
+        self.cache = cache
+        self.bypass = bypass
+
+    def get_video_info(self, url: str, for_download: bool = False) -> VideoInfo:
+        key = youtube_video_id(url)
+        if key and not self.bypass:
+            cached = self.cache.get(_VIDEO, key)
+            if cached is not None:
+                logger.info("Video info cache hit: %s", key)
+                video = _video_from_dict(cached)
+                video.url = url
+                return video
+
+        video = self.inner.get_video_info(url, for_download=for_download)
+        if key:
+            self.cache.put(_VIDEO, key, _video_to_dict(video))
+        return video
+
+    def get_playlist_info(self, url: str, on_video=None, lazy: bool = False) -> PlaylistInfo:
+        key = youtube_playlist_id(url)
+        if key and not self.bypass:
+            # A fully resolved playlist also satisfies a lazy request.
+            keys = (key, _flat_key(key)) if lazy else (key,)
+            for cache_key in keys:
+                cached = self.cache.get(_PLAYLIST, cache_key)
+                if cached is not None:
+                    logger.info("Playlist info cache hit: %s", cache_key)
+                    playlist = _playlist_from_dict(cached)
+                    playlist.url = url
+                    if on_video is not None:
+                        for position, video in enumerate(playlist.videos_info, start=1):
+                            on_video(position, playlist.number_videos, video)
+                    return playlist
+
+        playlist = self.inner.get_playlist_info(url, on_video, lazy)
+        for video in playlist.videos_info:
+            if video.resolved:
+                video_key = youtube_video_id(video.url) or video.id
+                self.cache.put(_VIDEO, video_key, _video_to_dict(video))
+        # A partially resolved playlist is likely a transient failure; don't pin it.
+        if key and not playlist.failed_entries:
+            cache_key = _flat_key(key) if lazy else key
+            self.cache.put(_PLAYLIST, cache_key, _playlist_to_dict(playlist))
+        return playlist
+
+    def invalidate(self, url: str) -> None:
+        video_key = youtube_video_id(url)
+        if video_key:
+            self.cache.delete(_VIDEO, video_key)
+        playlist_key = youtube_playlist_id(url)
+        if playlist_key:
+            self.cache.delete(_PLAYLIST, playlist_key)
+            self.cache.delete(_PLAYLIST, _flat_key(playlist_key))
+        logger.info("Invalidated cached info for %s", url)
@@ -1,28 +1,97 @@
 """Video / playlist metadata provider backed by yt-dlp."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import yt_dlp
-
+from .extracted_info import ExtractedInfoStore, default_info_store
+from .format_profiles import estimate_sizes
 from .interfaces import InfoProvider
 from .models import Chapter, PlaylistInfo, VideoInfo
+from .settings import get_settings
 from .utils import clean_filename
-from .ytdlp_support import js_runtime_opts
+from .ytdlp_pool import YoutubeDLPool, default_pool
+from .ytdlp_support import js_runtime_opts, player_client_opts
 
 logger = logging.getLogger(__name__)
 
 
+def _flat_video(entry: dict) -> VideoInfo:
+    """An unresolved :class:`VideoInfo` built from an ``extract_flat`` entry."""
+    thumbnails = entry.get('thumbnails') or []
+    return VideoInfo(
+        url=f"https://www.youtube.com/watch?v={entry['id']}",
+        id=entry['id'],
+        title=clean_filename(entry.get('title') or entry['id']),
+        length_seconds=int(entry.get('duration') or 0),
+        description='',
+        thumbnail=thumbnails[-1].get('url', '') if thumbnails else '',
+        resolved=False,
+    )
+
+
+def _info_workers() -> int:
+    """Worker count for playlist resolution (``settings.playlist_info_workers``).
+
+    ``1`` resolves the entries one by one, as before.
+    """
+    return max(1, get_settings().playlist_info_workers)
+
+
 class YtDlpInfoProvider(InfoProvider):
-    """Fetches video and playlist metadata using yt-dlp."""
+    """Fetches video and playlist metadata using yt-dlp.
 
-    def get_video_info(self, url: str) -> VideoInfo:
-        logger.info("Fetching video info: %s", url)
-        ydl_opts = {
+    Playlist videos are resolved on a bounded thread pool (see
+    :func:`_info_workers`); each worker checks its own ``YoutubeDL`` out of the
+    shared :class:`~youtube_downloader.ytdlp_pool.YoutubeDLPool`, so workers never
+    share extractor state but also don't rebuild one per video.
+
+    Videos extracted ``for_download`` use the downloader's player clients and are
+    kept in an :class:`ExtractedInfoStore`, where the downloader picks them up
+    instead of extracting the same video again. Display and playlist resolution
+    use yt-dlp's default client only and store nothing.
+    """
+
+    def __init__(
+        self,
+        max_workers: "int | None" = None,
+        pool: "YoutubeDLPool | None" = None,
+        info_store: "ExtractedInfoStore | None" = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.pool = pool or default_pool
+        self.info_store = info_store or default_info_store
+
+    @staticmethod
+    def _video_opts() -> dict:
+        return {
             'quiet': True,  # Suppress output
             **js_runtime_opts(),  # opt-in nsig solving (see metadata.json settings)
         }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+
+    @classmethod
+    def _download_opts(cls) -> dict:
+        # Same clients as the downloader, so it can reuse this extraction.
+        return {**cls._video_opts(), **player_client_opts()}
+
+    @staticmethod
+    def _playlist_opts() -> dict:
+        return {
+            'quiet': True,        # Suppress output
+            'extract_flat': True,  # Only list the playlist entries, don't resolve each video yet
+        }
+
+    def prewarm(self) -> None:
+        """Build the pooled ``YoutubeDL`` instances in the background."""
+        self.pool.warm(self._video_opts(), self._download_opts(), self._playlist_opts())
+
+    def get_video_info(self, url: str, for_download: bool = False) -> VideoInfo:
+        logger.info("Fetching video info: %s", url)
+        opts = self._download_opts() if for_download else self._video_opts()
+        with self.pool.acquire(opts) as ydl:
             info = ydl.extract_info(url, download=False)
+            size_estimates = estimate_sizes(ydl, info)
+        if for_download:
+            self.info_store.put(info)
 
         raw_chapters = info.get('chapters', []) or []
         chapters = [
@@ -42,6 +111,7 @@ class YtDlpInfoProvider(InfoProvider):
             description=info['description'],
             thumbnail=info['thumbnail'],
             chapters=chapters,
+            size_estimates=size_estimates,
         )
         logger.info(
             "Fetched video '%s' (%s, %d chapters)",
@@ -49,30 +119,75 @@ class YtDlpInfoProvider(InfoProvider):
         )
         return video
 
-    def get_playlist_info(self, url: str) -> PlaylistInfo:
-        logger.info("Fetching playlist info: %s", url)
-        ydl_opts = {
-            'quiet': True,        # Suppress output
-            'extract_flat': True,  # Only list the playlist entries, don't resolve each video yet
-        }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+    def get_playlist_info(self, url: str, on_video=None, lazy: bool = False) -> PlaylistInfo:
+        logger.info("Fetching playlist info: %s (lazy=%s)", url, lazy)
+        with self.pool.acquire(self._playlist_opts()) as ydl:
             info = ydl.extract_info(url, download=False)
 
         entries = info.get('entries', []) or []
+        if lazy:
+            return self._lazy_playlist(url, info, entries, on_video)
+
         video_urls = [
             f"https://www.youtube.com/watch?v={entry['id']}" for entry in entries
         ]
-        logger.info("Playlist '%s' has %d videos; resolving each…",
-                    info.get('title', ''), len(video_urls))
+        workers = min(self.max_workers or _info_workers(), max(1, len(video_urls)))
+        logger.info("Playlist '%s' has %d videos; resolving with %d worker(s)…",
+                    info.get('title', ''), len(video_urls), workers)
 
-        videos_info = [self.get_video_info(video_url) for video_url in video_urls]
+        # An entry that fails to resolve keeps its place as the unresolved flat
+        # entry, so every later video keeps its playlist position.
+        videos_info = [_flat_video(entry) for entry in entries]
+        failed_entries = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='playlist-info') as pool:
+            futures = {
+                pool.submit(self._resolve_entry, video_url): position
+                for position, video_url in enumerate(video_urls, start=1)
+            }
+            # Report entries as they finish, but keep the results in playlist
+            # order no matter which video resolves first.
+            for future in as_completed(futures):
+                position = futures[future]
+                video, error = future.result()
+                if video is not None:
+                    videos_info[position - 1] = video
+                else:
+                    failed_entries[position] = f"#{position} - {video_urls[position - 1]}: {error}"
+                if on_video is not None:
+                    on_video(position, len(video_urls), videos_info[position - 1])
 
         playlist = PlaylistInfo(
             url=url,
             id=info['id'],
             title=clean_filename(info.get('title', '')),
             videos_info=videos_info,
+            failed_entries=[failed_entries[position] for position in sorted(failed_entries)],
         )
-        logger.info("Resolved playlist '%s' (%d videos, total %s)",
+        logger.info("Resolved playlist '%s' (%d videos, total %s, %d unavailable)",
+                    playlist.title, playlist.number_videos, playlist.length, len(failed_entries))
+        return playlist
+
+    @staticmethod
+    def _lazy_playlist(url: str, info: dict, entries: list, on_video) -> PlaylistInfo:
+        """Build the playlist from the flat listing alone (no per-video extraction)."""
+        videos_info = [_flat_video(entry) for entry in entries]
+        if on_video is not None:
+            for position, video in enumerate(videos_info, start=1):
+                on_video(position, len(videos_info), video)
+        playlist = PlaylistInfo(
+            url=url,
+            id=info['id'],
+            title=clean_filename(info.get('title', '')),
+            videos_info=videos_info,
+        )
+        logger.info("Listed playlist '%s' lazily (%d videos, total %s)",
                     playlist.title, playlist.number_videos, playlist.length)
         return playlist
+
+    def _resolve_entry(self, video_url: str) -> "tuple[VideoInfo | None, str]":
+        """Resolve one playlist entry, returning ``(video, "")`` or ``(None, reason)``."""
+        try:
+            return self.get_video_info(video_url), ""
+        except Exception as e:  # noqa: BLE001 - a bad entry must not abort the playlist
+            logger.warning("Could not resolve playlist entry %s: %s", video_url, e)
+            return None, str(e)
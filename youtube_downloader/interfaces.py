@@ -8,6 +8,8 @@ implementations live in the sibling service modules and are wired together in
 
 from abc import ABC, abstractmethod
 
+from .cancellation import CancelToken
+from .format_profiles import DEFAULT_PROFILE
 from .models import Chapter, DownloadOutcome, PlaylistInfo, VideoInfo
 
 
@@ -15,12 +17,38 @@ class InfoProvider(ABC):
     """Fetches metadata about videos and playlists."""
 
     @abstractmethod
-    def get_video_info(self, url: str) -> VideoInfo:
-        """Return metadata for a single video."""
+    def get_video_info(self, url: str, for_download: bool = False) -> VideoInfo:
+        """Return metadata for a single video.
+
+        Pass ``for_download=True`` when a download of the video follows right
+        away; the provider may then extract it the way the downloader would and
+        hand the extraction over to it.
+        """
 
     @abstractmethod
-    def get_playlist_info(self, url: str) -> PlaylistInfo:
-        """Return metadata for a playlist and each of its videos."""
+    def get_playlist_info(self, url: str, on_video=None, lazy: bool = False) -> PlaylistInfo:
+        """Return metadata for a playlist and each of its videos.
+
+        ``on_video(position, total, video)`` is an optional callback invoked as
+        each entry resolves (in completion order, ``position`` is 1-based), so a
+        front-end can show videos before the whole playlist is done.
+
+        With ``lazy=True`` the videos are built from the flat listing only
+        (``VideoInfo.resolved`` is ``False``); call :meth:`resolve_video` on the
+        ones actually needed.
+        """
+
+    def resolve_video(self, video: VideoInfo) -> VideoInfo:
+        """Return ``video`` fully resolved (itself if it already is), for downloading."""
+        if video.resolved:
+            return video
+        return self.get_video_info(video.url, for_download=True)
+
+    def invalidate(self, url: str) -> None:
+        """Forget any cached metadata for ``url`` so the next fetch is fresh.
+
+        A no-op for providers that don't cache.
+        """
 
 
 class VideoDownloader(ABC):
@@ -33,13 +61,19 @@ class VideoDownloader(ABC):
         title: str,
         output_path: str = '.',
         progress_hook=None,
+        format_profile: str = DEFAULT_PROFILE,
+        cancel_token: "CancelToken | None" = None,
     ) -> DownloadOutcome:
         """Download ``url`` as ``title`` into ``output_path``.
 
         ``progress_hook`` is an optional callable invoked with progress updates
         (the yt-dlp hook contract). Passing ``None`` disables progress reporting,
-        which is the console default. Returns a :class:`DownloadOutcome` (truthy on
-        success; ``.error`` holds the failure reason on failure).
+        which is the console default. ``format_profile`` names the
+        :mod:`~youtube_downloader.format_profiles` profile to download. Returns a
+        :class:`DownloadOutcome` (truthy on success; ``.error`` holds the failure
+        reason on failure). Raises
+        :class:`~youtube_downloader.cancellation.Cancelled` once ``cancel_token``
+        is cancelled.
         """
 
 
@@ -66,9 +100,13 @@ class ChapterSplitter(ABC):
 
     @abstractmethod
     def split_video(
-        self, video_path: str, chapters: list[Chapter], output_path: str
+        self, video_path: str, chapters: list[Chapter], output_path: str,
+        cancel_token: "CancelToken | None" = None,
     ) -> None:
-        """Cut ``video_path`` into one file per chapter under ``output_path``."""
+        """Cut ``video_path`` into one file per chapter under ``output_path``.
+
+        Cancelling ``cancel_token`` stops the split, killing a running cut.
+        """
 
     @abstractmethod
     def split_subtitles(
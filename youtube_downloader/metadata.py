@@ -7,6 +7,9 @@ hardcode any of it.
 
 import json
 import logging
+import os
+import threading
+import time
 
 from .paths import resource_path
 
@@ -22,13 +25,17 @@ _FALLBACK = {
     "repository": "",
 }
 
+# How often (seconds) the file's mtime is re-checked; between checks the cached
+# copy is returned without touching the filesystem.
+_RECHECK_SECONDS = 2.0
 
-def get_metadata() -> dict:
-    """Return the full project metadata dict from ``metadata.json``.
+_lock = threading.Lock()
+_cache: "dict | None" = None
+_cache_mtime: "float | None" = None
+_checked_at = 0.0
 
-    Falls back to a minimal dict if the file is missing or malformed, so a
-    metadata problem never crashes the app.
-    """
+
+def _load() -> dict:
     try:
         with open(_METADATA_FILE, encoding="utf-8") as f:
             return json.load(f)
@@ -37,6 +44,30 @@ def get_metadata() -> dict:
         return dict(_FALLBACK)
 
 
+def get_metadata() -> dict:
+    """Return the full project metadata dict from ``metadata.json``.
+
+    The parsed file is cached and re-read only when its mtime changes (checked
+    at most every couple of seconds). Falls back to a minimal dict if the file is
+    missing or malformed, so a metadata problem never crashes the app. Returns a
+    shallow copy: callers may add top-level keys, but must not mutate nested
+    values such as ``settings``.
+    """
+    global _cache, _cache_mtime, _checked_at
+    with _lock:
+        now = time.monotonic()
+        if _cache is None or now - _checked_at >= _RECHECK_SECONDS:
+            _checked_at = now
+            try:
+                mtime = os.path.getmtime(_METADATA_FILE)
+            except OSError:
+                mtime = None
+            if _cache is None or mtime != _cache_mtime:
+                _cache, _cache_mtime = _load(), mtime
+                logger.debug("Loaded metadata.json (mtime=%s)", mtime)
+        return dict(_cache)
+
+
 def get_version() -> str:
     """Convenience accessor for just the version string."""
     return get_metadata().get("version", _FALLBACK["version"])
@@ -6,6 +6,7 @@ around, giving the rest of the package a stable, self-documenting shape.
 
 from dataclasses import dataclass, field
 
+from .format_profiles import DEFAULT_PROFILE
 from .utils import format_video_length
 
 
@@ -24,7 +25,15 @@ class Chapter:
 
 @dataclass
 class VideoInfo:
-    """Everything the app needs to know about a single video."""
+    """Everything the app needs to know about a single video.
+
+    ``resolved`` is ``False`` for a lazy playlist entry built from the flat
+    listing alone: id, title, duration and thumbnail are known, but the
+    description and chapters are not until
+    :meth:`~youtube_downloader.interfaces.InfoProvider.resolve_video` runs.
+    ``size_estimates`` maps a format profile name to the expected download size
+    in bytes (only for resolved videos whose formats report a size).
+    """
 
     url: str
     id: str
@@ -34,6 +43,8 @@ class VideoInfo:
     thumbnail: str
     chapters: list[Chapter] = field(default_factory=list)
     transcript_list: list[str] = field(default_factory=list)
+    resolved: bool = True
+    size_estimates: dict[str, int] = field(default_factory=dict)
 
     @property
     def length(self) -> str:
@@ -43,13 +54,21 @@ class VideoInfo:
 
 @dataclass
 class PlaylistInfo:
-    """A playlist and the videos it contains."""
+    """A playlist and the videos it contains.
+
+    ``failed_entries`` lists the playlist entries that could not be resolved
+    (``"#<position> - <video URL>: <reason>"``) so one bad video doesn't abort
+    the whole playlist. They stay in ``videos_info`` as unresolved flat entries
+    (``resolved=False``), keeping every video at its playlist position; a
+    download resolves them again and records them as failed if that fails too.
+    """
 
     url: str
     id: str
     title: str
     videos_info: list[VideoInfo] = field(default_factory=list)
     transcript_list: list[str] = field(default_factory=list)
+    failed_entries: list[str] = field(default_factory=list)
 
     @property
     def number_videos(self) -> int:
@@ -73,12 +92,14 @@ class VideoDownloadOptions:
 
     ``subtitle_language`` is a language code (e.g. ``"en"``) or ``None`` for no
     subtitles. ``split_chapters`` also wraps the video in a title folder and
-    writes a ``Link.txt``, matching the console behavior.
+    writes a ``Link.txt``, matching the console behavior. ``format_profile``
+    names a :mod:`~youtube_downloader.format_profiles` profile (e.g. ``"720p"``).
     """
 
     save_path: str
     subtitle_language: "str | None" = None
     split_chapters: bool = False
+    format_profile: str = DEFAULT_PROFILE
 
 
 @dataclass
@@ -87,12 +108,54 @@ class PlaylistDownloadOptions:
 
     ``selected_indices`` restricts the download to specific videos by their
     1-based position in the playlist; ``None`` (the default) downloads all.
+    ``parallel_downloads`` is how many videos download at once (``None`` uses
+    ``settings.playlist_download_workers``). With ``ordered_callbacks`` the
+    per-video result callbacks fire in playlist order even when downloads finish
+    out of order. ``format_profile`` is as for :class:`VideoDownloadOptions`.
     """
 
     save_path: str
     subtitle_language: "str | None" = None
     numerate: bool = False
     selected_indices: "set[int] | None" = None
+    parallel_downloads: "int | None" = None
+    ordered_callbacks: bool = True
+    format_profile: str = DEFAULT_PROFILE
+
+
+@dataclass
+class BatchDownloadOptions:
+    """Choices shared by every URL of a batch download.
+
+    Video URLs use ``subtitle_language`` / ``split_chapters`` / ``format_profile``
+    as in :class:`VideoDownloadOptions`, playlist URLs ``numerate`` as in
+    :class:`PlaylistDownloadOptions`. ``parallel_downloads`` bounds how many
+    videos of the whole batch download at once (``None`` uses
+    ``settings.playlist_download_workers``).
+    """
+
+    save_path: str
+    subtitle_language: "str | None" = None
+    split_chapters: bool = False
+    numerate: bool = False
+    parallel_downloads: "int | None" = None
+    format_profile: str = DEFAULT_PROFILE
+
+
+@dataclass
+class DownloadAttempt:
+    """One failed download attempt, as recorded by the retry policy.
+
+    ``category`` is the error class (see :mod:`youtube_downloader.retry_policy`),
+    ``delay`` the seconds waited before the next attempt, and ``player_clients``
+    the YouTube clients the attempt extracted with.
+    """
+
+    number: int
+    category: str
+    error: str
+    delay: float = 0.0
+    player_clients: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -100,11 +163,18 @@ class DownloadOutcome:
     """Result of downloading a single video: success plus a failure reason.
 
     Truthy when successful, so existing ``if downloader.download(...)`` checks keep
-    working while callers that want the reason can read ``error``.
+    working while callers that want the reason can read ``error``. ``attempts``
+    holds the failed attempts (also on eventual success); ``permanent`` is set
+    when the last failure can't be fixed by retrying (unavailable video, full
+    disk, ...). ``skipped`` marks a video found in the download archive, which
+    was not downloaded again.
     """
 
     success: bool
     error: str = ""
+    attempts: list[DownloadAttempt] = field(default_factory=list)
+    permanent: bool = False
+    skipped: bool = False
 
     def __bool__(self) -> bool:
         return self.success
@@ -117,14 +187,58 @@ class VideoDownloadResult:
     output_path: str
     subtitle_file: str = ""
     chapters_split: bool = False
+    success: bool = True
+    error: str = ""
 
 
 @dataclass
 class PlaylistDownloadResult:
-    """Outcome of a playlist download, including any per-video failures."""
+    """Outcome of a playlist download, including any per-video failures.
+
+    ``new_videos`` is only filled by a sync run: the titles of the videos that
+    were new since the previous sync and downloaded successfully.
+    """
 
     output_path: str
     failed_videos: list[str] = field(default_factory=list)
+    new_videos: list[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchItem:
+    """One URL of a batch download and what became of it.
+
+    ``kind`` is ``"video"`` or ``"playlist"``; ``index`` is the URL's 1-based
+    position in the request. A URL naming the same video or playlist as an
+    earlier one is not fetched again: ``duplicate_of`` is that item's index and
+    the item shares its result. ``failed_videos`` lists a playlist's failures
+    (see :class:`PlaylistDownloadResult`).
+    """
+
+    index: int
+    url: str
+    kind: str
+    title: str = ""
+    success: bool = False
+    error: str = ""
+    output_path: str = ""
+    failed_videos: list[str] = field(default_factory=list)
+    duplicate_of: "int | None" = None
+
+
+@dataclass
+class BatchDownloadResult:
+    """Outcome of a batch download: one :class:`BatchItem` per requested URL."""
+
+    items: list[BatchItem] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> "list[BatchItem]":
+        return [item for item in self.items if item.success]
+
+    @property
+    def failed(self) -> "list[BatchItem]":
+        return [item for item in self.items if not item.success]
 
 
 @dataclass
@@ -0,0 +1,58 @@
+"""Snapshots of a playlist's entry ids for incremental sync.
+
+A sync run (:meth:`DownloadWorkflows.sync_playlist`) records the ids of every
+video it has downloaded into a small JSON file inside the playlist folder. The
+next run diffs the current listing against it, so only videos added since then
+are resolved and downloaded. The snapshot also keeps the zero-padding width of
+numbered file names (``counter_width``), so a playlist that grows past 9 or 99
+videos keeps numbering new files like the old ones, and the description of
+every downloaded video (``descriptions``, by id): a re-run skips archived
+videos unresolved, and ``Link.txt`` is rebuilt from these. Keeping the snapshot beside the files means a moved
+or copied playlist folder keeps its sync state.
+"""
+
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = '.playlist_sync.json'
+
+
+def load_snapshot(folder: str) -> "dict | None":
+    """Return the snapshot stored in ``folder``, or ``None`` if there is none."""
+    path = os.path.join(folder, SNAPSHOT_FILE)
+    try:
+        with open(path, encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable sync snapshot %s (%s)", path, e)
+        return None
+    logger.debug("Loaded sync snapshot %s (%d entries)", path, len(snapshot.get('entries', [])))
+    return snapshot
+
+
+def save_snapshot(folder: str, playlist_id: str, url: str, entry_ids: "list[str]",
+                  counter_width: "int | None" = None,
+                  descriptions: "dict[str, str] | None" = None) -> None:
+    """Write the snapshot atomically (temp file + rename)."""
+    path = os.path.join(folder, SNAPSHOT_FILE)
+    snapshot = {
+        'playlist_id': playlist_id,
+        'url': url,
+        'entries': entry_ids,
+        'updated_at': time.time(),
+    }
+    if counter_width is not None:
+        snapshot['counter_width'] = counter_width
+    if descriptions is not None:
+        snapshot['descriptions'] = descriptions
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, indent=2)
+    os.replace(tmp_path, path)
+    logger.info("Saved sync snapshot %s (%d entries)", path, len(entry_ids))
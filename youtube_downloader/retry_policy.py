@@ -0,0 +1,207 @@
+"""Error-classified retries for video downloads.
+
+Download failures are not alike, and neither should their retries be:
+
+* ``forbidden`` — HTTP 403 from a throttled / PO-token-gated player client. The
+  next attempt re-extracts with a different ``player_client`` set.
+* ``rate_limited`` / ``transient`` — 429, 5xx, resets, timeouts, truncated reads.
+  Retried after an exponential backoff with full jitter.
+* ``unavailable`` — private, removed, region-locked, members-only, age-gated or
+  unsupported. Retrying can't help, so the download fails at once.
+* ``local`` — the disk is full, the path is not writable, ... Also fails at once.
+* ``unknown`` — anything else; retried like a transient error.
+
+:class:`RetryPolicy` runs an attempt function under these rules and returns a
+:class:`DownloadOutcome` carrying every failed attempt, so a playlist no longer
+spends minutes retrying a video that can never succeed.
+"""
+
+import errno
+import logging
+import random
+import re
+import time
+
+from .cancellation import CancelToken, Cancelled
+from .models import DownloadAttempt, DownloadOutcome
+from .ytdlp_support import PLAYER_CLIENTS
+
+logger = logging.getLogger(__name__)
+
+FORBIDDEN = 'forbidden'
+RATE_LIMITED = 'rate_limited'
+TRANSIENT = 'transient'
+UNAVAILABLE = 'unavailable'
+LOCAL = 'local'
+UNKNOWN = 'unknown'
+
+PERMANENT = frozenset({UNAVAILABLE, LOCAL})
+
+# Player client sets tried in turn after 403s; the first is the normal set.
+CLIENT_FALLBACKS = (
+    PLAYER_CLIENTS,
+    ('tv', 'web_safari'),
+    ('mweb', 'web_safari'),
+    ('ios',),
+)
+
+_UNAVAILABLE_PATTERNS = re.compile(
+    r'video unavailable|private video|has been removed|no longer available'
+    r'|not available in your country|members[- ]only|join this channel'
+    r'|sign in to confirm your age|inappropriate for some users'
+    r'|copyright|unsupported url|is not a valid url|premieres in|live event will begin',
+    re.IGNORECASE,
+)
+_LOCAL_ERRNOS = {errno.ENOSPC, errno.EDQUOT, errno.EACCES, errno.EPERM, errno.EROFS, errno.ENAMETOOLONG}
+_LOCAL_PATTERNS = re.compile(
+    r'no space left on device|disk quota exceeded|permission denied|read-only file system'
+    r'|file name too long',
+    re.IGNORECASE,
+)
+_TRANSIENT_PATTERNS = re.compile(
+    r'timed out|timeout|connection reset|connection aborted|connection refused|broken pipe'
+    r'|temporary failure|name resolution|incompleteread|incomplete read|ended early'
+    r'|remote end closed|eof occurred|network is unreachable|unable to download',
+    re.IGNORECASE,
+)
+_STATUS_PATTERN = re.compile(r'HTTP Error (\d{3})')
+
+
+def _causes(error: BaseException):
+    """``error`` and everything it wraps (yt-dlp's ``exc_info``, ``__cause__``, ...)."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        exc_info = getattr(error, 'exc_info', None)
+        wrapped = exc_info[1] if isinstance(exc_info, tuple) and len(exc_info) > 1 else None
+        error = wrapped or error.__cause__ or error.__context__
+
+
+def _http_status(error: BaseException) -> "int | None":
+    for cause in _causes(error):
+        for attribute in ('status', 'code'):
+            status = getattr(cause, attribute, None)
+            if isinstance(status, int) and 100 <= status <= 599:
+                return status
+    match = _STATUS_PATTERN.search(str(error))
+    return int(match.group(1)) if match else None
+
+
+def classify(error: BaseException) -> str:
+    """Sort a download failure into one of the categories above."""
+    for cause in _causes(error):
+        if isinstance(cause, OSError) and cause.errno in _LOCAL_ERRNOS:
+            return LOCAL
+    message = ' '.join(str(cause) for cause in _causes(error))
+    if _LOCAL_PATTERNS.search(message):
+        return LOCAL
+    if _UNAVAILABLE_PATTERNS.search(message):
+        return UNAVAILABLE
+    status = _http_status(error)
+    if status == 403:
+        return FORBIDDEN
+    if status == 429:
+        return RATE_LIMITED
+    if status is not None and (status >= 500 or status == 408):
+        return TRANSIENT
+    if status == 404 or status == 410:
+        return UNAVAILABLE
+    if _TRANSIENT_PATTERNS.search(message):
+        return TRANSIENT
+    if any(isinstance(cause, (ConnectionError, TimeoutError)) for cause in _causes(error)):
+        return TRANSIENT
+    return UNKNOWN
+
+
+class RetryPolicy:
+    """Runs download attempts with per-category retry decisions.
+
+    Backoff before attempt ``n + 1`` is a uniform random delay in
+    ``[0, min(max_delay, base_delay * 2 ** (n - 1))]`` ("full jitter"), doubled for
+    rate limiting; a 403 only waits ``base_delay`` before switching clients.
+    ``sleep`` and ``rng`` are injectable so the schedule can be exercised
+    without waiting.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        client_fallbacks: "tuple[tuple[str, ...], ...]" = CLIENT_FALLBACKS,
+        sleep=time.sleep,
+        rng=random.random,
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.client_fallbacks = client_fallbacks
+        self.sleep = sleep
+        self.rng = rng
+
+    def backoff(self, attempt: int, category: str) -> float:
+        if category == FORBIDDEN:
+            return self.base_delay
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        if category == RATE_LIMITED:
+            ceiling = min(self.max_delay, ceiling * 2)
+        return self.rng() * ceiling
+
+    def run(
+        self,
+        attempt_fn,
+        title: str = '',
+        history: "list[DownloadAttempt] | None" = None,
+        cancel_token: "CancelToken | None" = None,
+    ) -> DownloadOutcome:
+        """Call ``attempt_fn(player_clients)`` until it returns without raising.
+
+        ``history`` may carry attempts made before the policy took over (they
+        are kept in the outcome but don't count towards ``max_attempts``).
+        :class:`Cancelled` is never retried: it propagates at once, and
+        cancelling ``cancel_token`` also cuts a backoff wait short.
+        """
+        attempts = list(history or [])
+        client_index = 0
+        last_error: "BaseException | None" = None
+        category = UNKNOWN
+        for number in range(1, self.max_attempts + 1):
+            clients = self.client_fallbacks[client_index]
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            try:
+                attempt_fn(clients)
+                return DownloadOutcome(success=True, attempts=attempts)
+            except Cancelled:
+                raise
+            except Exception as e:
+                last_error = e
+                category = classify(e)
+
+            final = category in PERMANENT or number == self.max_attempts
+            if category == FORBIDDEN and client_index + 1 < len(self.client_fallbacks):
+                client_index += 1
+            delay = 0.0 if final else self.backoff(number, category)
+            attempts.append(DownloadAttempt(
+                number=number, category=category, error=str(last_error),
+                delay=round(delay, 2), player_clients=list(clients),
+            ))
+            if category in PERMANENT:
+                logger.error("'%s' failed permanently (%s): %s", title, category, last_error)
+                break
+            logger.warning("Attempt %d/%d failed for '%s' (%s): %s",
+                           number, self.max_attempts, title, category, last_error)
+            print(f"\nAttempt {number}/{self.max_attempts} failed for '{title}' ({category}): {last_error}")
+            if not final:
+                if cancel_token is None:
+                    self.sleep(delay)
+                elif cancel_token.wait(delay):
+                    raise Cancelled()
+
+        logger.error("Failed to download '%s' after %d attempt(s): %s", title, len(attempts), last_error)
+        print(f"\nFailed to download '{title}': {last_error}\n")
+        return DownloadOutcome(
+            success=False, error=str(last_error), attempts=attempts,
+            permanent=category in PERMANENT,
+        )
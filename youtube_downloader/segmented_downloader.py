@@ -0,0 +1,527 @@
+"""Multi-connection HTTP downloader: each stream is fetched as parallel byte ranges.
+
+YouTube throttles a single connection, which caps :class:`YtDlpDownloader` on the
+large ``bestvideo`` streams. :class:`SegmentedHttpDownloader` lets yt-dlp pick the
+formats exactly as before, then downloads each selected stream itself with
+:class:`RangeFetcher` — several HTTP ``Range`` requests in flight at once — and
+merges video and audio with ffmpeg.
+
+:class:`RangeFetcher` knows nothing about YouTube: give it a URL that honours
+``Range`` and a destination path. It
+
+* splits the file into segments and starts with a couple of connections, adding
+  one while aggregate throughput keeps improving and dropping one when the
+  server pushes back (errors / 429);
+* records finished segments next to the ``.part`` file, so an interrupted
+  download resumes at segment level instead of from zero;
+* falls back to one plain request when the server doesn't support ranges.
+
+Formats that aren't plain HTTP(S) (HLS / DASH fragments) are handed to the
+fallback downloader, normally :class:`YtDlpDownloader`.
+"""
+
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from .bandwidth import BandwidthLimiter, ThroughputMeter, default_limiter
+from .cancellation import CancelToken, Cancelled, cancellable_hook
+from .downloader import YtDlpDownloader
+from .extracted_info import ExtractedInfoStore, default_info_store
+from .format_profiles import DEFAULT_PROFILE
+from .interfaces import VideoDownloader
+from .models import DownloadOutcome
+from .retry_policy import RetryPolicy
+from .settings import get_settings
+from .utils import youtube_video_id
+from .ytdlp_pool import YoutubeDLPool, default_pool
+
+logger = logging.getLogger(__name__)
+
+MIB = 1024 * 1024
+
+_BLOCK_SIZE = 64 * 1024
+# Keep individual ranges small enough that YouTube doesn't throttle them.
+_MIN_SEGMENT = 1 * MIB
+_MAX_SEGMENT = 10 * MIB
+# A new connection must raise throughput by this factor to be kept growing.
+_GROWTH_THRESHOLD = 1.1
+_RETRYABLE_STATUS = {403, 408, 429, 500, 502, 503, 504}
+
+
+class RangeNotSupported(Exception):
+    """The server ignored a ``Range`` request."""
+
+
+def _plan_segments(size: int, max_connections: int) -> "list[tuple[int, int]]":
+    """Inclusive ``(start, end)`` byte ranges covering ``size`` bytes.
+
+    Aims for a few segments per connection (so fast connections can take more
+    work than slow ones), within ``_MIN_SEGMENT`` .. ``_MAX_SEGMENT`` each.
+    """
+    segment = min(_MAX_SEGMENT, max(_MIN_SEGMENT, size // (max_connections * 4)))
+    return [(start, min(start + segment, size) - 1) for start in range(0, size, segment)]
+
+
+class _ResumeState:
+    """Finished segment indices for one ``.part`` file, persisted as JSON."""
+
+    def __init__(self, path: str, size: int, segments: "list[tuple[int, int]]") -> None:
+        self.path = path
+        self.size = size
+        self.segments = segments
+        self.done: "set[int]" = set()
+        self._lock = threading.Lock()
+
+    def load(self, part_path: str) -> None:
+        """Pick up segments finished by an earlier run (same size and plan only)."""
+        if not os.path.exists(part_path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        if saved.get('size') == self.size and saved.get('segments') == [list(s) for s in self.segments]:
+            self.done = set(saved.get('done', []))
+            logger.info("Resuming %s: %d/%d segments already downloaded",
+                        part_path, len(self.done), len(self.segments))
+
+    def mark_done(self, index: int) -> None:
+        with self._lock:
+            self.done.add(index)
+            tmp_path = f'{self.path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'size': self.size, 'segments': self.segments, 'done': sorted(self.done)}, f)
+            os.replace(tmp_path, self.path)
+
+    def downloaded_bytes(self) -> int:
+        return sum(self.segments[i][1] - self.segments[i][0] + 1 for i in self.done)
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class RangeFetcher:
+    """Downloads one URL to a file using parallel ``Range`` requests.
+
+    ``on_bytes(downloaded, total)`` is called (from the worker threads, under a
+    lock) as data arrives; ``downloaded`` includes segments resumed from disk.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 8,
+        initial_connections: int = 2,
+        segment_retries: int = 5,
+        timeout: float = 30,
+    ) -> None:
+        self.max_connections = max(1, max_connections)
+        self.initial_connections = max(1, min(initial_connections, self.max_connections))
+        self.segment_retries = segment_retries
+        self.timeout = timeout
+
+    # ------------------------------------------------------------------ #
+    # HTTP helpers
+    # ------------------------------------------------------------------ #
+    def _open(self, url: str, headers: dict, byte_range: "tuple[int, int] | None" = None):
+        request = urllib.request.Request(url, headers=dict(headers))
+        if byte_range is not None:
+            request.add_header('Range', f'bytes={byte_range[0]}-{byte_range[1]}')
+        return urllib.request.urlopen(request, timeout=self.timeout)
+
+    def probe(self, url: str, headers: dict) -> "tuple[int | None, bool]":
+        """``(size, supports_ranges)`` from a one-byte range request."""
+        with self._open(url, headers, (0, 0)) as response:
+            if response.status == 206:
+                content_range = response.headers.get('Content-Range', '')
+                total = content_range.rpartition('/')[2]
+                return (int(total) if total.isdigit() else None), True
+            length = response.headers.get('Content-Length')
+            return (int(length) if length and length.isdigit() else None), False
+
+    # ------------------------------------------------------------------ #
+    # Download
+    # ------------------------------------------------------------------ #
+    def fetch(self, url: str, dest: str, headers: "dict | None" = None, on_bytes=None) -> None:
+        """Download ``url`` to ``dest`` (written via ``dest + '.part'``)."""
+        headers = headers or {}
+        size, ranged = self.probe(url, headers)
+        if not ranged or not size or size < 2 * _MIN_SEGMENT:
+            logger.info("Fetching %s in one request (ranges: %s, size: %s)", dest, ranged, size)
+            self._fetch_whole(url, dest, headers, on_bytes)
+            return
+
+        segments = _plan_segments(size, self.max_connections)
+        part_path = f'{dest}.part'
+        state = _ResumeState(f'{part_path}.segments.json', size, segments)
+        state.load(part_path)
+        with open(part_path, 'r+b' if os.path.exists(part_path) else 'wb') as f:
+            f.truncate(size)
+
+        _SegmentRun(self, url, headers, part_path, state, on_bytes).run()
+        os.replace(part_path, dest)
+        state.remove()
+        logger.info("Fetched %s (%d bytes, %d segments)", dest, size, len(segments))
+
+    def _fetch_whole(self, url: str, dest: str, headers: dict, on_bytes) -> None:
+        part_path = f'{dest}.part'
+        downloaded = 0
+        with self._open(url, headers) as response, open(part_path, 'wb') as f:
+            total = int(response.headers.get('Content-Length') or 0) or None
+            while True:
+                block = response.read(_BLOCK_SIZE)
+                if not block:
+                    break
+                f.write(block)
+                downloaded += len(block)
+                if on_bytes is not None:
+                    on_bytes(downloaded, total)
+        os.replace(part_path, dest)
+
+    def fetch_segment(self, url: str, headers: dict, byte_range: "tuple[int, int]", f, on_block) -> None:
+        """Write one range into the open file ``f`` at its offset."""
+        start, end = byte_range
+        with self._open(url, headers, byte_range) as response:
+            if response.status != 206:
+                raise RangeNotSupported(f'expected 206, got {response.status}')
+            offset = start
+            while True:
+                block = response.read(min(_BLOCK_SIZE, end + 1 - offset))
+                if not block:
+                    break
+                f.seek(offset)
+                f.write(block)
+                offset += len(block)
+                on_block(len(block))
+                if offset > end:
+                    break
+        if offset != end + 1:
+            raise IOError(f'segment {start}-{end} ended early at {offset}')
+
+
+class _SegmentRun:
+    """One :meth:`RangeFetcher.fetch` of the remaining segments.
+
+    Workers pull segment indices from a queue. ``target`` is how many workers
+    should be active: it grows by one whenever the throughput measured since the
+    last change beat the previous measurement, and shrinks on errors (extra
+    workers then exit after their current segment).
+    """
+
+    def __init__(self, fetcher: RangeFetcher, url: str, headers: dict, part_path: str,
+                 state: _ResumeState, on_bytes) -> None:
+        self.fetcher = fetcher
+        self.url = url
+        self.headers = headers
+        self.part_path = part_path
+        self.state = state
+        self.on_bytes = on_bytes
+        self.pending: "queue.Queue[int]" = queue.Queue()
+        for index in range(len(state.segments)):
+            if index not in state.done:
+                self.pending.put(index)
+        self.failures: "dict[int, int]" = {}
+        self.error: "Exception | None" = None
+        self.downloaded = state.downloaded_bytes()
+        self.target = fetcher.initial_connections
+        self.active = 0
+        self.threads: "list[threading.Thread]" = []
+        self._lock = threading.Lock()
+        self._progress_lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_bytes = 0
+        self._best_rate = 0.0
+
+    def run(self) -> None:
+        for _ in range(self.target):
+            self._spawn()
+        while True:
+            with self._lock:
+                alive = [t for t in self.threads if t.is_alive()]
+            if not alive:
+                break
+            alive[0].join()
+        if self.error is not None:
+            raise self.error
+        if len(self.state.done) != len(self.state.segments):
+            raise IOError(f'{len(self.state.segments) - len(self.state.done)} segment(s) missing')
+
+    def _spawn(self) -> None:
+        with self._lock:
+            self.active += 1
+            thread = threading.Thread(target=self._worker, name='segment-fetch', daemon=True)
+            self.threads.append(thread)
+        thread.start()
+
+    def _on_block(self, amount: int) -> None:
+        with self._progress_lock:
+            self.downloaded += amount
+            self._window_bytes += amount
+            downloaded = self.downloaded
+        # Outside the lock: the hook may throttle, pause or raise Cancelled.
+        if self.on_bytes is not None:
+            self.on_bytes(downloaded, self.state.size)
+
+    def _retire(self) -> bool:
+        """Whether this worker should stop (over target, failed, or out of work)."""
+        with self._lock:
+            if self.error is not None or self.active > self.target or self.pending.empty():
+                self.active -= 1
+                return True
+            return False
+
+    def _worker(self) -> None:
+        with open(self.part_path, 'r+b') as f:
+            while not self._retire():
+                try:
+                    index = self.pending.get_nowait()
+                except queue.Empty:  # another worker took the last segment
+                    with self._lock:
+                        self.active -= 1
+                    return
+                try:
+                    self.fetcher.fetch_segment(
+                        self.url, self.headers, self.state.segments[index], f, self._on_block
+                    )
+                except Cancelled as e:  # raised by the progress hook; stop every worker
+                    with self._lock:
+                        if self.error is None:
+                            self.error = e
+                        self.active -= 1
+                    return
+                except (urllib.error.URLError, OSError, RangeNotSupported) as e:
+                    self._segment_failed(index, e)
+                    continue
+                self.state.mark_done(index)
+                self._maybe_grow()
+
+    def _segment_failed(self, index: int, error: Exception) -> None:
+        status = getattr(error, 'code', None)
+        retryable = not isinstance(error, RangeNotSupported) and (
+            status is None or status in _RETRYABLE_STATUS
+        )
+        with self._lock:
+            failures = self.failures[index] = self.failures.get(index, 0) + 1
+            if not retryable or failures > self.fetcher.segment_retries:
+                # Keep the first error: it is the root cause the run reports.
+                if self.error is None:
+                    self.error = error
+                permanent = True
+            else:
+                self.target = max(1, self.target - 1)
+                permanent = False
+        if permanent:
+            logger.warning("Segment %d failed permanently: %s", index, error)
+            return
+        logger.info("Segment %d failed (%s); retrying with %d connection(s)", index, error, self.target)
+        time.sleep(min(2 ** failures, 10))
+        self.pending.put(index)
+
+    def _maybe_grow(self) -> None:
+        """Add a connection while each extra one still raises throughput."""
+        with self._progress_lock:
+            elapsed = time.monotonic() - self._window_start
+            if elapsed < 1.0:
+                return
+            rate = self._window_bytes / elapsed
+            self._window_start, self._window_bytes = time.monotonic(), 0
+        with self._lock:
+            grow = (
+                rate > self._best_rate * _GROWTH_THRESHOLD
+                and self.target < self.fetcher.max_connections
+                and not self.pending.empty()
+            )
+            self._best_rate = max(self._best_rate, rate)
+            if grow:
+                self.target += 1
+        if grow:
+            logger.debug("Throughput %.0f B/s; growing to %d connections", rate, self.target)
+            self._spawn()
+
+
+class _ProgressReporter:
+    """Turns byte counts into yt-dlp-style progress dicts for one output file.
+
+    Called from every segment worker at once; a total already overtaken by
+    another worker's report is dropped, so the hook only sees growing counts.
+    """
+
+    def __init__(self, filename: str, progress_hook) -> None:
+        self.filename = filename
+        self.progress_hook = progress_hook
+        self.meter = ThroughputMeter()
+        self._last = None
+        self._lock = threading.Lock()
+
+    def __call__(self, downloaded: int, total: "int | None") -> None:
+        with self._lock:
+            if self._last is not None:
+                if downloaded <= self._last:
+                    return
+                self.meter.add(downloaded - self._last)
+            self._last = downloaded
+        speed = self.meter.rate()
+        self.progress_hook({
+            'status': 'downloading',
+            'filename': self.filename,
+            'tmpfilename': f'{self.filename}.part',
+            'downloaded_bytes': downloaded,
+            'total_bytes': total,
+            'speed': speed or None,
+            'eta': int((total - downloaded) / speed) if total and speed else None,
+        })
+
+    def finished(self) -> None:
+        self.progress_hook({'status': 'finished', 'filename': self.filename})
+
+
+class SegmentedHttpDownloader(VideoDownloader):
+    """Downloads the formats yt-dlp selects using parallel HTTP range requests.
+
+    Format selection, the retry policy and the output name match :class:`YtDlpDownloader`
+    (``<title>.mp4``, or the audio stream's own extension for the audio-only
+    profile); only the transfer differs. Bandwidth caps still apply via
+    the shared :class:`BandwidthLimiter`.
+    """
+
+    def __init__(
+        self,
+        fallback: "VideoDownloader | None" = None,
+        fetcher: "RangeFetcher | None" = None,
+        pool: "YoutubeDLPool | None" = None,
+        limiter: "BandwidthLimiter | None" = None,
+        info_store: "ExtractedInfoStore | None" = None,
+        retry_policy: "RetryPolicy | None" = None,
+    ) -> None:
+        self.pool = pool or default_pool
+        self.limiter = limiter or default_limiter
+        self.info_store = info_store or default_info_store
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.fallback = fallback or YtDlpDownloader(pool=self.pool, limiter=self.limiter)
+        self.fetcher = fetcher or RangeFetcher(max_connections=get_settings().segmented_max_connections)
+
+    def prewarm(self) -> None:
+        self.fallback.prewarm()
+
+    def _select_formats(
+        self, url: str, reuse: bool, player_clients: "tuple[str, ...]", format_profile: str
+    ) -> "list[dict]":
+        """The format dicts yt-dlp would download (video + audio, or one muxed).
+
+        With ``reuse``, formats are selected from the info dict the info provider
+        stored (no extraction) when it is still valid.
+        """
+        video_id = youtube_video_id(url)
+        stored = self.info_store.get(video_id) if reuse and video_id else None
+        with self.pool.acquire(YtDlpDownloader._ydl_opts(player_clients, format_profile)) as ydl:
+            if stored is not None:
+                logger.info("Selecting formats from extracted info for %s", video_id)
+                info = ydl.process_ie_result(stored, download=False)
+            else:
+                info = ydl.extract_info(url, download=False)
+        return info.get('requested_formats') or [info]
+
+    def download(
+        self,
+        url: str,
+        title: str,
+        output_path: str = '.',
+        progress_hook=None,
+        format_profile: str = DEFAULT_PROFILE,
+        cancel_token: "CancelToken | None" = None,
+    ) -> DownloadOutcome:
+        logger.info("Downloading '%s' (%s) -> %s (segmented)", title, format_profile, output_path)
+        first_attempt = True
+        fallback_outcome: "DownloadOutcome | None" = None
+
+        def attempt(clients: "tuple[str, ...]") -> None:
+            nonlocal first_attempt, fallback_outcome
+            # Only the first attempt may reuse stored info; retries (expired
+            # URL, 403, ...) extract afresh.
+            reuse, first_attempt = first_attempt, False
+            try:
+                formats = self._select_formats(url, reuse, clients, format_profile)
+                if not all(f.get('protocol') in ('http', 'https') for f in formats):
+                    logger.info("'%s' has non-HTTP formats; using %s",
+                                title, type(self.fallback).__name__)
+                    fallback_outcome = self.fallback.download(
+                        url, title, output_path, progress_hook, format_profile, cancel_token
+                    )
+                    return
+                self._download_formats(formats, title, output_path, progress_hook, cancel_token)
+            except Exception:
+                if reuse:
+                    self.info_store.discard(youtube_video_id(url) or '')
+                raise
+            if reuse:
+                self.info_store.discard(youtube_video_id(url) or '')  # used up
+
+        outcome = self.retry_policy.run(attempt, title, cancel_token=cancel_token)
+        if fallback_outcome is not None:
+            return fallback_outcome
+        if outcome:
+            logger.info("Downloaded '%s'", title)
+        return outcome
+
+    def _download_formats(
+        self, formats: "list[dict]", title: str, output_path: str, progress_hook,
+        cancel_token: "CancelToken | None" = None,
+    ) -> None:
+        os.makedirs(output_path, exist_ok=True)
+        # A single stream keeps its container (e.g. audio-only .m4a); video +
+        # audio are merged into an .mp4.
+        extension = formats[0]['ext'] if len(formats) == 1 else 'mp4'
+        output_file = os.path.join(output_path, f'{title}.{extension}')
+        hook = cancellable_hook(self.limiter.wrap_hook(progress_hook), cancel_token)
+        pieces = []
+        for fmt in formats:
+            piece = os.path.join(output_path, f"{title}.f{fmt['format_id']}.{fmt['ext']}")
+            reporter = _ProgressReporter(piece, hook)
+            self.fetcher.fetch(fmt['url'], piece, fmt.get('http_headers'), on_bytes=reporter)
+            reporter.finished()
+            pieces.append(piece)
+
+        if len(pieces) == 1:
+            os.replace(pieces[0], output_file)
+            return
+        merge_streams(pieces, output_file, cancel_token)
+        for piece in pieces:
+            os.remove(piece)
+
+
+def merge_streams(pieces: "list[str]", output_file: str, cancel_token: "CancelToken | None" = None) -> None:
+    """Mux separately downloaded video and audio streams with ffmpeg (no re-encode).
+
+    Cancelling ``cancel_token`` kills ffmpeg, removes the partial output and
+    raises :class:`Cancelled`.
+    """
+    command = [get_settings().ffmpeg_path, '-y', '-loglevel', 'error']
+    for piece in pieces:
+        command += ['-i', piece]
+    for index in range(len(pieces)):
+        command += ['-map', f'{index}:0']
+    command += ['-c', 'copy', output_file]
+    logger.debug("Merging %d streams -> %s", len(pieces), output_file)
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    unregister = cancel_token.on_cancel(proc.kill) if cancel_token is not None else None
+    try:
+        _, stderr = proc.communicate()
+    finally:
+        if unregister is not None:
+            unregister()
+    if cancel_token is not None and cancel_token.cancelled:
+        if os.path.exists(output_file):
+            os.remove(output_file)
+        raise Cancelled()
+    if proc.returncode != 0:
+        raise RuntimeError(f'ffmpeg merge failed: {stderr.strip()}')
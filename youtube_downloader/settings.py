@@ -0,0 +1,140 @@
+"""Typed, immutable snapshot of the ``settings`` block in ``metadata.json``.
+
+:func:`get_settings` returns a frozen :class:`Settings` built from the cached
+metadata (see :func:`youtube_downloader.metadata.get_metadata`), so hot paths —
+every info fetch and every download — read plain attributes instead of opening
+and parsing ``metadata.json``. A new snapshot is built only when the file
+actually changed.
+
+Values that need a filesystem lookup to resolve (the JS runtime on ``PATH``, the
+ffmpeg binary) are memoised on the snapshot the first time they are read.
+"""
+
+import dataclasses
+import logging
+import shutil
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+
+from .ffmpeg_support import ffmpeg_location
+from .metadata import get_metadata
+
+logger = logging.getLogger(__name__)
+
+# Runtimes yt-dlp can use to solve YouTube's signature ("nsig") challenge,
+# in order of preference (deno is yt-dlp's default/recommended runtime).
+_JS_RUNTIMES = ('deno', 'node', 'bun')
+
+
+@dataclass(frozen=True)
+class Settings:
+    """The app's settings, with their defaults when ``metadata.json`` omits them."""
+
+    use_js_runtime: bool = False
+    log_level: str = 'INFO'
+    check_for_updates: bool = True
+    playlist_info_workers: int = 8
+    lazy_playlists: bool = True
+    playlist_download_workers: int = 1
+    max_concurrent_jobs: int = 2
+    # GUI web server: "threaded" (Flask), "waitress" or "asgi" (uvicorn, async SSE streams).
+    gui_server: str = 'threaded'
+    # Address and port the GUI binds to (port 0 = any free port).
+    gui_host: str = '127.0.0.1'
+    gui_port: int = 0
+    # waitress worker threads (progress streams are polled there, so they hold
+    # none), and open connections allowed (waitress / headless asgi).
+    gui_server_threads: int = 16
+    gui_connection_limit: int = 200
+    # Headless shutdown: seconds to wait for running downloads before cancelling them.
+    gui_drain_seconds: float = 600.0
+    # Threads GUI jobs run on (downloads plus playlist-info streams).
+    max_job_workers: int = 8
+    # GUI progress updates per download per second (0 = every yt-dlp callback).
+    progress_events_per_second: float = 4.0
+    # Shortest gap between frames of the multiplexed /api/events stream.
+    event_stream_batch_seconds: float = 0.1
+    # Events each GUI job keeps for replay, and how long finished jobs are kept.
+    job_event_buffer: int = 1000
+    job_retention_seconds: float = 600.0
+    max_retained_jobs: int = 200
+    # Download caps in KiB/s; 0 means unlimited.
+    max_download_rate_kbps: float = 0.0
+    max_job_download_rate_kbps: float = 0.0
+    # 'yt-dlp' (default) or 'segmented' (parallel HTTP range requests).
+    downloader_backend: str = 'yt-dlp'
+    segmented_max_connections: int = 8
+    use_info_cache: bool = True
+    info_cache_video_ttl_hours: float = 24.0
+    info_cache_playlist_ttl_hours: float = 1.0
+    info_cache_max_mb: float = 50.0
+    use_download_archive: bool = True
+    verify_download_archive: bool = True
+    # Before a run that may not fit: 'refuse' it, 'fit' (download only what fits),
+    # 'warn' (log it) or 'off'.
+    disk_space_check: str = 'refuse'
+    disk_space_reserve_mb: float = 200.0
+    # Explicit ffmpeg binary; empty means "bundled, then PATH" (see ffmpeg_support).
+    ffmpeg_location: str = ''
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "Settings":
+        """Build a snapshot, coercing each value to its field's type.
+
+        Unknown keys are ignored and a value that can't be coerced falls back to
+        the default (with a warning), so a typo never crashes the app.
+        """
+        values = {}
+        for f in dataclasses.fields(cls):
+            if f.name not in raw:
+                continue
+            try:
+                values[f.name] = _coerce(f.type, raw[f.name])
+            except (TypeError, ValueError):
+                logger.warning("Invalid value for setting %s: %r; using %r",
+                               f.name, raw[f.name], f.default)
+        return cls(**values)
+
+    @cached_property
+    def js_runtime(self) -> "str | None":
+        """The JS runtime to hand yt-dlp for nsig solving, or ``None``.
+
+        ``None`` when ``use_js_runtime`` is off or no runtime is on ``PATH``.
+        """
+        if not self.use_js_runtime:
+            return None
+        for runtime in _JS_RUNTIMES:
+            if shutil.which(runtime):
+                logger.info("JS runtime enabled for nsig solving: %s", runtime)
+                return runtime
+        logger.warning("use_js_runtime is on but no JS runtime (deno/node/bun) found on PATH")
+        return None
+
+    @cached_property
+    def ffmpeg_path(self) -> str:
+        """The ffmpeg binary for merges and chapter splits."""
+        return self.ffmpeg_location or ffmpeg_location()
+
+
+def _coerce(kind: type, value):
+    """Convert a JSON value to the field's type (``"false"`` reads as ``False``)."""
+    if kind is bool and isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return kind(value)
+
+
+_lock = threading.Lock()
+_snapshot: "tuple[dict, Settings] | None" = None
+
+
+def get_settings() -> Settings:
+    """Return the current settings snapshot (rebuilt only when metadata changed)."""
+    global _snapshot
+    metadata = get_metadata()
+    raw = metadata.get('settings', {}) or {}
+    with _lock:
+        if _snapshot is None or _snapshot[0] is not raw:
+            _snapshot = (raw, Settings.from_dict(raw))
+            logger.debug("Loaded settings: %s", _snapshot[1])
+        return _snapshot[1]
@@ -15,6 +15,7 @@ import urllib.request
 
 from .metadata import get_metadata
 from .models import UpdateInfo
+from .settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -99,12 +100,11 @@ def check_for_update() -> "UpdateInfo | None":
     Honors the ``settings.check_for_updates`` flag in ``metadata.json`` (default
     ``True``). Never raises — network/parse failures resolve to ``None``.
     """
-    meta = get_metadata()
-    settings = meta.get("settings", {}) or {}
-    if not settings.get("check_for_updates", True):
+    if not get_settings().check_for_updates:
         logger.debug("Update check disabled via settings")
         return None
 
+    meta = get_metadata()
     current = meta.get("version", "0.0.0")
     remote = _fetch_remote_metadata(meta.get("repository", ""))
     if not remote:
@@ -1,6 +1,7 @@
 """Pure, dependency-free helper functions shared across the package."""
 
 import re
+from urllib.parse import parse_qs, urlparse
 
 from pysrt import SubRipTime
 
@@ -46,3 +47,25 @@ def format_counter(counter: int, length: int) -> str:
 def seconds_to_srt_time(seconds: float) -> SubRipTime:
     """Convert a number of seconds into a :class:`SubRipTime` position."""
     return SubRipTime.from_ordinal(int(seconds * 1000))
+
+
+def youtube_video_id(url: str) -> str:
+    """Extract the video id from a YouTube video URL (``""`` if there is none).
+
+    Handles ``watch?v=``, ``youtu.be/<id>``, ``/shorts/<id>``, ``/embed/<id>`` and
+    ``/live/<id>`` links.
+    """
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or '').lower()
+    if host.endswith('youtu.be'):
+        return parsed.path.strip('/').split('/')[0]
+    video_id = parse_qs(parsed.query).get('v', [''])[0]
+    if video_id:
+        return video_id
+    match = re.match(r'^/(?:shorts|embed|live|v)/([\w-]+)', parsed.path)
+    return match.group(1) if match else ""
+
+
+def youtube_playlist_id(url: str) -> str:
+    """Extract the ``list=`` playlist id from a YouTube URL (``""`` if there is none)."""
+    return parse_qs(urlparse(url.strip()).query).get('list', [''])[0]
@@ -5,12 +5,23 @@ sequence that used to live inside ``ConsoleApp``. It performs no user I/O: the
 console and the GUI both call it, supplying their own progress/status callbacks.
 """
 
+import itertools
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from .filesystem import create_text_file, ensure_dir
-from .interfaces import ChapterSplitter, SubtitleService, VideoDownloader
+from .cancellation import CancelToken, Cancelled, raise_if_cancelled
+from .disk_space import plan_downloads
+from .download_archive import DownloadArchive
+from .filesystem import create_text_file, ensure_dir, remove_partial_downloads
+from .format_profiles import DEFAULT_PROFILE, estimate_video_size, get_profile, observed_bytes_per_second
+from .interfaces import ChapterSplitter, InfoProvider, SubtitleService, VideoDownloader
 from .models import (
+    BatchDownloadOptions,
+    BatchDownloadResult,
+    BatchItem,
+    DownloadOutcome,
     PlaylistDownloadOptions,
     PlaylistDownloadResult,
     PlaylistInfo,
@@ -18,51 +29,215 @@ from .models import (
     VideoDownloadResult,
     VideoInfo,
 )
-from .utils import format_counter
+from .playlist_sync import load_snapshot, save_snapshot
+from .settings import get_settings
+from .utils import format_counter, youtube_playlist_id, youtube_video_id
 
 logger = logging.getLogger(__name__)
 
 
+def _link_entry(position: int, title: str, description: str) -> "list[str]":
+    """The ``Link.txt`` lines describing one playlist video."""
+    return [
+        f"Video #{position}\n",
+        "====================================\n",
+        f"Title: {title}\n",
+        f"Description: {description} \n",
+        "====================================\n\n\n\n\n\n\n",
+    ]
+
+
+def _playlist_link_header(info: PlaylistInfo) -> "list[str]":
+    """The ``Link.txt`` lines that open a playlist's file."""
+    return ["Playlist Url: \n", info.url, "\n\n\n\n\n\n\n\n\n\n", "Videos Information: \n\n\n\n"]
+
+
+def _failure_line(index: int, video_title: str, outcome) -> str:
+    """``failed_videos`` entry for the video at 0-based ``index``."""
+    reason = getattr(outcome, 'error', '')
+    return f"#{index+1} - {video_title}" + (f": {reason}" if reason else "")
+
+
+def _batch_key(url: str) -> "tuple[str, str]":
+    """``(kind, key)`` of a batch URL: what it downloads, and what it is deduplicated by.
+
+    Links to a video (even one opened from a playlist) are keyed by video id,
+    ``list=`` links by playlist id, anything else by the URL itself.
+    """
+    video_id = youtube_video_id(url)
+    if video_id:
+        return 'video', video_id
+    playlist_id = youtube_playlist_id(url)
+    if playlist_id:
+        return 'playlist', playlist_id
+    return 'video', url.strip()
+
+
+def _tagged_hook(progress_hook, item_index: int):
+    """``progress_hook`` with every dict tagged with the batch item it belongs to."""
+    if progress_hook is None:
+        return None
+    return lambda d: progress_hook({**d, 'batch_item': item_index})
+
+
+def _output_file(save_path: str, title: str, format_profile: str) -> str:
+    """Path of the downloaded file for ``title`` in this profile.
+
+    Audio downloads keep the stream's own container (``.m4a`` or ``.webm``), so
+    this is the first candidate that exists, else the most likely one.
+    """
+    candidates = [os.path.join(save_path, f"{title}.{ext}")
+                  for ext in get_profile(format_profile).extensions]
+    return next((path for path in candidates if os.path.exists(path)), candidates[0])
+
+
+def _counter_width(info: PlaylistInfo, snapshot: "dict | None") -> int:
+    """Zero-padding width of numbered titles: the snapshot's, else the playlist's length."""
+    return (snapshot or {}).get('counter_width') or len(str(info.number_videos))
+
+
+def _playlist_video_title(info: PlaylistInfo, index: int, numerate: bool,
+                          width: "int | None" = None) -> str:
+    """File title for the video at 0-based ``index`` (numbered when requested).
+
+    ``width`` fixes the counter's zero-padding (default: the playlist's length).
+    """
+    video = info.videos_info[index]
+    if numerate:
+        total = info.number_videos if width is None else 10 ** (width - 1)
+        return f"{format_counter(index + 1, total)}{video.title}"
+    return video.title
+
+
 class DownloadWorkflows:
-    """Orchestrates the actual download work behind any front-end."""
+    """Orchestrates the actual download work behind any front-end.
+
+    ``info_provider`` is only needed for unresolved videos — lazy playlists and
+    entries that failed to resolve (see :attr:`VideoInfo.resolved`): they are
+    resolved through it right before they are downloaded, so unselected videos
+    are never extracted.
+
+    With an ``archive``, videos it lists as already downloaded are skipped before
+    any network call, and every successful download is recorded in it.
+
+    Before downloading, the expected size of the run is checked against the free
+    space in the save folder (see :mod:`~youtube_downloader.disk_space`).
+    """
 
     def __init__(
         self,
         downloader: VideoDownloader,
         subtitle_service: SubtitleService,
         chapter_splitter: ChapterSplitter,
+        info_provider: "InfoProvider | None" = None,
+        archive: "DownloadArchive | None" = None,
     ) -> None:
         self.downloader = downloader
         self.subtitle_service = subtitle_service
         self.chapter_splitter = chapter_splitter
+        self.info_provider = info_provider
+        self.archive = archive
+
+    def _resolve(self, video: VideoInfo) -> VideoInfo:
+        """Fully resolve a lazy playlist video (no-op when already resolved)."""
+        if video.resolved or self.info_provider is None:
+            return video
+        return self.info_provider.resolve_video(video)
+
+    def _archived(self, video_id: str, title: str, save_path: str, format_profile: str) -> "DownloadOutcome | None":
+        """A ``skipped`` outcome if the archive already has this profile's output file, else ``None``."""
+        video_file = _output_file(save_path, title, format_profile)
+        if self.archive is None or not self.archive.contains(video_id, video_file):
+            return None
+        logger.info("Skipping '%s': already downloaded (download archive)", title)
+        return DownloadOutcome(success=True, skipped=True)
+
+    def _download(self, video_id: str, url: str, title: str, save_path: str, progress_hook,
+                  format_profile: str = DEFAULT_PROFILE,
+                  cancel_token: "CancelToken | None" = None) -> DownloadOutcome:
+        """Download one video and record it in the archive on success.
+
+        On cancellation the partial files are removed before :class:`Cancelled`
+        propagates.
+        """
+        try:
+            outcome = self.downloader.download(url, title, save_path, progress_hook, format_profile,
+                                               cancel_token)
+        except Cancelled:
+            logger.info("Download of '%s' cancelled", title)
+            remove_partial_downloads(save_path, title)
+            raise
+        if outcome and self.archive is not None:
+            self.archive.add(video_id, _output_file(save_path, title, format_profile), format_profile)
+        return outcome
+
+    def _preflight(self, sizes: dict, save_path: str, format_profile: str,
+                   parallel: int = 1, split_chapters: bool = False):
+        """Check ``sizes`` (key -> expected bytes) against free space per the settings."""
+        settings = get_settings()
+        return plan_downloads(
+            sizes, save_path, format_profile,
+            mode=settings.disk_space_check, parallel=parallel, split_chapters=split_chapters,
+            reserve=int(settings.disk_space_reserve_mb * 1_000_000),
+        )
+
+    @staticmethod
+    def _pending_size(video: VideoInfo, title: str, save_path: str, format_profile: str,
+                      bytes_per_second: "float | None" = None) -> int:
+        """Expected bytes still to download (0 when the file is already there)."""
+        if os.path.exists(_output_file(save_path, title, format_profile)):
+            return 0
+        return estimate_video_size(video, format_profile, bytes_per_second)
+
+    def _download_subtitles(self, video_id: str, title: str, save_path: str, language: str,
+                            outcome: DownloadOutcome) -> str:
+        """Fetch subtitles, unless a skipped (archived) video already has them."""
+        subtitle_file = os.path.join(save_path, f"{title}.srt")
+        if outcome.skipped and os.path.exists(subtitle_file):
+            return subtitle_file
+        return self.subtitle_service.download(video_id, title, save_path, language)
 
     def download_video(
         self,
         info: VideoInfo,
         options: VideoDownloadOptions,
         progress_hook=None,
+        cancel_token: "CancelToken | None" = None,
     ) -> VideoDownloadResult:
         """Download one video, optionally with subtitles and chapter splitting.
 
         When ``options.split_chapters`` is set, the video is wrapped in a folder
         named after its title, a ``Link.txt`` is written, and (if the video has
         chapters) the video and subtitles are split into a ``Chapters`` subfolder.
+        Cancelling ``cancel_token`` raises
+        :class:`~youtube_downloader.cancellation.Cancelled` at the next check.
         """
         logger.info(
-            "Video workflow start: '%s' (subs=%s, split_chapters=%s) -> %s",
-            info.title, options.subtitle_language, options.split_chapters, options.save_path,
+            "Video workflow start: '%s' (profile=%s, ~%d MB, subs=%s, split_chapters=%s) -> %s",
+            info.title, options.format_profile,
+            estimate_video_size(info, options.format_profile) // 1_000_000,
+            options.subtitle_language, options.split_chapters, options.save_path,
         )
         save_path = options.save_path
         if options.split_chapters:
             save_path = os.path.join(save_path, info.title)
             ensure_dir(save_path)
 
-        self.downloader.download(info.url, info.title, save_path, progress_hook)
+        outcome = self._archived(info.id, info.title, save_path, options.format_profile)
+        if outcome is None:
+            self._preflight(
+                {info.id: self._pending_size(info, info.title, save_path, options.format_profile)},
+                save_path, options.format_profile,
+                split_chapters=options.split_chapters and bool(info.chapters),
+            )
+            outcome = self._download(info.id, info.url, info.title, save_path, progress_hook,
+                                     options.format_profile, cancel_token)
 
+        raise_if_cancelled(cancel_token)
         subtitle_file = ""
         if options.subtitle_language:
-            subtitle_file = self.subtitle_service.download(
-                info.id, info.title, save_path, options.subtitle_language
+            subtitle_file = self._download_subtitles(
+                info.id, info.title, save_path, options.subtitle_language, outcome
             )
 
         chapters_split = False
@@ -76,11 +251,12 @@ class DownloadWorkflows:
                 info.description,
             ]
             create_text_file(text_file, save_path)
-            video_path = os.path.join(save_path, f"{info.title}.mp4")
+            video_path = _output_file(save_path, info.title, options.format_profile)
             if info.chapters:
                 chapters_folder_path = os.path.join(save_path, 'Chapters')
                 ensure_dir(chapters_folder_path)
-                self.chapter_splitter.split_video(video_path, info.chapters, chapters_folder_path)
+                self.chapter_splitter.split_video(video_path, info.chapters, chapters_folder_path,
+                                                  cancel_token)
                 if len(subtitle_file) > 0:
                     self.chapter_splitter.split_subtitles(subtitle_file, info.chapters, chapters_folder_path)
                 chapters_split = True
@@ -91,6 +267,8 @@ class DownloadWorkflows:
             output_path=save_path,
             subtitle_file=subtitle_file,
             chapters_split=chapters_split,
+            success=outcome.success,
+            error=outcome.error,
         )
 
     def download_playlist(
@@ -100,6 +278,7 @@ class DownloadWorkflows:
         on_video=None,
         on_video_result=None,
         progress_hook=None,
+        cancel_token: "CancelToken | None" = None,
     ) -> PlaylistDownloadResult:
         """Download every video in a playlist into a folder named after it.
 
@@ -107,56 +286,461 @@ class DownloadWorkflows:
         ``on_video_result(index, total, video, title, save_path, outcome)`` is
         called after each, so a front-end can show per-video success/failure (with
         the reason in ``outcome.error``) and offer a retry. Failed videos are also
-        collected and returned; re-running skips already-downloaded files.
+        collected and returned; re-running skips the videos the download archive
+        lists without extracting them again. The playlist's entries, except the
+        failed videos, seed the sync snapshot (see :meth:`sync_playlist`). Cancelling ``cancel_token`` stops
+        the run between videos (and aborts the ones in flight) by raising
+        :class:`~youtube_downloader.cancellation.Cancelled`.
         """
         selected = options.selected_indices
         logger.info(
-            "Playlist workflow start: '%s' (%d videos, %s selected, subs=%s, numerate=%s)",
+            "Playlist workflow start: '%s' (%d videos, %s selected, profile=%s, subs=%s, numerate=%s)",
             info.title, info.number_videos,
             "all" if selected is None else len(selected),
-            options.subtitle_language, options.numerate,
+            options.format_profile, options.subtitle_language, options.numerate,
         )
         save_path = os.path.join(options.save_path, info.title)
         ensure_dir(save_path)
+        snapshot = load_snapshot(save_path)
+        width = _counter_width(info, snapshot)
 
-        text_file = ["Playlist Url: \n", info.url, "\n\n\n\n\n\n\n\n\n\n", "Videos Information: \n\n\n\n"]
-        failed_videos = []
-        for index, video in enumerate(info.videos_info):
+        indices = []
+        for index in range(info.number_videos):
             if selected is not None and (index + 1) not in selected:
                 logger.info("Skipping playlist video %d/%d (not selected)", index + 1, info.number_videos)
                 continue
-            if options.numerate:
-                video_title = f"{format_counter(index + 1, info.number_videos)}{video.title}"
-            else:
-                video_title = video.title
+            indices.append(index)
+        indices, rejected = self._plan_playlist(info, indices, save_path, options, on_video_result,
+                                                width)
+        runs = sorted(rejected + self._download_videos(info, indices, save_path, options,
+                                                       on_video, on_video_result, progress_hook,
+                                                       cancel_token, width))
 
-            text_file.append(f"Video #{index+1}\n")
-            text_file.append("====================================\n")
-            text_file.append(f"Title: {video_title}\n")
-            text_file.append(f"Description: {video.description} \n")
-            text_file.append("====================================\n\n\n\n\n\n\n")
+        # Archived videos of a lazy playlist are skipped unresolved, without a
+        # description; keep the one the snapshot recorded for them.
+        descriptions = dict((snapshot or {}).get('descriptions', {}))
+        text_file = _playlist_link_header(info)
+        failed_videos = []
+        failed_ids = set()
+        for index, video_title, video, outcome in runs:
+            if video.resolved:
+                descriptions[video.id] = video.description
+            description = descriptions.get(video.id, video.description)
+            text_file.extend(_link_entry(index + 1, video_title, description))
+            if not outcome:
+                failed_ids.add(video.id)
+                failed_videos.append(_failure_line(index, video_title, outcome))
 
-            if on_video is not None:
-                on_video(index + 1, info.number_videos, video_title)
+        create_text_file(text_file, save_path)
+        # Seed the sync snapshot from the whole listing, so a later sync only
+        # fetches videos added since; unselected videos count as seen, failed
+        # ones stay out and are retried.
+        known_ids = list((snapshot or {}).get('entries', []))
+        known = set(known_ids)
+        save_snapshot(save_path, info.id, info.url,
+                      known_ids + [video.id for video in info.videos_info
+                                   if video.id not in known and video.id not in failed_ids],
+                      counter_width=width, descriptions=descriptions)
+        logger.info("Playlist workflow done: '%s' -> %s (%d failed)",
+                    info.title, save_path, len(failed_videos))
+        return PlaylistDownloadResult(output_path=save_path, failed_videos=failed_videos)
 
-            logger.info("Playlist video %d/%d: %s", index + 1, info.number_videos, video_title)
-            outcome = self.downloader.download(video.url, video_title, save_path, progress_hook)
+    def sync_playlist(
+        self,
+        info: PlaylistInfo,
+        options: PlaylistDownloadOptions,
+        on_video=None,
+        on_video_result=None,
+        progress_hook=None,
+        cancel_token: "CancelToken | None" = None,
+    ) -> PlaylistDownloadResult:
+        """Download only the videos added to the playlist since the last sync.
+
+        The playlist folder keeps a snapshot of the entry ids already downloaded
+        (see :mod:`youtube_downloader.playlist_sync`). Entries missing from it are
+        resolved (``info`` may be lazy), downloaded and appended to ``Link.txt``
+        under their current playlist position; the rest are never touched, so a
+        no-change sync costs a single playlist listing. Failed videos stay out of
+        the snapshot and are retried by the next sync. Numbered titles keep the
+        zero-padding of the first run. ``selected_indices`` is ignored. Callbacks and ``cancel_token`` match :meth:`download_playlist`.
+        """
+        save_path = os.path.join(options.save_path, info.title)
+        ensure_dir(save_path)
+        snapshot = load_snapshot(save_path)
+        known_ids = list((snapshot or {}).get('entries', []))
+        known = set(known_ids)
+        width = _counter_width(info, snapshot)
+        new_indices = [i for i, video in enumerate(info.videos_info) if video.id not in known]
+        logger.info("Playlist sync: '%s' (%d videos, %d new since last sync) -> %s",
+                    info.title, info.number_videos, len(new_indices), save_path)
+
+        new_indices, rejected = self._plan_playlist(info, new_indices, save_path, options,
+                                                    on_video_result, width)
+        runs = sorted(rejected + self._download_videos(info, new_indices, save_path, options,
+                                                       on_video, on_video_result, progress_hook,
+                                                       cancel_token, width))
+
+        text_file = [] if snapshot is not None else _playlist_link_header(info)
+        descriptions = dict((snapshot or {}).get('descriptions', {}))
+        failed_videos = []
+        new_videos = []
+        for index, video_title, video, outcome in runs:
             if outcome:
-                if options.subtitle_language:
-                    self.subtitle_service.download(
-                        video.id, video_title, save_path, options.subtitle_language
-                    )
+                if video.resolved:
+                    descriptions[video.id] = video.description
+                text_file.extend(_link_entry(index + 1, video_title,
+                                             descriptions.get(video.id, video.description)))
+                known_ids.append(video.id)
+                new_videos.append(video_title)
+            else:
+                failed_videos.append(_failure_line(index, video_title, outcome))
+
+        if text_file:
+            create_text_file(text_file, save_path, append=snapshot is not None)
+        save_snapshot(save_path, info.id, info.url, known_ids, counter_width=width,
+                      descriptions=descriptions)
+        logger.info("Playlist sync done: '%s' (%d new, %d failed)",
+                    info.title, len(new_videos), len(failed_videos))
+        return PlaylistDownloadResult(
+            output_path=save_path, failed_videos=failed_videos, new_videos=new_videos,
+        )
+
+    def download_batch(
+        self,
+        urls: "list[str]",
+        options: BatchDownloadOptions,
+        on_item=None,
+        on_item_result=None,
+        on_video=None,
+        on_video_result=None,
+        progress_hook=None,
+        cancel_token: "CancelToken | None" = None,
+    ) -> BatchDownloadResult:
+        """Download a list of video and playlist URLs with shared options.
+
+        URLs naming the same video or playlist as an earlier one are dropped
+        (see :func:`_batch_key`); the rest are downloaded in request order, each
+        resolved just before its download (see :meth:`_resolve_batch_item`). Runs
+        of consecutive videos download ``options.parallel_downloads`` at a time;
+        a playlist gets the same number of workers for its own videos, so the
+        batch never has more downloads in flight. Each item goes through
+        :meth:`download_video` / :meth:`download_playlist`, including their
+        disk-space preflight, and a failing item does not stop the batch.
+
+        ``on_item(index, total, item, stage)`` is called when an item is
+        ``"resolved"`` and when its download is ``"started"``;
+        ``on_item_result(index, total, item)`` once per item when it has its
+        final outcome (straight after resolving, if that failed). Callbacks for
+        runs of videos come from the download workers. ``on_video``
+        and ``on_video_result`` are the :meth:`download_playlist` callbacks with
+        the batch item's index prepended, and progress dicts carry it as
+        ``batch_item``. Cancelling ``cancel_token`` stops the batch by raising
+        :class:`~youtube_downloader.cancellation.Cancelled`.
+        """
+        if self.info_provider is None:
+            raise RuntimeError("Batch downloads need an info provider")
+        items = []
+        first = {}
+        for index, url in enumerate(urls, 1):
+            kind, key = _batch_key(url)
+            item = BatchItem(index=index, url=url.strip(), kind=kind)
+            original = first.setdefault((kind, key), item)
+            if original is not item:
+                item.duplicate_of = original.index
+            items.append(item)
+        unique = [item for item in items if item.duplicate_of is None]
+        total = len(items)
+        logger.info("Batch workflow start: %d URLs (%d unique, profile=%s, subs=%s) -> %s",
+                    total, len(unique), options.format_profile, options.subtitle_language,
+                    options.save_path)
+
+        def report(item: BatchItem) -> None:
+            if on_item_result is not None:
+                on_item_result(item.index, total, item)
+
+        workers = max(1, options.parallel_downloads or get_settings().playlist_download_workers)
+        for kind, group in itertools.groupby(unique, key=lambda item: item.kind):
+            group = list(group)
+            if kind == 'playlist':
+                for item in group:
+                    info = self._resolve_batch_item(item, total, on_item, cancel_token)
+                    if info is not None:
+                        self._download_batch_playlist(item, info, options, workers, total, on_item,
+                                                      on_video, on_video_result, progress_hook,
+                                                      cancel_token)
+                    report(item)
+                continue
+
+            def run(item: BatchItem) -> None:
+                info = self._resolve_batch_item(item, total, on_item, cancel_token)
+                if info is not None:
+                    self._download_batch_video(item, info, options, total, on_item,
+                                               progress_hook, cancel_token)
+                report(item)
+
+            if workers == 1 or len(group) == 1:
+                for item in group:
+                    run(item)
+                continue
+            with ThreadPoolExecutor(max_workers=min(workers, len(group)),
+                                    thread_name_prefix='batch-dl') as pool:
+                for future in [pool.submit(run, item) for item in group]:
+                    future.result()
+
+        for item in items:
+            if item.duplicate_of is not None:
+                original = items[item.duplicate_of - 1]
+                item.title, item.success, item.error = original.title, original.success, original.error
+                item.output_path, item.failed_videos = original.output_path, original.failed_videos
+                report(item)
+        result = BatchDownloadResult(items=items)
+        logger.info("Batch workflow done: %d succeeded, %d failed",
+                    len(result.succeeded), len(result.failed))
+        return result
+
+    def _resolve_batch_item(self, item: BatchItem, total: int, on_item=None,
+                            cancel_token: "CancelToken | None" = None):
+        """Fetch a batch item's info right before it downloads; ``None`` if unavailable.
+
+        Playlists are always listed lazily: :meth:`download_playlist` then
+        resolves each video just before downloading it, on its own workers, so
+        no second pool of info workers runs inside the batch's.
+        """
+        raise_if_cancelled(cancel_token)
+        try:
+            if item.kind == 'playlist':
+                info = self.info_provider.get_playlist_info(item.url, lazy=True)
             else:
-                reason = getattr(outcome, 'error', '')
-                failed_videos.append(f"#{index+1} - {video_title}" + (f": {reason}" if reason else ""))
+                info = self.info_provider.get_video_info(item.url, for_download=True)
+        except Cancelled:
+            raise
+        except Exception as e:  # noqa: BLE001 - an unavailable URL must not abort the batch
+            logger.warning("Could not resolve batch item %d (%s): %s", item.index, item.url, e)
+            item.error = str(e)
+            return None
+        item.title = info.title
+        if on_item is not None:
+            on_item(item.index, total, item, 'resolved')
+        return info
+
+    def _download_batch_video(self, item: BatchItem, info: VideoInfo, options: BatchDownloadOptions,
+                              total: int, on_item=None, progress_hook=None,
+                              cancel_token: "CancelToken | None" = None) -> None:
+        """Download one video item of a batch, recording the outcome on ``item``."""
+        raise_if_cancelled(cancel_token)
+        if on_item is not None:
+            on_item(item.index, total, item, 'started')
+        video_options = VideoDownloadOptions(
+            save_path=options.save_path,
+            subtitle_language=options.subtitle_language,
+            split_chapters=options.split_chapters,
+            format_profile=options.format_profile,
+        )
+        try:
+            result = self.download_video(info, video_options, _tagged_hook(progress_hook, item.index),
+                                         cancel_token)
+        except Cancelled:
+            raise
+        except Exception as e:  # noqa: BLE001 - one failing item must not abort the batch
+            logger.warning("Batch item %d ('%s') failed: %s", item.index, item.title, e)
+            item.error = str(e)
+            return
+        item.success, item.error, item.output_path = result.success, result.error, result.output_path
+
+    def _download_batch_playlist(self, item: BatchItem, info: PlaylistInfo,
+                                 options: BatchDownloadOptions, workers: int, total: int,
+                                 on_item=None, on_video=None, on_video_result=None,
+                                 progress_hook=None,
+                                 cancel_token: "CancelToken | None" = None) -> None:
+        """Download one playlist item of a batch, recording the outcome on ``item``."""
+        raise_if_cancelled(cancel_token)
+        if on_item is not None:
+            on_item(item.index, total, item, 'started')
+        playlist_options = PlaylistDownloadOptions(
+            save_path=options.save_path,
+            subtitle_language=options.subtitle_language,
+            numerate=options.numerate,
+            parallel_downloads=workers,
+            format_profile=options.format_profile,
+        )
+        try:
+            result = self.download_playlist(
+                info, playlist_options,
+                on_video=None if on_video is None else (lambda *args: on_video(item.index, *args)),
+                on_video_result=(None if on_video_result is None
+                                 else (lambda *args: on_video_result(item.index, *args))),
+                progress_hook=_tagged_hook(progress_hook, item.index),
+                cancel_token=cancel_token,
+            )
+        except Cancelled:
+            raise
+        except Exception as e:  # noqa: BLE001 - one failing item must not abort the batch
+            logger.warning("Batch item %d ('%s') failed: %s", item.index, item.title, e)
+            item.error = str(e)
+            return
+        item.output_path, item.failed_videos = result.output_path, result.failed_videos
+        item.success = not result.failed_videos
+        if result.failed_videos:
+            item.error = f"{len(result.failed_videos)} of {info.number_videos} videos failed"
 
+    def _workers(self, options: PlaylistDownloadOptions, count: int) -> int:
+        """How many of ``count`` playlist videos download at once."""
+        workers = options.parallel_downloads or get_settings().playlist_download_workers
+        return max(1, min(workers, count or 1))
+
+    def _plan_playlist(
+        self,
+        info: PlaylistInfo,
+        indices: "list[int]",
+        save_path: str,
+        options: PlaylistDownloadOptions,
+        on_video_result=None,
+        width: "int | None" = None,
+    ) -> "tuple[list[int], list[tuple[int, str, VideoInfo, DownloadOutcome]]]":
+        """Disk-space preflight for the playlist videos at 0-based ``indices``.
+
+        Returns the indices to download and a failed run per video left out
+        (``fit`` mode), already reported through ``on_video_result``. Raises
+        :class:`~youtube_downloader.disk_space.InsufficientDiskSpace` when the run
+        is refused. ``width`` is as for :func:`_playlist_video_title`.
+        """
+        titles = {index: _playlist_video_title(info, index, options.numerate, width) for index in indices}
+        # Unresolved (lazy) videos are sized at the rate of the resolved ones.
+        rate = observed_bytes_per_second(info.videos_info, options.format_profile)
+        plan = self._preflight(
+            {index: self._pending_size(info.videos_info[index], titles[index], save_path,
+                                       options.format_profile, rate)
+             for index in indices},
+            save_path, options.format_profile, parallel=self._workers(options, len(indices)),
+        )
+        rejected = []
+        for index in plan.rejected:
+            run = (index, titles[index], info.videos_info[index],
+                   DownloadOutcome(success=False, error="Not enough disk space"))
             if on_video_result is not None:
-                on_video_result(index + 1, info.number_videos, video, video_title, save_path, outcome)
+                on_video_result(index + 1, info.number_videos, run[2], run[1], save_path, run[3])
+            rejected.append(run)
+        return plan.accepted, rejected
 
-        create_text_file(text_file, save_path)
-        logger.info("Playlist workflow done: '%s' -> %s (%d failed)",
-                    info.title, save_path, len(failed_videos))
-        return PlaylistDownloadResult(output_path=save_path, failed_videos=failed_videos)
+    def _download_videos(
+        self,
+        info: PlaylistInfo,
+        indices: "list[int]",
+        save_path: str,
+        options: PlaylistDownloadOptions,
+        on_video=None,
+        on_video_result=None,
+        progress_hook=None,
+        cancel_token: "CancelToken | None" = None,
+        width: "int | None" = None,
+    ) -> "list[tuple[int, str, VideoInfo, DownloadOutcome]]":
+        """Download the playlist videos at 0-based ``indices``, possibly in parallel.
+
+        Returns ``(index, title, video, outcome)`` per video in playlist order,
+        whatever order the downloads finished in. With more than one worker
+        (``options.parallel_downloads``, else ``settings.playlist_download_workers``)
+        ``on_video`` fires as each download actually starts — still in playlist
+        order, since workers take videos in order and start them one at a time —
+        and ``on_video_result`` fires in playlist order when
+        ``options.ordered_callbacks`` is set (the default), otherwise as soon as
+        each video finishes. ``cancel_token`` is checked before each video starts.
+        ``width`` is as for :func:`_playlist_video_title`.
+        """
+        total = info.number_videos
+        workers = self._workers(options, len(indices))
+        titles = {index: _playlist_video_title(info, index, options.numerate, width) for index in indices}
+
+        def hook_for(index: int):
+            # Tag progress with the playlist position so a front-end can tell
+            # concurrent downloads apart.
+            if progress_hook is None or workers == 1:
+                return progress_hook
+            return lambda d: progress_hook({**d, 'playlist_index': index + 1})
+
+        def report(run) -> None:
+            if on_video_result is not None:
+                index, video_title, video, outcome = run
+                on_video_result(index + 1, total, video, video_title, save_path, outcome)
+
+        if workers == 1:
+            runs = []
+            for index in indices:
+                raise_if_cancelled(cancel_token)
+                if on_video is not None:
+                    on_video(index + 1, total, titles[index])
+                logger.info("Playlist video %d/%d: %s", index + 1, total, titles[index])
+                run = (index, titles[index], *self._download_playlist_video(
+                    info.videos_info[index], titles[index], save_path, options, progress_hook,
+                    cancel_token,
+                ))
+                report(run)
+                runs.append(run)
+            return runs
+
+        logger.info("Downloading %d playlist videos with %d parallel workers", len(indices), workers)
+        # Turnstile: the worker for the n-th queued video announces its start
+        # only after the (n-1)-th has, so on_video stays in playlist order.
+        turn = threading.Condition()
+        next_start = [0]
+
+        def work(order: int, index: int):
+            with turn:
+                turn.wait_for(lambda: next_start[0] == order)
+                try:
+                    raise_if_cancelled(cancel_token)
+                    if on_video is not None:
+                        on_video(index + 1, total, titles[index])
+                    logger.info("Playlist video %d/%d: %s", index + 1, total, titles[index])
+                finally:
+                    next_start[0] += 1
+                    turn.notify_all()
+            return (index, titles[index], *self._download_playlist_video(
+                info.videos_info[index], titles[index], save_path, options, hook_for(index),
+                cancel_token,
+            ))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='playlist-dl') as pool:
+            futures = [pool.submit(work, order, index) for order, index in enumerate(indices)]
+            if options.ordered_callbacks:
+                runs = []
+                for future in futures:
+                    runs.append(future.result())
+                    report(runs[-1])
+            else:
+                for future in as_completed(futures):
+                    report(future.result())
+                runs = [future.result() for future in futures]
+        return runs
+
+    def _download_playlist_video(
+        self,
+        video: VideoInfo,
+        video_title: str,
+        save_path: str,
+        options: PlaylistDownloadOptions,
+        progress_hook=None,
+        cancel_token: "CancelToken | None" = None,
+    ) -> "tuple[VideoInfo, DownloadOutcome]":
+        """Resolve (if lazy), download and fetch subtitles for one playlist video.
+
+        Returns the (possibly newly resolved) video and the download outcome; a
+        video that can't be resolved is reported as a failed outcome. Videos in
+        the download archive are skipped before resolving, so they cost no
+        extraction at all.
+        """
+        outcome = self._archived(video.id, video_title, save_path, options.format_profile)
+        if outcome is None:
+            try:
+                video = self._resolve(video)
+            except Exception as e:  # noqa: BLE001 - an unavailable video must not abort the playlist
+                logger.warning("Could not resolve playlist video '%s': %s", video_title, e)
+                return video, DownloadOutcome(success=False, error=str(e))
+            outcome = self._download(video.id, video.url, video_title, save_path, progress_hook,
+                                     options.format_profile, cancel_token)
+
+        if outcome and options.subtitle_language:
+            self._download_subtitles(video.id, video_title, save_path, options.subtitle_language, outcome)
+        return video, outcome
 
     def retry_video(
         self,
@@ -166,13 +750,16 @@ class DownloadWorkflows:
         save_path: str,
         subtitle_language: "str | None" = None,
         progress_hook=None,
+        format_profile: str = DEFAULT_PROFILE,
+        cancel_token: "CancelToken | None" = None,
     ):
         """Re-download a single (already-named) playlist video into ``save_path``.
 
         Used by the GUI's per-video retry. Returns the :class:`DownloadOutcome`.
         """
-        logger.info("Retrying video '%s' -> %s", title, save_path)
-        outcome = self.downloader.download(url, title, save_path, progress_hook)
+        logger.info("Retrying video '%s' (profile=%s) -> %s", title, format_profile, save_path)
+        outcome = self._download(video_id, url, title, save_path, progress_hook, format_profile,
+                                 cancel_token)
         if outcome and subtitle_language:
             self.subtitle_service.download(video_id, title, save_path, subtitle_language)
         return outcome
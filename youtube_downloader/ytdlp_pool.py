@@ -0,0 +1,140 @@
+"""A small pool of long-lived, option-keyed ``yt_dlp.YoutubeDL`` instances.
+
+Building a ``YoutubeDL`` registers every extractor, loads the cookie jar and sets
+up the HTTP handlers — work that used to be repeated for every info fetch and
+every download attempt. :class:`YoutubeDLPool` keeps finished instances around,
+keyed by their options, and hands them out again to the next caller that asks
+for the same options.
+
+A ``YoutubeDL`` is not thread-safe, so an instance is checked out by exactly one
+caller at a time. The two things that change per call — the output template and
+the progress hook — are applied on checkout instead of being part of the key.
+An instance whose call raised is discarded rather than returned to the pool, so a
+half-failed download never leaks state into the next one.
+"""
+
+import json
+import logging
+import threading
+from contextlib import contextmanager
+
+import yt_dlp
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledInstance:
+    """A ``YoutubeDL`` plus the per-checkout progress hook it forwards to."""
+
+    def __init__(self, options: dict, factory) -> None:
+        self.hook = None
+        self.ydl = factory({**options, 'progress_hooks': [self._dispatch]})
+        outtmpl = self.ydl.params.setdefault('outtmpl', {})
+        self.default_outtmpl = outtmpl.get('default') if isinstance(outtmpl, dict) else outtmpl
+
+    def _dispatch(self, d: dict) -> None:
+        if self.hook is not None:
+            self.hook(d)
+
+    def checkout(self, outtmpl: "str | None", progress_hook) -> None:
+        self.hook = progress_hook
+        if outtmpl is not None:
+            self.ydl.params['outtmpl']['default'] = outtmpl
+
+    def reset(self) -> None:
+        self.hook = None
+        if self.default_outtmpl is not None:
+            self.ydl.params['outtmpl']['default'] = self.default_outtmpl
+
+
+def _options_key(options: dict) -> str:
+    """Stable, hashable key for an options dict (callables compare by repr)."""
+    return json.dumps(options, sort_keys=True, default=repr)
+
+
+class YoutubeDLPool:
+    """Reuses ``YoutubeDL`` instances across calls that share the same options.
+
+    ``max_idle`` caps how many idle instances are kept per option set; extra
+    instances (e.g. from a burst of parallel playlist workers) are closed on
+    release.
+    """
+
+    def __init__(self, max_idle: int = 16, factory=yt_dlp.YoutubeDL) -> None:
+        self.max_idle = max_idle
+        self.factory = factory
+        self._idle: "dict[str, list[_PooledInstance]]" = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self, options: dict, outtmpl: "str | None" = None, progress_hook=None):
+        """Check out a ``YoutubeDL`` built with ``options`` for the ``with`` block.
+
+        ``outtmpl`` and ``progress_hook`` apply to this checkout only and must
+        not be included in ``options``.
+        """
+        key = _options_key(options)
+        with self._lock:
+            idle = self._idle.get(key)
+            instance = idle.pop() if idle else None
+        if instance is None:
+            instance = _PooledInstance(options, self.factory)
+
+        instance.checkout(outtmpl, progress_hook)
+        try:
+            yield instance.ydl
+        except BaseException:
+            self._close(instance)
+            raise
+        instance.reset()
+        self._release(key, instance)
+
+    def _release(self, key: str, instance: _PooledInstance) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(instance)
+                return
+        self._close(instance)
+
+    @staticmethod
+    def _close(instance: _PooledInstance) -> None:
+        try:
+            instance.ydl.close()
+        except Exception as e:  # noqa: BLE001 - closing is best-effort
+            logger.debug("Error closing pooled YoutubeDL: %s", e)
+
+    def warm(self, *option_sets: dict) -> threading.Thread:
+        """Build one idle instance per option set on a background thread.
+
+        Returns the (daemon) thread so callers that care can ``join`` it.
+        """
+        def _warm() -> None:
+            for options in option_sets:
+                key = _options_key(options)
+                with self._lock:
+                    if self._idle.get(key):
+                        continue
+                try:
+                    instance = _PooledInstance(options, self.factory)
+                except Exception as e:  # noqa: BLE001 - warming is an optimization only
+                    logger.warning("Could not pre-warm YoutubeDL: %s", e)
+                    continue
+                self._release(key, instance)
+            logger.info("Pre-warmed %d YoutubeDL option set(s)", len(option_sets))
+
+        thread = threading.Thread(target=_warm, name='ydl-prewarm', daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        """Close every idle instance (call on shutdown)."""
+        with self._lock:
+            instances = [i for idle in self._idle.values() for i in idle]
+            self._idle.clear()
+        for instance in instances:
+            self._close(instance)
+
+
+# Shared by the info provider and the downloader unless one is injected.
+default_pool = YoutubeDLPool()
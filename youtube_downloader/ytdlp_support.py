@@ -5,15 +5,24 @@ downloader in one place.
 """
 
 import logging
-import shutil
 
-from .metadata import get_metadata
+from .settings import get_settings
 
 logger = logging.getLogger(__name__)
 
-# Runtimes yt-dlp can use to solve YouTube's signature ("nsig") challenge,
-# in order of preference (deno is yt-dlp's default/recommended runtime).
-_JS_RUNTIMES = ('deno', 'node', 'bun')
+# YouTube player clients formats are sourced from. Several clients let a
+# throttled / HTTP-403 client (e.g. android_vr) fall back to a working one.
+PLAYER_CLIENTS = ('default', 'tv', 'web_safari')
+
+
+def player_client_opts(clients: "tuple[str, ...]" = PLAYER_CLIENTS) -> dict:
+    """yt-dlp options selecting the YouTube player clients to extract formats from.
+
+    The info provider uses the downloader's clients for extractions that feed a
+    download (``for_download=True``), so the stored info dict can be downloaded
+    as-is; display-only extractions keep yt-dlp's default client.
+    """
+    return {'extractor_args': {'youtube': {'player_client': list(clients)}}}
 
 
 def js_runtime_opts() -> dict:
@@ -25,17 +34,13 @@ def js_runtime_opts() -> dict:
     GitHub), which unlocks all formats and silences the "No supported JavaScript
     runtime" warning. Returns ``{}`` (no change) when the setting is off or no
     runtime is installed — downloads still work via H.264 formats that don't
-    need nsig.
+    need nsig. The runtime lookup is memoised on the settings snapshot, so this
+    is cheap enough to call per video.
     """
-    settings = get_metadata().get('settings', {}) or {}
-    if not settings.get('use_js_runtime'):
+    runtime = get_settings().js_runtime
+    if runtime is None:
         return {}
-    for runtime in _JS_RUNTIMES:
-        if shutil.which(runtime):
-            logger.info("JS runtime enabled for nsig solving: %s", runtime)
-            return {
-                'js_runtimes': {runtime: {}},
-                'remote_components': ['ejs:github'],
-            }
-    logger.warning("use_js_runtime is on but no JS runtime (deno/node/bun) found on PATH")
-    return {}
+    return {
+        'js_runtimes': {runtime: {}},
+        'remote_components': ['ejs:github'],
+    }